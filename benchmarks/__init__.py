@@ -0,0 +1,3 @@
+'''
+Benchmarks for the dunder decorators. See __main__.py for usage.
+'''
@@ -0,0 +1,137 @@
+'''
+Command line interface of the benchmark suite.
+
+	python -m benchmarks run -o results.json
+	python -m benchmarks run getitem setitem.slots
+	python -m benchmarks compare old.json new.json
+	python -m benchmarks contention -o contention.json
+	python -m benchmarks importtime
+	python -m benchmarks list
+'''
+
+import argparse
+import sys
+from typing import Optional, List
+from . import contention, importtime
+from .cases import CASES
+from .runner import run, compare, format_results, format_diff, \
+	load, dump
+
+
+def main(
+		argv: Optional[List[str]] = None,
+) -> int:
+	parser = argparse.ArgumentParser(
+		prog='python -m benchmarks',
+		description=(
+			'Measures the overhead of dunder decorators against '
+			+ 'hand-written special methods.'
+		),
+	)
+	commands = parser.add_subparsers(dest='command', required=True)
+	run_parser = commands.add_parser(
+		'run',
+		help='run benchmark cases'
+	)
+	run_parser.add_argument(
+		'cases',
+		nargs='*',
+		help='case name prefixes to run, defaults to all cases'
+	)
+	run_parser.add_argument(
+		'-o',
+		'--output',
+		help='write results to this JSON file'
+	)
+	run_parser.add_argument(
+		'-r',
+		'--repeat',
+		type=int,
+		default=5,
+		help='number of timing repeats, the best is kept'
+	)
+	run_parser.add_argument(
+		'-t',
+		'--min-time',
+		type=float,
+		default=0.05,
+		help='minimum duration of each timing repeat in seconds'
+	)
+	compare_parser = commands.add_parser(
+		'compare',
+		help='diff two result files'
+	)
+	compare_parser.add_argument('old')
+	compare_parser.add_argument('new')
+	contention_parser = commands.add_parser(
+		'contention',
+		help='run the threadsafe contention benchmark'
+	)
+	contention_parser.add_argument(
+		'-n',
+		'--threads',
+		type=int,
+		nargs='+',
+		default=[1, 2, 4, 8],
+		help='numbers of worker threads to run'
+	)
+	contention_parser.add_argument(
+		'--ops',
+		type=int,
+		default=20000,
+		help='operations per worker thread'
+	)
+	contention_parser.add_argument(
+		'-o',
+		'--output',
+		help='write results to this JSON file'
+	)
+	importtime_parser = commands.add_parser(
+		'importtime',
+		help='time importing the package and decorating classes'
+	)
+	importtime_parser.add_argument(
+		'-r',
+		'--repeat',
+		type=int,
+		default=5,
+		help='number of fresh interpreters per case, the best is kept'
+	)
+	importtime_parser.add_argument(
+		'-n',
+		'--classes',
+		type=int,
+		default=200,
+		help='number of classes to decorate'
+	)
+	importtime_parser.add_argument(
+		'-o',
+		'--output',
+		help='write results to this JSON file'
+	)
+	commands.add_parser('list', help='list benchmark cases')
+	args = parser.parse_args(argv)
+
+	if args.command == 'run':
+		results = run(args.cases, args.repeat, args.min_time)
+		print(format_results(results))
+		if args.output:
+			dump(results, args.output)
+	elif args.command == 'contention':
+		results = contention.run(args.threads, args.ops)
+		print(contention.format_results(results))
+		if args.output:
+			dump({'results' : results}, args.output)
+	elif args.command == 'importtime':
+		results = importtime.run(args.repeat, args.classes)
+		print(importtime.format_results(results))
+		if args.output:
+			dump({'results' : results}, args.output)
+	elif args.command == 'compare':
+		print(format_diff(compare(load(args.old), load(args.new))))
+	else:
+		print('\n'.join(CASES))
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
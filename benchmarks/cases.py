@@ -0,0 +1,438 @@
+'''
+Benchmark cases comparing each dunder decorator against
+an equivalent hand-written special method. Both classes of
+a case share the same base class, so the only difference
+between them is how the special method was defined.
+'''
+
+from collections import deque
+from typing import Callable, Dict, Tuple, Any
+from dunderdecorators import dunder_iter, dunder_setitem, \
+	dunder_getitem, dunder_missing, dunder_repr, dunder_order, \
+	SparseSequence
+
+CASES = {}
+
+
+class Case(object):
+
+	def __init__(
+			self,
+			name: str,
+			stmt: str,
+			setup: Callable[[], Tuple[Any, Any]],
+	) -> None:
+		self.name = name
+		self.stmt = stmt
+		self.setup = setup
+
+
+def case(
+		name: str,
+		stmt: str,
+) -> Callable:
+	"""
+	Registers a benchmark case. The decorated function returns
+	a (decorated object, hand-written object) pair and stmt
+	is timed against both, with the object bound to obj.
+	"""
+	def wrap(
+			setup: Callable[[], Tuple[Any, Any]],
+	) -> Callable:
+		CASES[name] = Case(name, stmt, setup)
+		return setup
+	return wrap
+
+def build(
+		base: type,
+		decorator: Callable,
+		methods: Dict[str, Callable],
+) -> Tuple[type, type]:
+	"""
+	Returns a class decorated with decorator and a class
+	with the hand-written methods, both derived from base.
+	Both declare empty __slots__ if base declares slots, so
+	neither gets an instance __dict__. Slotted bases list
+	their slots in FIELDS for the hand-written methods.
+	"""
+	layout = {'__slots__' : ()} if '__slots__' in base.__dict__ else {}
+	decorated = decorator(
+		type(base.__name__, (base,), dict(layout))
+	)
+	handwritten = type(base.__name__, (base,), {**layout, **methods})
+	return decorated, handwritten
+
+
+class DictRecord(object):
+
+	def __init__(self) -> None:
+		self.a = 1
+		self.b = 2.0
+		self.c = 'c'
+
+
+class SlotsRecord(object):
+	__slots__ = ('a', 'b', 'c')
+	FIELDS = __slots__
+
+	def __init__(self) -> None:
+		self.a = 1
+		self.b = 2.0
+		self.c = 'c'
+
+
+class MappingRecord(object):
+
+	def __init__(self) -> None:
+		self.data = {'a' : 1, 'b' : 2.0, 'c' : 'c'}
+
+
+class SequenceRecord(object):
+
+	def __init__(self) -> None:
+		self.data = list(range(64))
+
+
+class LargeRecord(object):
+
+	def __init__(self) -> None:
+		for i in range(64):
+			setattr(self, f'field_{i}', i)
+
+
+class LargeSlotsRecord(object):
+	__slots__ = tuple(f'field_{i}' for i in range(64))
+	FIELDS = __slots__
+
+	def __init__(self) -> None:
+		for i in range(64):
+			setattr(self, f'field_{i}', i)
+
+
+def pair(
+		base: type,
+		decorator: Callable,
+		methods: Dict[str, Callable],
+) -> Tuple[Any, Any]:
+	decorated, handwritten = build(base, decorator, methods)
+	return decorated(), handwritten()
+
+
+def _iter_dict(self):
+	for item in self.__dict__.items():
+		yield item
+
+def _iter_slots(self):
+	for name in self.FIELDS:
+		yield name, getattr(self, name)
+
+def _iter_mapping(self):
+	for item in self.data.items():
+		yield item
+
+def _iter_sequence(self):
+	for value in self.data:
+		yield value
+
+@case('iter.dict', 'for _ in obj: pass')
+def iter_dict() -> Tuple[Any, Any]:
+	return pair(DictRecord, dunder_iter, {'__iter__' : _iter_dict})
+
+@case('iter.slots', 'for _ in obj: pass')
+def iter_slots() -> Tuple[Any, Any]:
+	return pair(
+		SlotsRecord,
+		dunder_iter(slots=True),
+		{'__iter__' : _iter_slots}
+	)
+
+@case('iter.attr_mapping', 'for _ in obj: pass')
+def iter_attr_mapping() -> Tuple[Any, Any]:
+	return pair(
+		MappingRecord,
+		dunder_iter(attr='data'),
+		{'__iter__' : _iter_mapping}
+	)
+
+@case('iter.attr_sequence', 'for _ in obj: pass')
+def iter_attr_sequence() -> Tuple[Any, Any]:
+	return pair(
+		SequenceRecord,
+		dunder_iter(attr='data'),
+		{'__iter__' : _iter_sequence}
+	)
+
+@case('iter.attr_native', 'for _ in obj: pass')
+def iter_attr_native() -> Tuple[Any, Any]:
+	return pair(
+		SequenceRecord,
+		dunder_iter(attr='data', native=True),
+		{'__iter__' : _iter_sequence}
+	)
+
+
+def _getitem_dict(self, key):
+	return self.__dict__[key]
+
+def _getitem_slots(self, key):
+	if key in self.FIELDS:
+		return getattr(self, key)
+	raise KeyError(key)
+
+def _getitem_data(self, key):
+	return self.data[key]
+
+@case('getitem.dict', "obj['b']")
+def getitem_dict() -> Tuple[Any, Any]:
+	return pair(
+		DictRecord,
+		dunder_getitem,
+		{'__getitem__' : _getitem_dict}
+	)
+
+@case('getitem.slots', "obj['b']")
+def getitem_slots() -> Tuple[Any, Any]:
+	return pair(
+		SlotsRecord,
+		dunder_getitem(slots=True),
+		{'__getitem__' : _getitem_slots}
+	)
+
+@case('getitem.slots_large', "obj['field_63']")
+def getitem_slots_large() -> Tuple[Any, Any]:
+	return pair(
+		LargeSlotsRecord,
+		dunder_getitem(slots=True),
+		{'__getitem__' : _getitem_slots}
+	)
+
+@case('getitem.attr_mapping', "obj['b']")
+def getitem_attr_mapping() -> Tuple[Any, Any]:
+	return pair(
+		MappingRecord,
+		dunder_getitem(attr='data'),
+		{'__getitem__' : _getitem_data}
+	)
+
+@case('getitem.attr_sequence', 'obj[32]')
+def getitem_attr_sequence() -> Tuple[Any, Any]:
+	return pair(
+		SequenceRecord,
+		dunder_getitem(attr='data'),
+		{'__getitem__' : _getitem_data}
+	)
+
+
+def _setitem_dict(self, key, value):
+	self.__dict__[key] = value
+
+def _setitem_slots(self, key, value):
+	if key in self.FIELDS:
+		setattr(self, key, value)
+	else:
+		raise KeyError(key)
+
+def _setitem_data(self, key, value):
+	self.data[key] = value
+
+@case('setitem.dict', "obj['b'] = 3.0")
+def setitem_dict() -> Tuple[Any, Any]:
+	return pair(
+		DictRecord,
+		dunder_setitem,
+		{'__setitem__' : _setitem_dict}
+	)
+
+@case('setitem.slots', "obj['b'] = 3.0")
+def setitem_slots() -> Tuple[Any, Any]:
+	return pair(
+		SlotsRecord,
+		dunder_setitem(slots=True),
+		{'__setitem__' : _setitem_slots}
+	)
+
+@case('setitem.attr_mapping', "obj['b'] = 3.0")
+def setitem_attr_mapping() -> Tuple[Any, Any]:
+	return pair(
+		MappingRecord,
+		dunder_setitem(attr='data'),
+		{'__setitem__' : _setitem_data}
+	)
+
+@case('setitem.attr_sequence', 'obj[32] = 3.0')
+def setitem_attr_sequence() -> Tuple[Any, Any]:
+	return pair(
+		SequenceRecord,
+		dunder_setitem(attr='data'),
+		{'__setitem__' : _setitem_data}
+	)
+
+def _setitem_append(self, key, value):
+	data = self.data
+	if key < len(data):
+		data[key] = value
+	else:
+		data.append(value)
+
+def _setitem_prepend(self, key, value):
+	data = self.data
+	if key >= -len(data):
+		data[key] = value
+	else:
+		data.appendleft(value)
+
+@case('setitem.attr_append', 'obj[1 << 62] = 3.0')
+def setitem_attr_append() -> Tuple[Any, Any]:
+	return pair(
+		SequenceRecord,
+		dunder_setitem(attr='data'),
+		{'__setitem__' : _setitem_append}
+	)
+
+@case('setitem.attr_prepend', 'obj[-1 << 62] = 3.0')
+def setitem_attr_prepend() -> Tuple[Any, Any]:
+	decorated, handwritten = pair(
+		SequenceRecord,
+		dunder_setitem(attr='data', growth='deque'),
+		{'__setitem__' : _setitem_prepend}
+	)
+	decorated.data = deque(decorated.data)
+	handwritten.data = deque(handwritten.data)
+	return decorated, handwritten
+
+def _setitem_sparse(self, key, value):
+	self.data[key] = value
+
+@case('setitem.attr_sparse', 'obj[1 << 40] = 3.0')
+def setitem_attr_sparse() -> Tuple[Any, Any]:
+	decorated, handwritten = pair(
+		SequenceRecord,
+		dunder_setitem(attr='data', sparse=True),
+		{'__setitem__' : _setitem_sparse}
+	)
+	decorated.data = SparseSequence(decorated.data)
+	handwritten.data = SparseSequence(handwritten.data)
+	return decorated, handwritten
+
+
+KEYS = [f'field_{i}' for i in range(64)]
+PAIRS = [(key, 0) for key in KEYS]
+
+def _get_many(self, keys):
+	return [self[key] for key in keys]
+
+def _set_many(self, pairs):
+	for key, value in pairs:
+		self[key] = value
+
+@case('get_many.dict', 'obj.get_many(KEYS)')
+def get_many_dict() -> Tuple[Any, Any]:
+	return pair(
+		LargeRecord,
+		dunder_getitem,
+		{'__getitem__' : _getitem_dict, 'get_many' : _get_many}
+	)
+
+@case('set_many.dict', 'obj.set_many(PAIRS)')
+def set_many_dict() -> Tuple[Any, Any]:
+	return pair(
+		LargeRecord,
+		dunder_setitem,
+		{'__setitem__' : _setitem_dict, 'set_many' : _set_many}
+	)
+
+
+def _getitem_missing(self, key):
+	try:
+		return self.__dict__[key]
+	except KeyError:
+		value = self.__dict__[key] = None
+		return value
+
+def missing_pair() -> Tuple[Any, Any]:
+	def decorator(cls):
+		return dunder_getitem(dunder_missing(cls))
+	return pair(
+		DictRecord,
+		decorator,
+		{'__getitem__' : _getitem_missing}
+	)
+
+@case('missing.hit', "obj['b']")
+def missing_hit() -> Tuple[Any, Any]:
+	return missing_pair()
+
+@case('missing.miss', "obj['z']; del obj.__dict__['z']")
+def missing_miss() -> Tuple[Any, Any]:
+	return missing_pair()
+
+
+def _repr_dict(self):
+	fields = ', '.join(
+		f'{name}={value!r}' for name, value in self.__dict__.items()
+	)
+	return f'{self.__class__.__name__}({fields})'
+
+def _repr_slots(self):
+	fields = ', '.join(
+		f'{name}={getattr(self, name)!r}' for name in self.FIELDS
+	)
+	return f'{self.__class__.__name__}({fields})'
+
+@case('repr.small', 'repr(obj)')
+def repr_small() -> Tuple[Any, Any]:
+	return pair(DictRecord, dunder_repr, {'__repr__' : _repr_dict})
+
+@case('repr.large', 'repr(obj)')
+def repr_large() -> Tuple[Any, Any]:
+	return pair(LargeRecord, dunder_repr, {'__repr__' : _repr_dict})
+
+@case('repr.slots', 'repr(obj)')
+def repr_slots() -> Tuple[Any, Any]:
+	return pair(
+		SlotsRecord,
+		dunder_repr(slots=True),
+		{'__repr__' : _repr_slots}
+	)
+
+def _lt_slots(self, other):
+	if other.__class__ is not self.__class__:
+		return NotImplemented
+	return (self.a, self.b, self.c) < (other.a, other.b, other.c)
+
+@case('order.slots', 'obj < obj')
+def order_slots() -> Tuple[Any, Any]:
+	return pair(
+		SlotsRecord,
+		dunder_order(slots=True),
+		{'__lt__' : _lt_slots}
+	)
+
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+if numpy is not None:
+
+	class ArrayRecord(object):
+
+		def __init__(self) -> None:
+			self.data = numpy.arange(4096, dtype=float).reshape(64, 64)
+
+	@case('getitem.ndarray', 'obj[3, 5]')
+	def getitem_ndarray() -> Tuple[Any, Any]:
+		return pair(
+			ArrayRecord,
+			dunder_getitem(attr='data', ndarray=True),
+			{'__getitem__' : _getitem_data}
+		)
+
+	@case('setitem.ndarray', 'obj[:, 5] = 1.0')
+	def setitem_ndarray() -> Tuple[Any, Any]:
+		return pair(
+			ArrayRecord,
+			dunder_setitem(attr='data', ndarray=True),
+			{'__setitem__' : _setitem_data}
+		)
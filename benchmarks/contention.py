@@ -0,0 +1,95 @@
+'''
+Contention benchmark for the threadsafe option. Worker
+threads share one decorated registry and mix reads, misses
+that go through __missing__, and writes.
+'''
+
+import threading
+import time
+from typing import Optional, Dict, List, Any
+from dunderdecorators import dunder_getitem, dunder_setitem, \
+	dunder_missing
+
+MODES = (None, 'instance', 'key')
+
+
+def registry(
+		threadsafe: Any,
+) -> Any:
+	@dunder_getitem(attr='data', threadsafe=threadsafe)
+	@dunder_missing(attr='data', default_value=0, threadsafe=threadsafe)
+	@dunder_setitem(attr='data', threadsafe=threadsafe)
+	class Registry(object):
+
+		def __init__(self) -> None:
+			self.data = {}
+
+	return Registry()
+
+def worker(
+		obj: Any,
+		offset: int,
+		ops: int,
+		keys: int,
+		barrier: threading.Barrier,
+) -> None:
+	barrier.wait()
+	for i in range(ops):
+		key = (i * 7 + offset) % keys
+		if i % 4:
+			obj[key]
+		else:
+			obj[key] = i
+
+def run_contention(
+		threads: int,
+		threadsafe: Any,
+		ops: Optional[int] = 20000,
+		keys: Optional[int] = 1024,
+) -> Dict[str, float]:
+	"""
+	Runs threads workers against one shared registry and
+	returns the elapsed time and the total throughput.
+	"""
+	obj = registry(threadsafe)
+	barrier = threading.Barrier(threads + 1)
+	workers = [
+		threading.Thread(
+			target=worker,
+			args=(obj, i * 131, ops, keys, barrier)
+		)
+		for i in range(threads)
+	]
+	for thread in workers:
+		thread.start()
+	barrier.wait()
+	start = time.perf_counter()
+	for thread in workers:
+		thread.join()
+	elapsed = time.perf_counter() - start
+	return {
+		'seconds' : elapsed,
+		'ops_per_second' : threads * ops / elapsed,
+	}
+
+def run(
+		thread_counts: Optional[List[int]] = None,
+		ops: Optional[int] = 20000,
+) -> Dict[str, Dict[str, float]]:
+	results = {}
+	for threadsafe in MODES:
+		for threads in thread_counts or [1, 2, 4, 8]:
+			name = f'{threadsafe or "unlocked"}.threads_{threads}'
+			results[name] = run_contention(threads, threadsafe, ops)
+	return results
+
+def format_results(
+		results: Dict[str, Dict[str, float]],
+) -> str:
+	lines = [f'{"case":<24}{"seconds":>10}{"ops/s":>14}']
+	for name, result in results.items():
+		lines.append(
+			f'{name:<24}{result["seconds"]:>10.3f}'
+			+ f'{result["ops_per_second"]:>14.0f}'
+		)
+	return '\n'.join(lines)
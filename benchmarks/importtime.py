@@ -0,0 +1,118 @@
+'''
+Cold start benchmark. Every measurement runs in a fresh
+interpreter, so module caches of earlier runs do not count.
+'''
+
+import os
+import subprocess
+import sys
+from typing import Optional, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DECORATE = '''
+import time
+start = time.perf_counter()
+from dunderdecorators import dunder_getitem, dunder_setitem, \\
+	dunder_iter, dunder_repr{imports}
+
+def define(i):
+	@dunder_repr
+	@dunder_iter
+	@dunder_setitem
+	@dunder_getitem
+	class Record(object):
+		pass
+	return Record
+
+{block}
+	classes = [define(i) for i in range({classes})]
+print((time.perf_counter() - start) * 1e3)
+'''
+
+STATEMENTS = {
+	'import' : 'import dunderdecorators',
+	'import_decorators' : 'from dunderdecorators import dunder_getitem',
+}
+
+
+def run_python(
+		args: List[str],
+) -> subprocess.CompletedProcess:
+	env = dict(os.environ)
+	env['PYTHONPATH'] = os.pathsep.join(
+		filter(None, [ROOT, env.get('PYTHONPATH')])
+	)
+	return subprocess.run(
+		[sys.executable] + args,
+		capture_output=True,
+		text=True,
+		env=env,
+		check=True,
+	)
+
+def import_time(
+		stmt: str,
+) -> float:
+	"""
+	Returns the cumulative import time of the dunderdecorators
+	package in milliseconds, as reported by python -X importtime.
+	"""
+	stderr = run_python(['-X', 'importtime', '-c', stmt]).stderr
+	total = 0
+	for line in stderr.splitlines():
+		fields = line.split('|')
+		if len(fields) != 3:
+			continue
+		name = fields[2][1:]
+		if name.startswith('dunderdecorators'):
+			total += int(fields[1])
+	return total / 1e3
+
+def decorate_time(
+		classes: int,
+		deferred: bool,
+) -> float:
+	"""
+	Returns the time in milliseconds to import the package
+	and decorate classes classes with four decorators each.
+	"""
+	if deferred:
+		source = DECORATE.format(
+			imports=', deferred',
+			block='with deferred():',
+			classes=classes,
+		)
+	else:
+		source = DECORATE.format(
+			imports='',
+			block='if True:',
+			classes=classes,
+		)
+	return float(run_python(['-c', source]).stdout)
+
+def run(
+		repeat: Optional[int] = 5,
+		classes: Optional[int] = 200,
+) -> Dict[str, float]:
+	"""
+	Returns the best time of repeat runs of every measurement,
+	in milliseconds.
+	"""
+	results = {}
+	for name, stmt in STATEMENTS.items():
+		results[name] = min(import_time(stmt) for _ in range(repeat))
+	for deferred in (False, True):
+		name = f'decorate_{classes}{"_deferred" if deferred else ""}'
+		results[name] = min(
+			decorate_time(classes, deferred) for _ in range(repeat)
+		)
+	return results
+
+def format_results(
+		results: Dict[str, float],
+) -> str:
+	lines = [f'{"case":<32}{"ms":>10}']
+	for name, ms in results.items():
+		lines.append(f'{name:<32}{ms:>10.2f}')
+	return '\n'.join(lines)
@@ -0,0 +1,153 @@
+'''
+Times benchmark cases and compares saved results.
+'''
+
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Optional, Dict, List, Any
+import dunderdecorators
+from .cases import CASES, Case, KEYS, PAIRS
+
+
+def time_stmt(
+		stmt: str,
+		obj: Any,
+		repeat: int,
+		min_time: float,
+) -> float:
+	"""
+	Returns the best observed time per execution of stmt,
+	in nanoseconds.
+	"""
+	timer = timeit.Timer(
+		stmt, 
+		globals={'obj' : obj, 'KEYS' : KEYS, 'PAIRS' : PAIRS}
+	)
+	number = 1
+	while True:
+		if timer.timeit(number) >= min_time:
+			break
+		number *= 2
+	best = min(timer.repeat(repeat=repeat, number=number))
+	return best / number * 1e9
+
+def run_case(
+		case: Case,
+		repeat: Optional[int] = 5,
+		min_time: Optional[float] = 0.05,
+) -> Dict[str, float]:
+	"""
+	Times a case against the decorated and the hand-written
+	object and returns per-call latency in nanoseconds,
+	throughput in calls per second and the decorator overhead
+	relative to the hand-written method.
+	"""
+	decorated, handwritten = case.setup()
+	decorated_ns = time_stmt(case.stmt, decorated, repeat, min_time)
+	handwritten_ns = time_stmt(case.stmt, handwritten, repeat, min_time)
+	return {
+		'decorated_ns' : decorated_ns,
+		'handwritten_ns' : handwritten_ns,
+		'decorated_ops' : 1e9 / decorated_ns,
+		'handwritten_ops' : 1e9 / handwritten_ns,
+		'overhead' : decorated_ns / handwritten_ns,
+	}
+
+def run(
+		names: Optional[List[str]] = None,
+		repeat: Optional[int] = 5,
+		min_time: Optional[float] = 0.05,
+) -> Dict[str, Any]:
+	"""
+	Runs the cases whose names start with one of names, or
+	every case if names is None, and returns the results
+	together with a description of the environment.
+	"""
+	results = {}
+	for name, case in CASES.items():
+		if names and not any(name.startswith(n) for n in names):
+			continue
+		results[name] = run_case(case, repeat, min_time)
+	return {
+		'meta' : {
+			'python' : sys.version.split()[0],
+			'implementation' : platform.python_implementation(),
+			'platform' : platform.platform(),
+			'dunderdecorators' : dunderdecorators.__version__,
+			'timestamp' : time.time(),
+		},
+		'results' : results,
+	}
+
+def compare(
+		old: Dict[str, Any],
+		new: Dict[str, Any],
+) -> Dict[str, Dict[str, float]]:
+	"""
+	Returns the change in decorated latency and in overhead
+	for every case present in both result sets. A ratio below
+	1.0 means the new run is faster.
+	"""
+	diff = {}
+	for name, new_result in new['results'].items():
+		old_result = old['results'].get(name)
+		if old_result is None:
+			continue
+		diff[name] = {
+			'old_ns' : old_result['decorated_ns'],
+			'new_ns' : new_result['decorated_ns'],
+			'ratio' : (
+				new_result['decorated_ns']
+				/ old_result['decorated_ns']
+			),
+			'old_overhead' : old_result['overhead'],
+			'new_overhead' : new_result['overhead'],
+		}
+	return diff
+
+def format_results(
+		results: Dict[str, Any],
+) -> str:
+	lines = [
+		f'{"case":<24}{"decorated ns":>14}{"handwritten ns":>16}'
+		+ f'{"overhead":>10}'
+	]
+	for name, result in results['results'].items():
+		lines.append(
+			f'{name:<24}{result["decorated_ns"]:>14.1f}'
+			+ f'{result["handwritten_ns"]:>16.1f}'
+			+ f'{result["overhead"]:>9.2f}x'
+		)
+	return '\n'.join(lines)
+
+def format_diff(
+		diff: Dict[str, Dict[str, float]],
+) -> str:
+	lines = [
+		f'{"case":<24}{"old ns":>10}{"new ns":>10}{"ratio":>8}'
+		+ f'{"old overhead":>14}{"new overhead":>14}'
+	]
+	for name, result in diff.items():
+		lines.append(
+			f'{name:<24}{result["old_ns"]:>10.1f}'
+			+ f'{result["new_ns"]:>10.1f}{result["ratio"]:>8.2f}'
+			+ f'{result["old_overhead"]:>13.2f}x'
+			+ f'{result["new_overhead"]:>13.2f}x'
+		)
+	return '\n'.join(lines)
+
+def load(
+		path: str,
+) -> Dict[str, Any]:
+	with open(path) as f:
+		return json.load(f)
+
+def dump(
+		results: Dict[str, Any],
+		path: str,
+) -> None:
+	with open(path, 'w') as f:
+		json.dump(results, f, indent=2)
@@ -1,3 +1,52 @@
 __version__="1.1"
-from .dunder_decorators import *
-from .exceptions import *
+
+LAZY_ATTRS = {
+	'dunder_iter' : 'dunder_decorators',
+	'dunder_aiter' : 'dunder_decorators',
+	'dunder_setitem' : 'dunder_decorators',
+	'dunder_getitem' : 'dunder_decorators',
+	'dunder_missing' : 'dunder_decorators',
+	'dunder_repr' : 'dunder_decorators',
+	'dunder_contains' : 'dunder_decorators',
+	'dunder_len' : 'dunder_decorators',
+	'dunder_eq' : 'dunder_decorators',
+	'dunder_hash' : 'dunder_decorators',
+	'dunder_order' : 'dunder_decorators',
+	'dunder_slots' : 'dunder_decorators',
+	'DunderDecoratorException' : 'exceptions',
+	'DunderKeyError' : 'exceptions',
+	'DunderIndexError' : 'exceptions',
+	'DunderTypeError' : 'exceptions',
+	'SparseSequence' : 'containers',
+	'SequenceView' : 'containers',
+	'slice_view' : 'containers',
+	'deferred' : 'deferral',
+	'specialize' : 'deferral',
+}
+
+__all__ = list(LAZY_ATTRS)
+
+
+def __getattr__(name):
+	"""
+	Imports the submodule that defines name the first time
+	name is looked up, so importing the package only loads the
+	modules that are used.
+	"""
+	from importlib import import_module
+	if name in LAZY_ATTRS:
+		value = getattr(
+			import_module(f'.{LAZY_ATTRS[name]}', __name__),
+			name
+		)
+	elif name == 'instrumentation':
+		value = import_module(f'.{name}', __name__)
+	else:
+		raise AttributeError(
+			f'module {__name__!r} has no attribute {name!r}'
+		)
+	globals()[name] = value
+	return value
+
+def __dir__():
+	return sorted(list(globals()) + __all__ + ['instrumentation'])
@@ -0,0 +1,574 @@
+from __future__ import annotations
+from collections.abc import Mapping, Iterable, Hashable
+from keyword import iskeyword
+from threading import local
+from types import FunctionType
+from .exceptions import DunderDecoratorException, DunderTypeError, \
+	ERROR_TYPES
+from .containers import SparseSequence
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, TypeVar, Dict, List, Tuple, Any, \
+		Callable
+	Cls = TypeVar('User Defined Class')
+
+MISSING = object()
+
+
+class generated_staticmethod(staticmethod):
+	"""
+	staticmethod that accepts attributes such as __source__ on
+	every Python version. Plain staticmethod objects only have
+	a __dict__ since Python 3.10.
+	"""
+
+
+def raise_unhashable(
+		cls_obj: Cls,
+		key: Any,
+) -> None:
+	"""
+	Translates the TypeError raised by a failed hash probe
+	into a DunderDecoratorException if the key is not hashable.
+	Must be called from inside an except block, so a TypeError
+	raised for any other reason is re-raised unchanged.
+	"""
+	if isinstance(key, Hashable):
+		raise
+	raise DunderTypeError(
+		cls_obj,
+		'key_not_hashable',
+		key
+	) from None
+
+def repr_field_name(
+		attr: Any,
+) -> str:
+	"""
+	Returns the field name __repr__ shows for a key of the
+	object's dictionary. Keys that start with a digit are
+	prefixed with the name of their type.
+	"""
+	if str(attr)[:1].isdigit():
+		return f'{attr.__class__.__name__}_{attr}'
+	return attr
+
+CONTAINER_KINDS = {
+	dict : 'mapping',
+	list : 'sequence',
+	SparseSequence : 'sequence',
+}
+
+def container_kind(
+		container: Any,
+) -> str:
+	"""
+	Classifies an attribute as 'mapping' or 'sequence'. Any 
+	other result is the message of the DunderDecoratorException
+	raised for the attribute. The classification is cached 
+	per type, so the ABC checks run once per container type.
+	"""
+	container_type = type(container)
+	kind = CONTAINER_KINDS.get(container_type)
+	if kind is None:
+		if isinstance(container, Mapping):
+			kind = 'mapping'
+		elif not hasattr(container, '__getitem__'):
+			kind = 'indexable'
+		elif isinstance(container, Iterable):
+			kind = 'sequence'
+		else:
+			kind = 'attr_not_mapping_or_iterable'
+		CONTAINER_KINDS[container_type] = kind
+	return kind
+
+NAMESPACE = {
+	'DunderDecoratorException' : DunderDecoratorException,
+	**{error.__name__ : error for error in ERROR_TYPES.values()},
+	'Mapping' : Mapping,
+	'Iterable' : Iterable,
+	'Hashable' : Hashable,
+	'MISSING' : MISSING,
+	'raise_unhashable' : raise_unhashable,
+	'repr_field_name' : repr_field_name,
+	'container_kind' : container_kind,
+}
+
+def has_instance_dict(
+		cls: Cls,
+) -> bool:
+	"""
+	Returns True if instances of cls store their attributes
+	in a __dict__.
+	"""
+	return bool(cls.__dictoffset__)
+
+HIDDEN_SLOTS = ('__dunder_hash__', '__dunder_cache__')
+
+def slot_names(
+		cls: Cls,
+) -> Optional[tuple]:
+	"""
+	Returns the slot names declared by cls and its base 
+	classes as a tuple, base classes first, or None if no
+	class in the MRO of cls declares __slots__. The __dict__
+	and __weakref__ slots and the HIDDEN_SLOTS are skipped and 
+	private names are mangled. The MRO is walked once per class and the result 
+	is cached in cls.__dunder_slot_names__.
+	"""
+	names = cls.__dict__.get('__dunder_slot_names__', MISSING)
+	if names is not MISSING:
+		return names
+	names = None
+	for base in reversed(cls.__mro__):
+		slots = base.__dict__.get('__slots__')
+		if slots is None:
+			continue
+		if isinstance(slots, str):
+			slots = (slots,)
+		names = names or ()
+		for name in slots:
+			if name in ('__dict__', '__weakref__') or name in HIDDEN_SLOTS:
+				continue
+			if name.startswith('__') and not name.endswith('__'):
+				name = f'_{base.__name__.lstrip("_")}{name}'
+			if name not in names:
+				names += (name,)
+	setattr(cls, '__dunder_slot_names__', names)
+	return names
+
+SLOT_NAMESPACES = {}
+
+def slot_namespace(
+		names: tuple,
+) -> Dict[str, Any]:
+	"""
+	Returns the names generated slots methods refer to. 
+	slot_set is a frozenset of the slot names, so testing
+	whether a key names a slot takes constant time however
+	many slots the class declares. Equal names give the same
+	tuple and frozenset objects, so classes with the same
+	slots do not keep a frozenset each.
+	"""
+	namespace = SLOT_NAMESPACES.get(names)
+	if namespace is None:
+		namespace = SLOT_NAMESPACES.setdefault(
+			names,
+			{
+				'slot_names' : names,
+				'slot_set' : frozenset(names),
+			}
+		)
+	return dict(namespace)
+
+def attr_expr(
+		attr: str,
+		obj: Optional[str] = 'cls',
+) -> str:
+	"""
+	Returns a source expression that reads attribute attr
+	from obj.
+	"""
+	if attr.isidentifier() and not iskeyword(attr):
+		return f'{obj}.{attr}'
+	return f'getattr({obj}, {attr!r})'
+
+def attr_assign(
+		attr: str,
+		value: str,
+		obj: Optional[str] = 'cls',
+) -> str:
+	"""
+	Returns a source statement that sets attribute attr
+	of obj to value.
+	"""
+	if attr.isidentifier() and not iskeyword(attr):
+		return f'{obj}.{attr} = {value}'
+	return f'setattr({obj}, {attr!r}, {value})'
+
+def fields_expr(
+		names: tuple,
+		obj: Optional[str] = 'cls',
+) -> str:
+	"""
+	Returns a source expression that builds the tuple of the
+	attributes names of obj.
+	"""
+	return '(' + ''.join(f'{obj}.{name}, ' for name in names) + ')'
+
+def has_slot(
+		cls: Cls,
+		name: str,
+) -> bool:
+	"""
+	Returns True if cls or a base class declares the slot name.
+	"""
+	return any(name in base.__dict__ for base in cls.__mro__)
+
+def raise_line(
+		message: Any,
+		arg: Optional[str] = None,
+) -> str:
+	"""
+	Returns a source statement that raises a
+	DunderDecoratorException for the decorated object, or the 
+	subclass of DunderDecoratorException registered for message
+	in ERROR_TYPES.
+	"""
+	error = ERROR_TYPES.get(message, DunderDecoratorException).__name__
+	if arg is None:
+		return f'raise {error}(cls, {message!r})'
+	return f'raise {error}(cls, {message!r}, {arg})'
+
+SHARED_CODE = {}
+
+def create_fn(
+		name: str,
+		args: List[str],
+		body: List[str],
+		namespace: Optional[Dict[str, Any]] = None,
+		is_async: Optional[bool] = None,
+) -> Callable:
+	"""
+	Compiles a function from source lines. Generated methods
+	are specialized for one class layout when the class is
+	decorated, so the function body only contains the
+	work needed for that layout.
+
+	Parameters
+	---------
+	name : str
+		Name of the generated function.
+
+	args : list of str
+		Argument names of the generated function.
+
+	body : list of str
+		Source lines of the function body, without the
+		leading indentation.
+
+	namespace : dict, optional
+		Extra names the generated source refers to.
+		Defaults to None.
+
+	is_async : bool, optional
+		If True, the generated function is a coroutine
+		function, or an async generator function if the body
+		yields. Defaults to None.
+
+	Returns
+	-------
+	: function
+		A new function with its own namespace. Its code object
+		is compiled once per source and kept in SHARED_CODE,
+		so classes decorated with the same configuration share
+		the code of their methods but not the functions, which
+		get the names of their own class, see install.
+	"""
+	source = (
+		f'{"async " if is_async else ""}def {name}({", ".join(args)}):\n'
+		+ '\n'.join(f'\t{line}' for line in body)
+	)
+	fn_globals = dict(NAMESPACE)
+	if namespace:
+		fn_globals.update(namespace)
+	shared = SHARED_CODE.get(source)
+	if shared is None:
+		template_globals = dict(NAMESPACE)
+		exec(
+			compile(source, f'<dunderdecorators {name}>', 'exec'),
+			template_globals
+		)
+		template = template_globals[name]
+		shared = SHARED_CODE.setdefault(
+			source,
+			(template.__code__, template.__defaults__, template.__kwdefaults__)
+		)
+	code, defaults, kwdefaults = shared
+	fn = FunctionType(code, fn_globals, name, defaults)
+	fn.__kwdefaults__ = kwdefaults
+	fn.__source__ = source
+	return fn
+
+def install(
+		cls: Cls,
+		name: str,
+		fn: Callable,
+) -> None:
+	"""
+	Sets a generated function as a method of cls and names it
+	after cls, so tracebacks, inspect and help() show e.g.
+	B.__getitem__. The code object, which tracebacks take the
+	qualified name from since Python 3.11, is copied for that,
+	which is much cheaper than compiling it again.
+	"""
+	qualname = f'{cls.__qualname__}.{name}'
+	fn.__qualname__ = qualname
+	fn.__module__ = cls.__module__
+	code = fn.__code__
+	if getattr(code, 'co_qualname', qualname) != qualname:
+		fn.__code__ = code.replace(co_qualname=qualname)
+	setattr(cls, name, fn)
+
+def install_new(
+		cls: Cls,
+		name: str,
+		fn: Callable,
+) -> None:
+	"""
+	Sets a generated function as a method of cls, unless cls
+	already has a method of that name that was not generated.
+	"""
+	existing = getattr(cls, name, None)
+	if existing is not None and not hasattr(existing, '__source__'):
+		return
+	install(cls, name, fn)
+
+def install_getstate(
+		cls: Cls,
+) -> None:
+	"""
+	Sets a generated __getstate__ method of cls that returns
+	the state pickle and copy save without the HIDDEN_SLOTS,
+	unless cls already has a __getstate__ method that was not
+	generated. The hidden slots hold state derived from the
+	object, e.g. a hash that depends on PYTHONHASHSEED, so the
+	state is rebuilt on first use instead of being copied.
+	Only the keys an eviction tracker in __dunder_cache__
+	tracks are saved, in eviction order, and the __setstate__
+	method dunder_missing adds builds a new tracker for them.
+	"""
+	existing = getattr(cls, '__getstate__', None)
+	if (
+			existing is not None
+			and existing is not getattr(object, '__getstate__', None)
+			and not hasattr(existing, '__source__')
+	):
+		return
+	body = [
+		"state = getattr(cls, '__dict__', None) or None",
+		'slots = {}',
+		'for name in class_slot_names(type(cls)) or ():',
+		'	try:',
+		'		slots[name] = getattr(cls, name)',
+		'	except AttributeError:',
+		'		pass',
+	]
+	setstate = getattr(cls, '__setstate__', None)
+	if has_slot(cls, '__dunder_cache__') and (
+			setstate is None or hasattr(setstate, '__source__')
+	):
+		body += [
+			'try:',
+			'	slots["__dunder_cache__"] = cls.__dunder_cache__.tracked()',
+			'except AttributeError:',
+			'	pass',
+		]
+	body += [
+		'if slots:',
+		'	return state, slots',
+		'return state',
+	]
+	install(
+		cls,
+		'__getstate__',
+		create_fn(
+			'__getstate__',
+			['cls'],
+			body,
+			{'class_slot_names' : slot_names},
+		)
+	)
+
+def record(
+		cls: Cls,
+		decorator: Callable,
+		**options: Any,
+) -> None:
+	"""
+	Records that decorator was applied to cls with options, so
+	the decorator can be applied again when cls is rebuilt, 
+	e.g. by dunder_slots. Records are stored in application
+	order in cls.__dunder_decorators__ and are not inherited.
+	Slots mode decorators are applied again to subclasses that
+	declare more slots, see refresh_slots.
+	"""
+	setattr(
+		cls,
+		'__dunder_decorators__',
+		cls.__dict__.get('__dunder_decorators__', ())
+		+ ((decorator, options),)
+	)
+	if not options.get('attr') and (
+			options.get('slots') or not has_instance_dict(cls)
+	):
+		install_subclass_hook(cls)
+	from .instrumentation import track
+	track(cls)
+
+def recorded_option(
+		cls: Cls,
+		decorator: Callable,
+		name: str,
+) -> Any:
+	"""
+	Returns option name of the last record of decorator on cls
+	or its nearest base class that has one, see record, or
+	None if decorator was not applied.
+	"""
+	for base in cls.__mro__:
+		for applied, options in reversed(
+				base.__dict__.get('__dunder_decorators__', ())
+		):
+			if applied is decorator:
+				return options.get(name)
+	return None
+
+REFRESHED_METHODS = {
+	'dunder_order' : '__lt__',
+}
+
+def refresh_slots(
+		cls: Cls,
+) -> None:
+	"""
+	Applies the slots mode decorators recorded by the base
+	classes of cls to cls again if cls declares slots of its 
+	own, so the generated methods see every slot. Dict mode
+	decorators recorded by a base class without an instance
+	__dict__ are applied again if cls has one. Methods that
+	cls or a base class between cls and the decorated class
+	define by hand are kept.
+	"""
+	if '__dunder_slot_names__' in cls.__dict__:
+		return
+	names = slot_names(cls)
+	pending = {}
+	for base in reversed(cls.__mro__[1:]):
+		records = base.__dict__.get('__dunder_decorators__', ())
+		for decorator, options in records:
+			if options.get('attr'):
+				continue
+			method = REFRESHED_METHODS.get(
+				decorator.__name__,
+				f'__{decorator.__name__[len("dunder_"):]}__'
+			)
+			pending[method] = (base, decorator, options)
+	for method, (base, decorator, options) in pending.items():
+		if options.get('slots'):
+			if slot_names(base) == names:
+				continue
+		elif has_instance_dict(base) or not has_instance_dict(cls):
+			continue
+		if not hasattr(getattr(cls, method, None), '__source__'):
+			continue
+		decorator(**options)(cls)
+
+def install_subclass_hook(
+		cls: Cls,
+) -> None:
+	"""
+	Adds an __init_subclass__ method to cls that calls 
+	refresh_slots on every subclass of cls. An 
+	__init_subclass__ method cls already defines is still 
+	called first.
+	"""
+	original = cls.__dict__.get('__init_subclass__')
+	if hasattr(getattr(original, '__func__', None), 'refreshes_slots'):
+		return
+
+	def __init_subclass__(
+			subclass: Cls,
+			**kwargs: Any,
+	) -> None:
+		if original is None:
+			super(cls, subclass).__init_subclass__(**kwargs)
+		else:
+			original.__func__(subclass, **kwargs)
+		refresh_slots(subclass)
+
+	__init_subclass__.refreshes_slots = True
+	__init_subclass__.__qualname__ = f'{cls.__qualname__}.__init_subclass__'
+	setattr(cls, '__init_subclass__', classmethod(__init_subclass__))
+
+class Deferring(local):
+	"""
+	Depth of the deferred() blocks the current thread is in. 
+	The depth is per thread, so a deferred() block only defers 
+	the decorators applied by the thread that entered it.
+	"""
+	depth = 0
+
+DEFERRING = Deferring()
+
+def defer(
+		cls: Cls,
+		wrap: Callable,
+		names: Tuple[str, ...],
+) -> bool:
+	"""
+	Called by dunder decorators before they generate any code.
+	Inside a deferred() block, wrap is queued to run on the 
+	first call of one of the methods named names and True is
+	returned, so the decorator returns cls unchanged.
+	"""
+	if not DEFERRING.depth:
+		return False
+	from .deferral import add_pending
+	add_pending(cls, wrap, names)
+	return True
+
+THREADSAFE_MODES = (None, False, True, 'instance', 'key')
+
+def lock_namespace(
+		cls: Cls,
+		threadsafe: Any,
+) -> Dict[str, Any]:
+	"""
+	Returns the names lock_lines refers to, for the lock
+	table of cls.
+	"""
+	if threadsafe not in THREADSAFE_MODES:
+		raise DunderDecoratorException(
+			cls,
+			'invalid_threadsafe',
+			threadsafe
+		)
+	from .locks import locks_for
+	stripes = locks_for(cls)
+	return {
+		'lock_table' : stripes.locks,
+		'LOCK_MASK' : stripes.mask,
+	}
+
+def lock_lines(
+		threadsafe: Any,
+		attr: Optional[str] = None,
+		key: Optional[bool] = None,
+) -> List[str]:
+	"""
+	Returns source lines that bind lock to the lock guarding
+	the decorated object. If threadsafe is 'key' and key is 
+	True, mappings are guarded by a lock chosen by the hash 
+	of the key, so writes to different keys do not contend.
+	"""
+	instance_lock = 'lock = lock_table[id(cls) >> 4 & LOCK_MASK]'
+	if threadsafe != 'key' or not key:
+		return [instance_lock]
+	key_lock = [
+		'try:',
+		'\tlock = lock_table[(id(cls) >> 4 ^ hash(key)) & LOCK_MASK]',
+		'except TypeError:',
+		'\traise_unhashable(cls, key)',
+	]
+	if not attr:
+		return key_lock
+	return [
+		f'container = {attr_expr(attr)}',
+		'if type(container) is dict '
+		+ 'or container_kind(container) == "mapping":',
+	] + [f'\t{line}' for line in key_lock] + [
+		'else:',
+		f'\t{instance_lock}',
+	]
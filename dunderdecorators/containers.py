@@ -0,0 +1,274 @@
+from __future__ import annotations
+from array import array
+from collections.abc import Sequence, MutableSequence
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, Iterable, Iterator, Tuple, Union, Any
+
+__all__ = ['SparseSequence', 'SequenceView', 'slice_view']
+
+
+class SparseSequence(MutableSequence):
+	"""
+	Mutable sequence that only stores the items that were
+	written to it. Indices that were never written read as
+	default, so memory is proportional to the number of stored
+	items rather than to the length of the sequence. Writing
+	past the end of the sequence extends it to the written
+	index in O(1).
+
+	Parameters
+	---------
+	iterable : Iterable, optional
+		Initial items, stored at indices 0 to len(iterable) - 1.
+		Defaults to an empty tuple.
+
+	default : Any, optional
+		Value read at indices that were never written.
+		Defaults to None.
+
+	Examples
+	--------
+	>>> a = SparseSequence([1, 2, 3])
+	>>> a[10 ** 9] = 4
+	>>> print(len(a), a[5], a[-1])
+		1000000001 None 4
+	>>> print(list(a.items()))
+		[(0, 1), (1, 2), (2, 3), (1000000000, 4)]
+
+	"""
+
+	__slots__ = ('_items', '_length', 'default')
+
+	def __init__(
+			self,
+			iterable: Optional[Iterable] = (),
+			default: Optional[Any] = None,
+	) -> None:
+		self._items = dict(enumerate(iterable))
+		self._length = len(self._items)
+		self.default = default
+
+	def _index(
+			self,
+			index: int,
+	) -> int:
+		if index < 0:
+			index += self._length
+			if index < 0:
+				raise IndexError('SparseSequence index out of range')
+		return index
+
+	def __len__(self) -> int:
+		return self._length
+
+	def __getitem__(
+			self,
+			index: int,
+	) -> Any:
+		if isinstance(index, slice):
+			return [
+				self._items.get(i, self.default)
+				for i in range(*index.indices(self._length))
+			]
+		index = self._index(index)
+		if index >= self._length:
+			raise IndexError('SparseSequence index out of range')
+		return self._items.get(index, self.default)
+
+	def __setitem__(
+			self,
+			index: int,
+			value: Any,
+	) -> None:
+		if isinstance(index, slice):
+			indices = range(*index.indices(self._length))
+			values = list(value)
+			if len(values) != len(indices):
+				raise ValueError(
+					f'attempt to assign sequence of size {len(values)} '
+					+ f'to slice of size {len(indices)}'
+				)
+			for i, v in zip(indices, values):
+				self._items[i] = v
+			return
+		index = self._index(index)
+		self._items[index] = value
+		if index >= self._length:
+			self._length = index + 1
+
+	def __delitem__(
+			self,
+			index: int,
+	) -> None:
+		index = self._index(index)
+		if index >= self._length:
+			raise IndexError('SparseSequence index out of range')
+		self._items = {
+			(i if i < index else i - 1) : v
+			for i, v in self._items.items() if i != index
+		}
+		self._length -= 1
+
+	def insert(
+			self,
+			index: int,
+			value: Any,
+	) -> None:
+		if index < 0:
+			index = max(index + self._length, 0)
+		index = min(index, self._length)
+		self._items = {
+			(i if i < index else i + 1) : v
+			for i, v in self._items.items()
+		}
+		self._items[index] = value
+		self._length += 1
+
+	def append(
+			self,
+			value: Any,
+	) -> None:
+		self._items[self._length] = value
+		self._length += 1
+
+	def __iter__(self) -> Iterator:
+		items = self._items
+		default = self.default
+		for i in range(self._length):
+			yield items.get(i, default)
+
+	def items(self) -> Iterator[Tuple[int, Any]]:
+		"""
+		Iterates over the (index, value) pairs that are stored,
+		in index order, without visiting unwritten indices.
+		"""
+		for index in sorted(self._items):
+			yield index, self._items[index]
+
+	def __eq__(
+			self,
+			other: Any,
+	) -> bool:
+		if not isinstance(other, SparseSequence):
+			return NotImplemented
+		if self._length != other._length:
+			return False
+		indices = self._items.keys() | other._items.keys()
+		if len(indices) < self._length and self.default != other.default:
+			return False
+		return all(
+			self._items.get(i, self.default)
+			== other._items.get(i, other.default)
+			for i in indices
+		)
+
+	def __repr__(self) -> str:
+		return (
+			f'{self.__class__.__name__}('
+			+ f'{dict(self.items())!r}, length={self._length})'
+		)
+
+
+class SequenceView(Sequence):
+	"""
+	Lazy view of a slice of a sequence. Items are read from and
+	written to the underlying sequence, so creating a view
+	does not copy. The indices of the view are fixed when it
+	is created.
+
+	Parameters
+	---------
+	sequence : Sequence
+		Sequence that is viewed.
+
+	indices : slice or range
+		Indices of sequence that are part of the view.
+
+	Examples
+	--------
+	>>> a = [0, 1, 2, 3, 4, 5]
+	>>> view = SequenceView(a, slice(1, None, 2))
+	>>> print(list(view))
+		[1, 3, 5]
+	>>> view[0] = 10
+	>>> print(a)
+		[0, 10, 2, 3, 4, 5]
+
+	"""
+
+	__slots__ = ('sequence', 'indices')
+
+	def __init__(
+			self,
+			sequence: Sequence,
+			indices: Union[slice, range],
+	) -> None:
+		if isinstance(indices, slice):
+			indices = range(*indices.indices(len(sequence)))
+		self.sequence = sequence
+		self.indices = indices
+
+	def __len__(self) -> int:
+		return len(self.indices)
+
+	def __getitem__(
+			self,
+			index: Union[int, slice],
+	) -> Any:
+		if isinstance(index, slice):
+			return SequenceView(self.sequence, self.indices[index])
+		return self.sequence[self.indices[index]]
+
+	def __setitem__(
+			self,
+			index: Union[int, slice],
+			value: Any,
+	) -> None:
+		if isinstance(index, slice):
+			indices = self.indices[index]
+			values = list(value)
+			if len(values) != len(indices):
+				raise ValueError(
+					f'attempt to assign sequence of size {len(values)} '
+					+ f'to slice of size {len(indices)}'
+				)
+			for i, v in zip(indices, values):
+				self.sequence[i] = v
+			return
+		self.sequence[self.indices[index]] = value
+
+	def __iter__(self) -> Iterator:
+		sequence = self.sequence
+		for i in self.indices:
+			yield sequence[i]
+
+	def __eq__(
+			self,
+			other: Any,
+	) -> bool:
+		if not isinstance(other, Sequence) or isinstance(other, str):
+			return NotImplemented
+		return len(self) == len(other) and all(
+			a == b for a, b in zip(self, other)
+		)
+
+	def __repr__(self) -> str:
+		return f'{self.__class__.__name__}({list(self)!r})'
+
+
+BUFFER_TYPES = (bytes, bytearray, array, memoryview)
+
+def slice_view(
+		sequence: Sequence,
+		key: slice,
+) -> Union[memoryview, SequenceView]:
+	"""
+	Returns a zero-copy view of sequence[key]. Sequences that
+	support the buffer protocol are viewed with a memoryview,
+	any other sequence with a SequenceView.
+	"""
+	if isinstance(sequence, BUFFER_TYPES):
+		return memoryview(sequence)[key]
+	return SequenceView(sequence, key)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from threading import RLock
+from weakref import WeakSet
+from . import codegen
+from .codegen import install
+from .instrumentation import track
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, TypeVar, Tuple, Callable, Iterator, \
+		Any
+	Cls = TypeVar('User Defined Class')
+
+__all__ = ['deferred', 'specialize']
+
+LOCK = RLock()
+PENDING = WeakSet()
+
+
+@contextmanager
+def deferred() -> Iterator[None]:
+	"""
+	Defers the code generation of every dunder decorator
+	applied inside the block. Each decorated class gets stub
+	methods instead, and the first call of any stub generates
+	all the methods of the class, so classes that are never
+	used cost almost nothing at import time. Options are only
+	validated when the methods are generated. Only decorators
+	applied by the thread that entered the block are deferred.
+	dunder_slots specializes the class it copies, since it
+	applies the decorators again in slots mode.
+
+	Examples
+	--------
+	>>> with deferred():
+	>>> 	@dunder_getitem
+	>>> 	Class A(object):
+	>>>			pass
+	>>> a = A()
+	>>> a.a = 1
+	>>> print(a['a'])	#__getitem__ is generated here
+		1
+	"""
+	codegen.DEFERRING.depth += 1
+	try:
+		yield
+	finally:
+		codegen.DEFERRING.depth -= 1
+
+def add_pending(
+		cls: Cls,
+		wrap: Callable,
+		names: Tuple[str, ...],
+) -> None:
+	"""
+	Queues wrap to run when cls is specialized and installs a
+	stub for each method in names. Special methods are always
+	stubbed, since decorators replace them, other methods only
+	if cls does not define them by hand.
+	"""
+	with LOCK:
+		pending = cls.__dict__.get('__dunder_pending__')
+		if pending is None:
+			pending = []
+			setattr(cls, '__dunder_pending__', pending)
+			PENDING.add(cls)
+		pending.append(wrap)
+		for name in names:
+			existing = getattr(cls, name, None)
+			if (
+					not name.startswith('__') 
+					and existing is not None 
+					and not hasattr(existing, '__source__')
+			):
+				continue
+			install(cls, name, make_stub(cls, name))
+
+def copy_pending(
+		cls: Cls,
+		new_cls: Cls,
+) -> None:
+	"""
+	Queues the deferred decorators of cls on new_cls, a copy of
+	cls made by with_slots, and stubs the same methods on it, so
+	copying a deferred class does not specialize it.
+	"""
+	with LOCK:
+		pending = cls.__dict__.get('__dunder_pending__')
+		if pending is None:
+			return
+		setattr(new_cls, '__dunder_pending__', list(pending))
+		PENDING.add(new_cls)
+		for name, value in list(cls.__dict__.items()):
+			if getattr(value, '__deferred__', False):
+				install(new_cls, name, make_stub(new_cls, name))
+
+def make_stub(
+		owner: Cls,
+		name: str,
+) -> Callable:
+	"""
+	Returns a method that specializes owner and then calls the 
+	generated method name. Stubs are closures rather than 
+	generated functions, so deferring a decorator compiles 
+	nothing.
+	"""
+	def stub(
+			cls: Any,
+			*args: Any,
+			**kwargs: Any,
+	) -> Any:
+		specialize(owner)
+		return getattr(type(cls), name)(cls, *args, **kwargs)
+
+	stub.__name__ = name
+	stub.__source__ = None
+	stub.__deferred__ = True
+	return stub
+
+def specialize(
+		cls: Optional[Cls] = None,
+) -> None:
+	"""
+	Runs the deferred decorators of cls, or of every class with
+	deferred decorators if cls is None, and removes the stubs
+	that were not replaced.
+	"""
+	with LOCK:
+		classes = list(PENDING) if cls is None else [cls]
+		deferring = codegen.DEFERRING.depth
+		codegen.DEFERRING.depth = 0
+		try:
+			for pending_cls in classes:
+				pending = pending_cls.__dict__.get('__dunder_pending__')
+				if pending is None:
+					continue
+				delattr(pending_cls, '__dunder_pending__')
+				PENDING.discard(pending_cls)
+				try:
+					for wrap in pending:
+						wrap(pending_cls)
+				finally:
+					for name, value in list(pending_cls.__dict__.items()):
+						if getattr(value, '__deferred__', False):
+							delattr(pending_cls, name)
+				track(pending_cls)
+		finally:
+			codegen.DEFERRING.depth = deferring
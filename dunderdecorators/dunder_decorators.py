@@ -2,19 +2,26 @@
 By Andy Stokely
 '''
 
-from collections import namedtuple
-from collections.abc import Mapping, Iterable
-from typing import Optional, TypeVar, Hashable, \
-	Dict, Iterable, Union, Tuple, List, Any, Generator
+from __future__ import annotations
 from .exceptions import DunderDecoratorException 
+from .containers import SparseSequence, slice_view
+from .codegen import create_fn, install, install_new, has_instance_dict, \
+	slot_names, attr_expr, attr_assign, raise_line, lock_namespace, \
+	lock_lines, record, slot_namespace, defer, fields_expr, has_slot, \
+	HIDDEN_SLOTS, generated_staticmethod, recorded_option
 
-Cls = TypeVar('User Defined Class')
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, TypeVar, Hashable, Union, Any, Callable
+	Cls = TypeVar('User Defined Class')
 
 
 def dunder_iter(
 		cls: Optional[Cls] = None, 
 		attr: Optional[str] = None,
 		slots: Optional[bool] = None,
+		threadsafe: Optional[Union[bool, str]] = None,
+		native: Optional[bool] = None,
 ) -> Cls:
 	"""
 	Adds an __iter__ special method to the decorated class.
@@ -36,6 +43,20 @@ def dunder_iter(
 		is defined with respect to the class object's dictionary
 		or attribute specified by attr. Defaults to None.
 
+	threadsafe : bool or str, optional
+		If True or "instance", __iter__ takes a snapshot of the
+		items while holding a lock of the object and then
+		iterates over the snapshot, so the lock is not held 
+		while the loop body runs. Defaults to None.
+
+	native : bool, optional
+		If True, __iter__ returns the built-in iterator of the
+		container, e.g. iter(list) or iter(dict.items()), 
+		instead of a generator that yields every item again, 
+		so loops over the object run at the speed of loops over
+		the container. The container is read when iter() is 
+		called rather than on the first next(). Defaults to None.
+
 	Returns
 	-------
 	: User Defined Class
@@ -96,49 +117,263 @@ def dunder_iter(
 	def wrap(
 			cls: Cls,
 	) -> Cls:
-		if attr is None:
-			if slots is None:
-				def __iter__(
-						cls: Cls
-				) -> Generator:
-					if hasattr(cls, '__dict__'):
-						for attr, value in cls.__dict__.items():
-							yield attr, value
+		if defer(cls, wrap, ('__iter__',)):
+			return cls
+		if native:
+			if attr is None:
+				if slots is None:
+					if has_instance_dict(cls):
+						body = ['return iter(cls.__dict__.items())']
 					else:
-						raise DunderDecoratorException(
-							cls, ('dict', 'iter')
-						) 
-				setattr(cls, '__iter__', __iter__)
-			else:
-				def __iter__(
-						cls: Cls
-				) -> Generator:
-					if hasattr(cls, '__slots__'):
-						for attr in cls.__slots__:
-							yield attr, getattr(cls, attr) 
+						body = [raise_line(('dict', 'iter'))]
+				else:
+					names = slot_names(cls)
+					if names is None:
+						body = [raise_line(('slots', 'iter'))]
 					else:
-						raise DunderDecoratorException(
-							cls, ('slots', 'iter')
-						) 
-				setattr(cls, '__iter__', __iter__)
+						body = ['return iter((' + ''.join(
+							f'({name!r}, {attr_expr(name)}), '
+							for name in names
+						) + '))']
+			else:
+				body = [
+					f'iter_attr = {attr_expr(attr)}',
+					'iter_type = type(iter_attr)',
+					'if iter_type is list or iter_type is tuple:',
+					'	return iter(iter_attr)',
+					'if iter_type is dict or isinstance(iter_attr, Mapping):',
+					'	return iter(iter_attr.items())',
+					'if isinstance(iter_attr, Iterable):',
+					'	return iter(iter_attr)',
+					raise_line('iterable', repr(attr)),
+				]
+		elif attr is None:
+			if slots is None:
+				if has_instance_dict(cls):
+					body = ['yield from cls.__dict__.items()']
+				else:
+					body = [raise_line(('dict', 'iter'))]
+			else:
+				names = slot_names(cls)
+				if names is None:
+					body = [raise_line(('slots', 'iter'))]
+				else:
+					body = [
+						f'yield {name!r}, {attr_expr(name)}'
+						for name in names
+					] or ['yield from ()']
 		else:
-			def __iter__(
-					cls: Cls
-			) -> Generator:
-				iter_attr = getattr(cls, attr)
-				if isinstance(iter_attr, Mapping):
-					for key, value in iter_attr.items():
-						yield key, value
-				elif isinstance(iter_attr, Iterable):
-					for i in iter_attr:
-						yield i 
+			body = [
+				f'iter_attr = {attr_expr(attr)}',
+				'if type(iter_attr) is dict or isinstance(iter_attr, Mapping):',
+				'\tyield from iter_attr.items()',
+				'elif type(iter_attr) is list or isinstance(iter_attr, Iterable):',
+				'\tyield from iter_attr',
+				'else:',
+				'\t' + raise_line('iterable', repr(attr)),
+			]
+		fn = create_fn('__iter__', ['cls'], body)
+		if threadsafe:
+			fn = create_fn(
+				'__iter__',
+				['cls'],
+				lock_lines(threadsafe) + [
+					'with lock:',
+					'\titems = list(unlocked(cls))',
+					'return iter(items)',
+				],
+				{'unlocked' : fn, **lock_namespace(cls, threadsafe)}
+			)
+		install(cls, '__iter__', fn)
+		record(
+			cls, dunder_iter, attr=attr, slots=slots, threadsafe=threadsafe,
+			native=native
+		)
+		return cls
+	if cls is None:
+		return wrap 
+	return wrap(cls)
+
+def dunder_aiter(
+		cls: Optional[Cls] = None, 
+		attr: Optional[str] = None,
+		slots: Optional[bool] = None,
+		batch_size: Optional[int] = 64,
+		prefetch: Optional[int] = None,
+		sentinel: Optional[Any] = None,
+		threadsafe: Optional[Union[bool, str]] = None,
+) -> Cls:
+	"""
+	Adds an __aiter__ special method to the decorated class.
+	__aiter__ returns an async generator, which provides 
+	__anext__, so the class object can be used in an 
+	async for loop.
+
+	Parameters
+	---------
+	cls : User Defined Class
+		Class that is decorated
+
+	attr : str, optional
+		Name of class object attribute that __aiter__
+		is defined with repect to. The attribute can be a 
+		mapping, an iterable, an async iterable such as an
+		async generator, or an asyncio.Queue. If None, 
+		dunder_aiter defines __aiter__ with respect to the 
+		class object's __dict__ or __slots__. Defaults to None.
+
+	slots : bool, optional
+		If True, dunder_aiter defines __aiter__ with respect to
+		the class object's __slots__ attribute. Else, __aiter__
+		is defined with respect to the class object's dictionary
+		or attribute specified by attr. Defaults to None.
+
+	batch_size : int, optional
+		Number of items yielded from a synchronous container
+		before control is handed back to the event loop, so
+		iterating over a large container does not block other
+		tasks. Defaults to 64.
+
+	prefetch : int, optional
+		If set and the attribute is an async iterable, a 
+		producer task reads up to prefetch items ahead of the
+		consumer into a bounded queue. The producer waits 
+		while the queue is full, so a slow consumer applies
+		backpressure to the source. Defaults to None.
+
+	sentinel : object, optional
+		If the attribute is an asyncio.Queue, iteration stops
+		when sentinel is taken from the queue. Defaults to None.
+
+	threadsafe : bool or str, optional
+		If True or "instance", the items of a synchronous
+		container are copied while holding a lock of the object
+		and the copy is iterated over. Defaults to None.
+
+	Returns
+	-------
+	: User Defined Class
+
+	Examples
+	--------
+	Add an __aiter__ method to a class and have 
+	it defined with respect to one of the class
+	objects async iterable attributes.
+
+	>>> async def numbers():
+	>>> 	for i in range(3):
+	>>> 		yield i
+	>>> @dunder_aiter(attr='a', prefetch=16)
+	>>> Class A(object):
+	>>>		def __init__(self, a):
+	>>>			self.a = a	
+	>>> async for i in A(numbers()):
+	>>> 	print(i)
+		0
+		1
+		2
+
+	Add an __aiter__ method to a class and have it
+	defined with respect to the class object's 
+	dictionary.
+
+	>>> @dunder_aiter(batch_size=1000)
+	>>> Class A(object):
+	>>>		pass
+	>>> a = A()
+	>>> a.a = 1
+	>>> async for i in a:
+	>>> 	print(i)
+		('a', 1)
+
+	"""
+	def wrap(
+			cls: Cls,
+	) -> Cls:
+		if defer(cls, wrap, ('__aiter__',)):
+			return cls
+		from .streams import sleep, Queue, prefetched, drain
+		if type(batch_size) is not int or batch_size < 1:
+			raise DunderDecoratorException(
+				cls, 'invalid_batch_size', batch_size
+			)
+		if prefetch is not None and (
+				type(prefetch) is not int or prefetch < 1
+		):
+			raise DunderDecoratorException(
+				cls, 'invalid_prefetch', prefetch
+			)
+		namespace = {
+			'sleep' : sleep, 
+			'Queue' : Queue, 
+			'prefetched' : prefetched, 
+			'drain' : drain, 
+			'sentinel' : sentinel,
+		}
+		if threadsafe:
+			namespace.update(lock_namespace(cls, threadsafe))
+		body = []
+		if attr is None:
+			if slots is None:
+				if has_instance_dict(cls):
+					snapshot = ['items = list(cls.__dict__.items())']
 				else:
-					raise DunderDecoratorException(
-						cls, 
-						'iterable', 
-						attr
-					) 
-			setattr(cls, '__iter__', __iter__)
+					snapshot = [raise_line(('dict', 'iter'))]
+			else:
+				names = slot_names(cls)
+				if names is None:
+					snapshot = [raise_line(('slots', 'iter'))]
+				else:
+					snapshot = ['items = [' + ', '.join(
+						f'({name!r}, {attr_expr(name)})'
+						for name in names
+					) + ']']
+		else:
+			if prefetch:
+				source = f'prefetched(container, {prefetch})'
+			else:
+				source = 'container'
+			body = [
+				f'container = {attr_expr(attr)}',
+				'if hasattr(container, "__aiter__"):',
+				f'\tasync for item in {source}:',
+				'\t\tyield item',
+				'\treturn',
+				'if isinstance(container, Queue):',
+				'\tasync for item in drain(container, sentinel):',
+				'\t\tyield item',
+				'\treturn',
+			]
+			snapshot = [
+				'if type(container) is dict or isinstance(container, Mapping):',
+				'\titems = list(container.items())',
+				'elif type(container) is list or isinstance(container, Iterable):',
+				f'\titems = {"list(container)" if threadsafe else "container"}',
+				'else:',
+				'\t' + raise_line('iterable', repr(attr)),
+			]
+		if threadsafe:
+			snapshot = lock_lines(threadsafe) + ['with lock:'] + [
+				f'\t{line}' for line in snapshot
+			]
+		body += snapshot + [
+			'count = 0',
+			'for item in items:',
+			'\tyield item',
+			'\tcount += 1',
+			f'\tif count == {batch_size}:',
+			'\t\tcount = 0',
+			'\t\tawait sleep(0)',
+		]
+		install(
+			cls, 
+			'__aiter__', 
+			create_fn('__aiter__', ['cls'], body, namespace, True)
+		)
+		record(
+			cls, dunder_aiter, attr=attr, slots=slots, batch_size=batch_size,
+			prefetch=prefetch, sentinel=sentinel, threadsafe=threadsafe
+		)
 		return cls
 	if cls is None:
 		return wrap 
@@ -148,9 +383,18 @@ def dunder_setitem(
 		cls: Optional[Cls] = None, 
 		attr: Optional[str] = False, 
 		slots: Optional[bool] = None,
+		growth: Optional[str] = 'inplace',
+		sparse: Optional[bool] = None,
+		ndarray: Optional[bool] = None,
+		threadsafe: Optional[Union[bool, str]] = None,
+		frozen: Optional[bool] = None,
 ) -> Cls:
 	"""
 	Adds a __setitem__ special method to the decorated class.
+	Also adds a set_many method that sets a batch of (key, value)
+	pairs, and an update method that behaves like dict.update.
+	Both resolve the attribute once per batch and are not added
+	if the class already defines them.
 
 	Parameters
 	---------
@@ -165,9 +409,10 @@ def dunder_setitem(
 		If the attribute is an iterable, the key is an index. If the 
 		index is out of bounds, the value is automatically appended to
 		the left or right end of the iterable, depending on the value of
-		the key. If None, dunder_setitem defines __setitem__ with 
-		respect to the class object's __dict__ or __slots__. 
-		Defaults to None.
+		the key. If the key is a slice, the slice of the iterable
+		is assigned in place. If None, dunder_setitem defines 
+		__setitem__ with respect to the class object's __dict__ 
+		or __slots__. Defaults to None.
 
 	slots : bool, optional
 		If True, dunder_setitem defines __setitem__ with respect to
@@ -175,6 +420,49 @@ def dunder_setitem(
 		is defined with respect to the class object's dictionary
 		or attribute specified by attr. Defaults to None.
 
+	growth : str, optional
+		How an iterable attribute grows when the index is out
+		of bounds. If "inplace", the value is appended to the 
+		attribute with its append, appendleft or insert method, 
+		which costs amortized O(1) per append. If "deque", the 
+		attribute is converted to a collections.deque the first
+		time it grows, which makes both appends and prepends O(1).
+		If "rebuild", a new list is built on every out of bounds 
+		write. Attributes without an append method are always 
+		rebuilt. Defaults to "inplace".
+
+	sparse : bool, optional
+		If True, an iterable attribute is converted to a 
+		SparseSequence the first time it is written to, and 
+		values are stored at the written index, however far
+		out of bounds it is. Indices that were never written 
+		read as None and cost no memory. growth is ignored 
+		when sparse is True. Defaults to None.
+
+	ndarray : bool, optional
+		If True, the attribute specified by attr is a NumPy 
+		ndarray and keys are passed to it unchecked, so integer
+		and boolean index arrays, tuples of indices and slices
+		are assigned with NumPy's broadcasting rules. Out of 
+		bounds indices raise NumPy's IndexError. Defaults to 
+		None.
+
+	threadsafe : bool or str, optional
+		If True or "instance", writes hold a lock of the object,
+		so growing a sequence attribute cannot lose concurrent
+		writes. If "key", writes to a mapping are guarded by a 
+		lock chosen by the hash of the key instead, so writes 
+		to different keys rarely contend. Locks are taken from a
+		fixed table shared by the class, and are reentrant. 
+		Defaults to None.
+
+	frozen : bool, optional
+		If True, __setitem__, set_many and update raise a
+		DunderTypeError instead of writing, which makes the
+		items of value objects whose hash is cached by 
+		dunder_hash immutable. The other options are ignored.
+		Defaults to None.
+
 	Returns
 	-------
 	: User Defined Class
@@ -237,131 +525,236 @@ def dunder_setitem(
 	def wrap(
 			cls: Cls,
 	) -> Cls:
-		if attr:
-			def __setitem__(
-					cls: Cls, 
-					key: Hashable, 
-					value: Any,
-			) -> None:
-				if isinstance(
-					key,
-					Hashable
-				): 
-					if hasattr(
-						getattr(cls, attr), 
-						'__getitem__'
-					):
-						if isinstance(
-							getattr(cls, attr), 
-							Mapping
-						):
-							print(True)
-							getattr(cls, attr)[key] = value
-
-						elif isinstance(
-							getattr(cls, attr), 
-							Iterable	
-						):
-							attr_size = len(
-								getattr(cls, attr)
-							) 
-							if key >= 0:
-								if key < attr_size:
-									getattr(cls, attr)[key] = value
-								else:
-									tmp_iterable = [
-										getattr(cls, attr)[i]
-										if i < attr_size else
-										0 for i in range(attr_size + 1)
-									]
-									tmp_iterable[-1] = value	
-									setattr(cls, attr, tmp_iterable)
-							else:
-								abs_index = attr_size + key
-								if abs_index >= 0:
-									getattr(cls, attr)[abs_index] = (
-										value
-									)
-								else:
-									tmp_iterable = [
-										0 if i == 0 
-										else getattr(cls, attr)[i-1]
-										for i in range(attr_size + 1)
-									]	
-									tmp_iterable[0] = value	
-									setattr(cls, attr, tmp_iterable)
-						else:
-							raise DunderDecoratorException(
-								cls, 
-								'attr_not_mapping_or_iterable', 
-								attr
-							)
-					else:
-						raise DunderDecoratorException(
-							cls, 
-							'indexable', 
-							attr
-						) 
-				else:
-					raise DunderDecoratorException(
-						cls, 
-						'key_not_hashable', 
-						key
-					)
-				return
-			setattr(cls, '__setitem__', __setitem__)
+		if defer(cls, wrap, ('__setitem__', 'set_many', 'update')):
+			return cls
+		from collections import deque
+		if frozen:
+			body = [raise_line('frozen', 'key')]
+		elif attr and ndarray:
+			body = [f'{attr_expr(attr)}[key] = value']
+		elif attr and sparse:
+			body = [
+				f'container = {attr_expr(attr)}',
+				'if type(container) is not SparseSequence:',
+				'\tkind = container_kind(container)',
+				'\tif kind == "mapping":',
+				'\t\ttry:',
+				'\t\t\tcontainer[key] = value',
+				'\t\texcept TypeError:',
+				'\t\t\traise_unhashable(cls, key)',
+				'\t\treturn',
+				'\tif kind != "sequence":',
+				'\t\traise DunderDecoratorException(cls, kind, '
+				+ f'{attr!r})',
+				'\tcontainer = SparseSequence(container)',
+				'\t' + attr_assign(attr, 'container'),
+				'try:',
+				'\tcontainer[key] = value',
+				'except IndexError:',
+				'\t' + raise_line(
+					'index_out_of_bounds', repr(attr)
+				) + ' from None',
+			]
+		elif attr:
+			body = [
+				f'container = {attr_expr(attr)}',
+				'if type(container) is not list:',
+				'\tkind = container_kind(container)',
+				'\tif kind == "mapping":',
+				'\t\ttry:',
+				'\t\t\tcontainer[key] = value',
+				'\t\texcept TypeError:',
+				'\t\t\traise_unhashable(cls, key)',
+				'\t\treturn',
+				'\tif kind != "sequence":',
+				'\t\traise DunderDecoratorException(cls, kind, '
+				+ f'{attr!r})',
+				'if type(key) is slice:',
+				'\tcontainer[key] = value',
+				'\treturn',
+				'if type(key) is not int and not isinstance(key, Hashable):',
+				'\t' + raise_line('key_not_hashable', 'key'),
+				'attr_size = len(container)',
+				'if key >= 0:',
+				'\tif key < attr_size:',
+				'\t\tcontainer[key] = value',
+				'\t\treturn',
+				'elif attr_size + key >= 0:',
+				'\tcontainer[attr_size + key] = value',
+				'\treturn',
+			]
+			if growth == 'inplace':
+				body += [
+					'if key >= 0:',
+					'\tif type(container) is list '
+					+ 'or hasattr(container, "append"):',
+					'\t\tcontainer.append(value)',
+					'\telse:',
+					'\t\t' + attr_assign(attr, '[*container, value]'),
+					'elif hasattr(container, "appendleft"):',
+					'\tcontainer.appendleft(value)',
+					'elif type(container) is list '
+					+ 'or hasattr(container, "insert"):',
+					'\tcontainer.insert(0, value)',
+					'else:',
+					'\t' + attr_assign(attr, '[value, *container]'),
+				]
+			elif growth == 'deque':
+				body += [
+					'if type(container) is not deque:',
+					'\tcontainer = deque(container)',
+					'\t' + attr_assign(attr, 'container'),
+					'if key >= 0:',
+					'\tcontainer.append(value)',
+					'else:',
+					'\tcontainer.appendleft(value)',
+				]
+			elif growth == 'rebuild':
+				body += [
+					'if key >= 0:',
+					'\t' + attr_assign(attr, '[*container, value]'),
+					'else:',
+					'\t' + attr_assign(attr, '[value, *container]'),
+				]
+			else:
+				raise DunderDecoratorException(
+					cls,
+					'invalid_growth',
+					growth
+				)
 		else:
 			if slots is None:
-				def __setitem__(
-						cls: Cls, 
-						key: Hashable, 
-						value: Any,
-				) -> None:
-					if isinstance(
-						key,
-						Hashable
-					): 
-						if hasattr(cls, '__dict__'):
-							cls.__dict__[key] = value
-						else:
-							raise DunderDecoratorException(
-								cls, ('dict', 'setitem'), attr
-							)
-					else:
-						raise DunderDecoratorException(
-							cls, 
-							'key_not_hashable', 
-							key
-						)
-					return
-				setattr(
-					cls, 
-					'__setitem__', 
-					__setitem__
-				)
+				if has_instance_dict(cls):
+					body = [
+						'try:',
+						'\tcls.__dict__[key] = value',
+						'except TypeError:',
+						'\traise_unhashable(cls, key)',
+					]
+				else:
+					body = [raise_line(('dict', 'setitem'), repr(attr))]
 			else:
-				def __setitem__(
-						cls: Cls, 
-						key: str, 
-						value: Any,
-				) -> None:
-					if hasattr(cls, '__slots__'):
-						if hasattr(cls, key):
-							setattr(cls, key, value)
-						else:
-							raise DunderDecoratorException(
-								cls, 'slots_immutable', attr
-							)
-					else:
-						raise DunderDecoratorException(
-							cls, ('slots', 'setitem'), attr
-						)
-					return
-				setattr(
-					cls, 
-					'__setitem__', 
-					__setitem__
-				)
+				names = slot_names(cls)
+				if names is None:
+					body = [raise_line(('slots', 'setitem'), repr(attr))]
+				else:
+					body = [
+						'try:',
+						'\tis_slot = key in slot_set',
+						'except TypeError:',
+						'\traise_unhashable(cls, key)',
+						'if is_slot:',
+						'\tsetattr(cls, key, value)',
+						'else:',
+						'\t' + raise_line('slots_immutable', repr(attr)),
+					]
+		setitem = create_fn(
+			'__setitem__', 
+			['cls', 'key', 'value'], 
+			body,
+			{
+				'deque' : deque, 
+				'SparseSequence' : SparseSequence,
+				**slot_namespace(slot_names(cls) or ()),
+			}
+		)
+		if threadsafe and not frozen:
+			setitem = create_fn(
+				'__setitem__',
+				['cls', 'key', 'value'],
+				lock_lines(threadsafe, attr, key=True) + [
+					'with lock:',
+					'\tunlocked(cls, key, value)',
+				],
+				{'unlocked' : setitem, **lock_namespace(cls, threadsafe)}
+			)
+		install(cls, '__setitem__', setitem)
+		many = []
+		if frozen:
+			pass
+		elif attr and ndarray:
+			many = [
+				f'container = {attr_expr(attr)}',
+				'for key, value in pairs:',
+				'\tcontainer[key] = value',
+				'return',
+			]
+		elif attr:
+			many = [
+				f'container = {attr_expr(attr)}',
+				'if type(container) is dict:',
+				'\ttry:',
+				'\t\tcontainer.update(pairs)',
+				'\t\treturn',
+				'\texcept TypeError:',
+				'\t\tpass',
+				'elif type(container) is list:',
+				'\ttry:',
+				'\t\tfor done, (key, value) in enumerate(pairs):',
+				'\t\t\tcontainer[key] = value',
+				'\t\treturn',
+				'\texcept (IndexError, TypeError):',
+				'\t\tpairs = pairs[done:]',
+			]
+		elif slots is None:
+			if has_instance_dict(cls):
+				many = [
+					'try:',
+					'\tcls.__dict__.update(pairs)',
+					'\treturn',
+					'except TypeError:',
+					'\tpass',
+				]
+		else:
+			names = slot_names(cls)
+			if names is not None:
+				many = [
+					'for key, value in pairs:',
+					'\tif type(key) is str and key in slot_set:',
+					'\t\tsetattr(cls, key, value)',
+					'\telse:',
+					'\t\tsetitem(cls, key, value)',
+					'return',
+				]
+		if threadsafe:
+			many = []
+		set_many = create_fn(
+			'set_many',
+			['cls', 'pairs'],
+			[
+				'if type(pairs) is not list and type(pairs) is not tuple:',
+				'\tpairs = list(pairs)',
+			] + many + [
+				'for key, value in pairs:',
+				'\tsetitem(cls, key, value)',
+			],
+			{
+				'setitem' : setitem,
+				**slot_namespace(slot_names(cls) or ()),
+			}
+		)
+		install_new(cls, 'set_many', set_many)
+		install_new(
+			cls,
+			'update',
+			create_fn(
+				'update',
+				['cls', 'other=()', '**kwargs'],
+				[
+					'if hasattr(other, "keys"):',
+					'\tother = [(key, other[key]) for key in other.keys()]',
+					'set_many(cls, other)',
+					'if kwargs:',
+					'\tset_many(cls, kwargs.items())',
+				],
+				{'set_many' : set_many}
+			)
+		)
+		record(
+			cls, dunder_setitem, attr=attr, slots=slots, growth=growth,
+			sparse=sparse, ndarray=ndarray, threadsafe=threadsafe,
+			frozen=frozen
+		)
 		return cls
 	if cls is None:
 		return wrap 
@@ -371,9 +764,18 @@ def dunder_getitem(
 		cls: Optional[Cls] = None, 
 		attr: Optional[str] = False,
 		slots: Optional[bool] = None,
+		ndarray: Optional[bool] = None,
+		threadsafe: Optional[Union[bool, str]] = None,
 ) -> Cls:
 	"""
 	Adds a __getitem__ special method to the decorated class.
+	Also adds a get_many method that looks up a batch of keys
+	and returns a list of their values, and get, has and pop
+	methods that look a key up once and return a default or
+	False instead of raising if the key is missing. get and has
+	never call __missing__. For sequence attributes, keys are
+	indices. ndarray attributes get no pop method. These 
+	methods are not added if the class already defines them.
 
 	Parameters
 	---------
@@ -385,10 +787,12 @@ def dunder_getitem(
 		is defined with repect to. The attribute is required
 		to either be a mapping or an iterable. If the attribute is
 		a mapping, the key used is one of the mapping's hash keys.
-		If the attribute is an iterable, the key is an index. If the 
-		If None, dunder_getitem defines __getitem__ with 
-		respect to the class object's __dict__ or __slots__. 
-		Defaults to None.
+		If the attribute is an iterable, the key is an index or a
+		slice. Slicing returns a zero-copy view of the attribute,
+		a memoryview if the attribute is bytes, a bytearray or an
+		array.array, and a SequenceView otherwise. If None, 
+		dunder_getitem defines __getitem__ with respect to the 
+		class object's __dict__ or __slots__. Defaults to None.
 
 	slots : bool, optional
 		If True, dunder_getitem defines __getitem__ with respect to
@@ -396,6 +800,26 @@ def dunder_getitem(
 		is defined with respect to the class object's dictionary
 		or attribute specified by attr. Defaults to None.
 
+	ndarray : bool, optional
+		If True, the attribute specified by attr is a NumPy 
+		ndarray and keys are passed to it unchecked, so integer
+		and boolean index arrays, tuples of indices and slices
+		return whatever NumPy returns for them. Out of bounds 
+		indices raise NumPy's IndexError. Defaults to None.
+
+	threadsafe : bool or str, optional
+		If set, reads are lock-free and only a miss that calls 
+		__missing__ takes a lock, after which the key is probed
+		again, so two threads missing the same key insert one
+		value. If dunder_missing was applied with threadsafe
+		set, __missing__ takes the lock itself, see
+		dunder_missing. Else __getitem__ takes it around the
+		call of __missing__, and for classes with maxsize or
+		ttl, whose hits must update the eviction tracker,
+		around every lookup. "key" locks by the hash of the key
+		for mappings, True or "instance" locks the whole object.
+		Defaults to None.
+
 	Returns
 	-------
 	: User Defined Class
@@ -413,6 +837,10 @@ def dunder_getitem(
 	>>> a.a = 1
 	>>> print(a['a'])
 		1
+	>>> print(a.get('b', 0), a.has('a'))
+		0 True
+	>>> print(a.pop('a'), a.has('a'))
+		1 False
 	
 	Add a __getitem__ method to a class and have 
 	it defined with respect to one of the class
@@ -455,193 +883,455 @@ def dunder_getitem(
 	def wrap(
 			cls: Cls,
 	) -> Cls:
-		if attr:
+		if defer(cls, wrap, ('__getitem__', 'get_many', 'get', 'has', 'pop')):
+			return cls
+		tracked = (
+			hasattr(cls, '__missing__') 
+			and has_slot(cls, '__dunder_cache__')
+		)
+		if tracked:
+			hit = [
+				'try:',
+				'\tcache = cls.__dunder_cache__',
+				'except AttributeError:',
+				'\treturn value',
+				'if cache.touch(key):',
+				'\treturn value',
+			]
+		else:
+			hit = ['return value']
+		if tracked:
+			miss = ['return cls.__missing__(key)']
+		elif attr:
+			miss = ['cls.__missing__(key)', f'return {attr_expr(attr)}[key]']
+		else:
+			miss = ['cls.__missing__(key)', 'return cls.__dict__[key]']
+		if attr and ndarray:
+			body = [f'return {attr_expr(attr)}[key]']
+		elif attr:
 			if hasattr(cls, '__missing__'):
-				def __getitem__(
-						cls: Cls, 
-						key: Hashable
-				) -> Any:
-					if isinstance(
-						key,
-						Hashable
-					): 
-						if hasattr(
-							getattr(cls, attr), 
-							'keys'
-						):
-							if key in getattr(cls, attr).keys():
-								return getattr(cls, attr)[key]
-							cls.__missing__(key)
-							return getattr(cls, attr)[key]
-						else:
-							raise DunderDecoratorException(
-								cls, 
-								'no_keys_method', 
-								attr
-							)
-					else:
-						raise DunderDecoratorException(
-							cls, 
-							'key_not_hashable', 
-							key	
-						)
-				setattr(cls, '__getitem__', __getitem__)
+				body = [
+					f'container = {attr_expr(attr)}',
+					'if type(container) is dict:',
+					'\ttry:',
+					'\t\tvalue = container.get(key, MISSING)',
+					'\texcept TypeError:',
+					'\t\traise_unhashable(cls, key)',
+					'\tif value is not MISSING:',
+				] + ['\t\t' + line for line in hit] + [
+					'else:',
+					'\tif not isinstance(key, Hashable):',
+					'\t\t' + raise_line('key_not_hashable', 'key'),
+					'\tif not hasattr(container, "keys"):',
+					'\t\t' + raise_line('no_keys_method', repr(attr)),
+					'\tif key in container.keys():',
+					'\t\tvalue = container[key]',
+				] + ['\t\t' + line for line in hit] + miss
 			else:
-				def __getitem__(
-						cls: Cls, 
-						key: Hashable
-				) -> Any:
-					if isinstance(
-						key,
-						Hashable
-					): 
-						if hasattr(
-							getattr(cls, attr), 
-							'__getitem__'
-						):
-							if isinstance(
-								getattr(cls, attr), 
-								Mapping
-							):
-								if key in getattr(cls, attr):
-									return getattr(cls, attr)[key]
-								else:
-									raise DunderDecoratorException(
-										cls, 
-										'key_not_found', 
-										attr
-									)
-							elif isinstance(
-								getattr(cls, attr), 
-								Iterable	
-							):
-								if key < len(getattr(cls, attr)):
-									return getattr(cls, attr)[key]
-								else:
-									raise DunderDecoratorException(
-										cls, 
-										'index_out_of_bounds', 
-										attr
-									)
-						else:
-							raise DunderDecoratorException(
-								cls, 
-								'indexable', 
-								attr
-							) 
-					else:
-						raise DunderDecoratorException(
-							cls, 
-							'key_not_hashable', 
-							key	
-						)
-				setattr(cls, '__getitem__', __getitem__)
+				body = [
+					f'container = {attr_expr(attr)}',
+					'if type(container) is dict:',
+					'\ttry:',
+					'\t\tvalue = container.get(key, MISSING)',
+					'\texcept TypeError:',
+					'\t\traise_unhashable(cls, key)',
+					'\tif value is not MISSING:',
+					'\t\treturn value',
+					'\t' + raise_line('key_not_found', repr(attr)),
+					'if type(container) is not list:',
+					'\tkind = container_kind(container)',
+					'\tif kind == "mapping":',
+					'\t\tif not isinstance(key, Hashable):',
+					'\t\t\t' + raise_line('key_not_hashable', 'key'),
+					'\t\tif key in container:',
+					'\t\t\treturn container[key]',
+					'\t\t' + raise_line('key_not_found', repr(attr)),
+					'\tif kind != "sequence":',
+					'\t\traise DunderDecoratorException(cls, kind, '
+					+ f'{attr!r})',
+					'if type(key) is slice:',
+					'\treturn slice_view(container, key)',
+					'try:',
+					'\treturn container[key]',
+					'except IndexError:',
+					'\t' + raise_line(
+						'index_out_of_bounds', repr(attr)
+					) + ' from None',
+				]
 		else:
 			if hasattr(cls, '__missing__'):
 				if slots is None:
-					def __getitem__(
-							cls: Cls, 
-							key: Hashable
-					) -> Any:
-						if hasattr(cls, '__dict__'):
-							if isinstance(
-								key,
-								Hashable
-							): 
-								if key in cls.__dict__.keys():
-									return cls.__dict__[key]
-								cls.__missing__(key)
-								return cls.__dict__[key]
-							else:
-								raise DunderDecoratorException(
-									cls, 
-									'key_not_hashable', 
-									key	
-								)
-						else:
-							raise DunderDecoratorException(
-								cls,
-								('dict', 'getitem'),
-								attr
-							)
+					if has_instance_dict(cls):
+						body = [
+							'try:',
+							'\tvalue = cls.__dict__.get(key, MISSING)',
+							'except TypeError:',
+							'\traise_unhashable(cls, key)',
+							'if value is not MISSING:',
+						] + ['\t' + line for line in hit] + miss
+					else:
+						body = [
+							raise_line(('dict', 'getitem'), repr(attr))
+						]
 				else:
 					raise DunderDecoratorException(
 						cls, 
 						'missing_with_slots', 
 						attr
 					)
-				setattr(cls, '__getitem__', __getitem__)
 			else:
 				if slots is None:
-					def __getitem__(
-							cls: Cls, 
-							key: Hashable,
-					) -> Any:
-						if hasattr(cls, '__dict__'):
-							if isinstance(
-								key,
-								Hashable
-							): 
-								if key in cls.__dict__.keys():
-									return cls.__dict__[key]
-								else:
-									raise DunderDecoratorException(
-										cls, 
-										'key_not_in_obj_dict', 
-										key	
-									)
-							else:
-								raise DunderDecoratorException(
-									cls, 
-									'key_not_hashable', 
-									key	
-								)
-						else:
-							raise DunderDecoratorException(
-								cls,
-								('dict', 'getitem'),
-								attr
-							)
-					setattr(
-						cls, 
-						'__getitem__', 
-						__getitem__
-					)
+					if has_instance_dict(cls):
+						body = [
+							'try:',
+							'\treturn cls.__dict__[key]',
+							'except KeyError:',
+							'\t' + raise_line(
+								'key_not_in_obj_dict', 'key'
+							) + ' from None',
+							'except TypeError:',
+							'\traise_unhashable(cls, key)',
+						]
+					else:
+						body = [
+							raise_line(('dict', 'getitem'), repr(attr))
+						]
 				else:
-					def __getitem__(
-							cls: Cls, 
-							key: Hashable,
-					) -> Any:
-						if hasattr(cls, '__slots__'):
-							if isinstance(
-								key,
-								Hashable
-							): 
-								if key in cls.__slots__:
-									return getattr(cls, key) 
-								else:
-									raise DunderDecoratorException(
-										cls, 
-										'key_not_in_obj_slots', 
-										key	
-									)
-							else:
-								raise DunderDecoratorException(
-									cls, 
-									'key_not_hashable', 
-									key	
-								)
-						else:
-							raise DunderDecoratorException(
-								cls,
-								('slots', 'getitem'),
-								attr
-							)
-					setattr(
-						cls, 
-						'__getitem__', 
-						__getitem__
-					)
+					names = slot_names(cls)
+					if names is None:
+						body = [
+							raise_line(('slots', 'getitem'), repr(attr))
+						]
+					else:
+						body = [
+							'try:',
+							'\tis_slot = key in slot_set',
+							'except TypeError:',
+							'\traise_unhashable(cls, key)',
+							'if is_slot:',
+							'\treturn getattr(cls, key)',
+							raise_line('key_not_in_obj_slots', 'key'),
+						]
+		getitem = create_fn(
+			'__getitem__', 
+			['cls', 'key'], 
+			body,
+			{
+				'slice_view' : slice_view,
+				**slot_namespace(slot_names(cls) or ()),
+			}
+		)
+		locked_missing = (
+			hasattr(cls, '__missing__')
+			and recorded_option(cls, dunder_missing, 'threadsafe')
+		)
+		if threadsafe and not ndarray and locked_missing:
+			lock_namespace(cls, threadsafe)
+		elif threadsafe and not ndarray and hasattr(cls, '__missing__'):
+			if tracked:
+				probe = []
+			elif attr:
+				probe = [
+					f'container = {attr_expr(attr)}',
+					'if type(container) is dict:',
+					'\ttry:',
+					'\t\tvalue = container.get(key, MISSING)',
+					'\texcept TypeError:',
+					'\t\traise_unhashable(cls, key)',
+					'\tif value is not MISSING:',
+					'\t\treturn value',
+				]
+			elif has_instance_dict(cls):
+				probe = [
+					'try:',
+					'\tvalue = cls.__dict__.get(key, MISSING)',
+					'except TypeError:',
+					'\traise_unhashable(cls, key)',
+					'if value is not MISSING:',
+					'\treturn value',
+				]
+			else:
+				probe = []
+			getitem = create_fn(
+				'__getitem__',
+				['cls', 'key'],
+				probe + lock_lines(threadsafe, attr, key=True) + [
+					'with lock:',
+					'\treturn unlocked(cls, key)',
+				],
+				{'unlocked' : getitem, **lock_namespace(cls, threadsafe)}
+			)
+		elif threadsafe:
+			lock_namespace(cls, threadsafe)
+		install(cls, '__getitem__', getitem)
+		many = []
+		if tracked:
+			pass
+		elif attr and ndarray:
+			many = [
+				f'container = {attr_expr(attr)}',
+				'return [container[key] for key in keys]',
+			]
+		elif attr:
+			many = [
+				f'container = {attr_expr(attr)}',
+				'if type(container) is dict or type(container) is list:',
+				'\ttry:',
+				'\t\treturn [',
+				'\t\t\tcontainer[key] if type(key) is not slice',
+				'\t\t\telse getitem(cls, key) for key in keys',
+				'\t\t]',
+				'\texcept (KeyError, IndexError, TypeError):',
+				'\t\tpass',
+			]
+		elif slots is None:
+			if has_instance_dict(cls):
+				many = [
+					'obj_dict = cls.__dict__',
+					'try:',
+					'\treturn [obj_dict[key] for key in keys]',
+					'except (KeyError, TypeError):',
+					'\tpass',
+				]
+		else:
+			names = slot_names(cls)
+			if names is not None:
+				many = [
+					'try:',
+					'\tif slot_set.issuperset(keys):',
+					'\t\treturn [getattr(cls, key) for key in keys]',
+					'except TypeError:',
+					'\tpass',
+				]
+		install_new(
+			cls,
+			'get_many',
+			create_fn(
+				'get_many',
+				['cls', 'keys'],
+				[
+					'if type(keys) is not list and type(keys) is not tuple:',
+					'\tkeys = list(keys)',
+				] + many + [
+					'return [getitem(cls, key) for key in keys]',
+				],
+				{
+					'getitem' : getitem, 
+					**slot_namespace(slot_names(cls) or ()),
+				}
+			)
+		)
+		if attr and ndarray:
+			lookups = {
+				'get' : [
+					'try:',
+					f'\treturn {attr_expr(attr)}[key]',
+					'except IndexError:',
+					'\treturn default',
+				],
+				'has' : [
+					'try:',
+					f'\t{attr_expr(attr)}[key]',
+					'except IndexError:',
+					'\treturn False',
+					'return True',
+				],
+			}
+		elif attr:
+			resolve = [
+				f'container = {attr_expr(attr)}',
+				'if type(container) is dict:',
+				'\tkind = "mapping"',
+				'elif type(container) is list:',
+				'\tkind = "sequence"',
+				'else:',
+				'\tkind = container_kind(container)',
+				'\tif kind != "mapping" and kind != "sequence":',
+				'\t\traise DunderDecoratorException(cls, kind, '
+				+ f'{attr!r})',
+			]
+			in_bounds = (
+				'isinstance(key, int) '
+				+ 'and -len(container) <= key < len(container)'
+			)
+			lookups = {
+				'get' : resolve + [
+					'if kind == "mapping":',
+					'\ttry:',
+					'\t\tif type(container) is dict:',
+					'\t\t\treturn container.get(key, default)',
+					'\t\treturn container[key] if key in container else default',
+					'\texcept TypeError:',
+					'\t\traise_unhashable(cls, key)',
+					f'if {in_bounds}:',
+					'\treturn container[key]',
+					'return default',
+				],
+				'has' : resolve + [
+					'if kind == "mapping":',
+					'\ttry:',
+					'\t\treturn key in container',
+					'\texcept TypeError:',
+					'\t\traise_unhashable(cls, key)',
+					f'return {in_bounds}',
+				],
+				'pop' : resolve + [
+					'if kind == "mapping":',
+					'\ttry:',
+					'\t\tvalue = container.pop(key, MISSING)',
+					'\texcept TypeError:',
+					'\t\traise_unhashable(cls, key)',
+					'\tif value is not MISSING:',
+					'\t\treturn value',
+					'\tif default is MISSING:',
+					'\t\t' + raise_line('key_not_found', repr(attr)),
+					'\treturn default',
+					f'if {in_bounds}:',
+					'\tif type(container) is list:',
+					'\t\treturn container.pop(key)',
+					'\tvalue = container[key]',
+					'\tdel container[key]',
+					'\treturn value',
+					'if default is MISSING:',
+					'\t' + raise_line('index_out_of_bounds', repr(attr)),
+					'return default',
+				],
+			}
+		elif slots is None:
+			if has_instance_dict(cls):
+				lookups = {
+					'get' : [
+						'try:',
+						'\treturn cls.__dict__.get(key, default)',
+						'except TypeError:',
+						'\traise_unhashable(cls, key)',
+					],
+					'has' : [
+						'try:',
+						'\treturn key in cls.__dict__',
+						'except TypeError:',
+						'\traise_unhashable(cls, key)',
+					],
+					'pop' : [
+						'try:',
+						'\tvalue = cls.__dict__.pop(key, MISSING)',
+						'except TypeError:',
+						'\traise_unhashable(cls, key)',
+						'if value is not MISSING:',
+						'\treturn value',
+						'if default is MISSING:',
+						'\t' + raise_line('key_not_in_obj_dict', 'key'),
+						'return default',
+					],
+				}
+			else:
+				lookups = {}
+		elif slot_names(cls) is not None:
+			is_slot = [
+				'try:',
+				'\tis_slot = key in slot_set',
+				'except TypeError:',
+				'\traise_unhashable(cls, key)',
+			]
+			lookups = {
+				'get' : is_slot + [
+					'if is_slot:',
+					'\treturn getattr(cls, key, default)',
+					'return default',
+				],
+				'has' : is_slot + [
+					'return is_slot and hasattr(cls, key)',
+				],
+				'pop' : is_slot + [
+					'if is_slot:',
+					'\tvalue = getattr(cls, key, MISSING)',
+					'\tif value is not MISSING:',
+					'\t\tdelattr(cls, key)',
+					'\t\treturn value',
+					'if default is MISSING:',
+					'\t' + raise_line('key_not_in_obj_slots', 'key'),
+					'return default',
+				],
+			}
+		else:
+			lookups = {}
+		if tracked and lookups:
+			checked = [
+				'try:',
+				'\tcache = cls.__dunder_cache__',
+				'except AttributeError:',
+				'\treturn {1}',
+				'if cache.{0}(key):',
+				'\treturn {1}',
+			]
+			if attr:
+				probe = resolve + [
+					'if kind == "mapping":',
+					'\ttry:',
+					'\t\tif type(container) is dict:',
+					'\t\t\tvalue = container.get(key, MISSING)',
+					'\t\telse:',
+					'\t\t\tvalue = container[key] if key in container else MISSING',
+					'\texcept TypeError:',
+					'\t\traise_unhashable(cls, key)',
+					'\tif value is not MISSING:',
+				]
+				indent = '\t\t'
+			else:
+				probe = [
+					'try:',
+					'\tvalue = cls.__dict__.get(key, MISSING)',
+					'except TypeError:',
+					'\traise_unhashable(cls, key)',
+					'if value is not MISSING:',
+				]
+				indent = '\t'
+			lookups['get'] = probe + [
+				indent + line.format('touch', 'value') for line in checked
+			] + [indent[1:] + 'return default']
+			lookups['has'] = probe + [
+				indent + line.format('touch', 'True') for line in checked
+			] + [indent[1:] + 'return False']
+			if attr:
+				lookups['get'] += [
+					f'if {in_bounds}:',
+					'\treturn container[key]',
+					'return default',
+				]
+				lookups['has'] += [f'return {in_bounds}']
+			pop = lookups['pop']
+			i = pop.index(indent[1:] + 'if value is not MISSING:') + 1
+			pop[i:i + 1] = [
+				indent + line.format('discard', 'value') for line in checked
+			]
+		defaults = {
+			'get' : ['default=None'], 
+			'has' : [], 
+			'pop' : ['default=MISSING'],
+		}
+		for name, body in lookups.items():
+			args = ['cls', 'key'] + defaults[name]
+			fn = create_fn(
+				name, 
+				args, 
+				body, 
+				slot_namespace(slot_names(cls) or ())
+			)
+			if threadsafe and name == 'pop':
+				fn = create_fn(
+					name,
+					args,
+					lock_lines(threadsafe, attr, key=True) + [
+						'with lock:',
+						'\treturn unlocked(cls, key, default)',
+					],
+					{'unlocked' : fn, **lock_namespace(cls, threadsafe)}
+				)
+			install_new(cls, name, fn)
+		record(
+			cls, dunder_getitem, attr=attr, slots=slots, ndarray=ndarray,
+			threadsafe=threadsafe
+		)
 		return cls
 	if cls is None:
 		return wrap 
@@ -651,6 +1341,14 @@ def dunder_missing(
 		cls: Optional[Cls] = None, 
 		attr: Optional[str] = False,
 		default_value: Optional[Any] = None,	
+		default_factory: Optional[Callable[[], Any]] = None,
+		compute: Optional[Callable[[Hashable], Any]] = None,
+		threadsafe: Optional[Union[bool, str]] = None,
+		maxsize: Optional[int] = None,
+		policy: Optional[str] = 'lru',
+		ttl: Optional[Union[float, Callable[[Hashable], float]]] = None,
+		clock: Optional[Callable[[], float]] = None,
+		sweep: Optional[float] = None,
 ) -> Any:
 	"""
 	Adds a __missing__ special method to the decorated class.
@@ -672,8 +1370,79 @@ def dunder_missing(
 	default_value : Any, optional
 		Value that is mapped to the "non-existent" key __missing__
 		adds to the class object's dictionary or mapping attribute
-		specified by attr. Defaults to None. 
+		specified by attr. The same object is mapped to every
+		missing key. Defaults to None. 
+
+	default_factory : callable, optional
+		Called without arguments on every miss to build a new
+		default value, so missing keys do not share a mutable
+		default. Cannot be combined with default_value or
+		compute. Defaults to None.
+
+	compute : callable, optional
+		Called with the missing key on every miss and the 
+		result is mapped to the key, so the decorated object
+		can be used as a memoizing cache. Cannot be combined
+		with default_value or default_factory. Defaults to None.
 
+	threadsafe : bool or str, optional
+		If set, __missing__ inserts the default while holding
+		the same lock dunder_setitem and dunder_getitem use with
+		the same setting. "key" locks by the hash of the key for
+		mappings, True or "instance" locks the whole object.
+		default_factory and compute are called before the lock
+		is taken, so they can use the object. If another thread
+		inserted the key in the meantime, its value is kept and
+		the computed one is dropped, so they may be called more
+		than once for a key, but one value is inserted.
+		Defaults to None.
+
+	maxsize : int, optional
+		If set, at most maxsize keys inserted by __missing__
+		are kept per object, and inserting another one evicts 
+		one of them, chosen by policy, from the object's 
+		dictionary or mapping attribute. Keys that were not
+		inserted by __missing__ are never evicted. The keys 
+		are tracked in a hidden __dunder_cache__ slot, and if 
+		the class does not have the slot, the decorated class
+		is replaced with a copy that adds it, see Notes.
+		Defaults to None.
+
+	policy : str, optional
+		Which key is evicted when maxsize is reached. If "lru",
+		the least recently used key, if "lfu", the least 
+		frequently used key. Keys are used when __missing__ 
+		inserts them and when __getitem__ or get_many of 
+		dunder_getitem, which must be applied after 
+		dunder_missing, returns them. Defaults to "lru".
+
+	ttl : float or callable, optional
+		If set, keys inserted by __missing__ expire ttl seconds
+		after they were inserted, and __getitem__ calls 
+		__missing__ again when it finds an expired key, so the
+		value is recomputed. If ttl is callable, it is called 
+		with the key and returns the ttl of the key, or None if
+		the key does not expire. The get, has and pop methods
+		of dunder_getitem and dunder_contains treat expired 
+		keys as missing. Like maxsize, ttl adds a hidden 
+		__dunder_cache__ slot. Defaults to None.
+
+	clock : callable, optional
+		Called without arguments to get the current time in 
+		seconds. Tests can pass a fake clock to expire keys 
+		without waiting. Defaults to time.monotonic.
+
+	sweep : float, optional
+		If set, a daemon thread removes the expired keys of 
+		every object of the class each sweep seconds, so keys
+		that are never looked up again do not stay in memory. 
+		The thread exits once every object was garbage 
+		collected. Requires ttl and threadsafe, since the thread
+		removes keys while other threads use the object. It 
+		removes each key while holding the locks threadsafe 
+		methods take, so every decorator that reads the object,
+		e.g. dunder_iter or dunder_repr, should set threadsafe 
+		too. Defaults to None.
 
 	Returns
 	-------
@@ -734,69 +1503,222 @@ def dunder_missing(
 	>>> print(a.a)
 		{'a' : 1, 'b' : [1, 2, 3, 4, 5]}
 
+	Add a __missing__ method to a class that computes
+	the value of a missing key the first time it is
+	looked up.
+
+	>>> @dunder_getitem(attr='a')
+	>>> @dunder_missing(attr='a', compute=lambda key: key ** 2)
+	>>> Class A(object):
+	>>>		def __init__(self):
+	>>>			self.a = {}	
+	>>> a = A()
+	>>> print(a[4])
+		16
+	>>> print(a.a)
+		{4 : 16}
+
+	Bound the number of computed values a class keeps, so the
+	decorated object can be used as an LRU cache.
+
+	>>> @dunder_getitem(attr='a')
+	>>> @dunder_missing(attr='a', compute=lambda key: key ** 2, maxsize=2)
+	>>> Class A(object):
+	>>>		def __init__(self):
+	>>>			self.a = {}	
+	>>> a = A()
+	>>> a[2], a[3], a[2], a[4]
+	>>> print(a.a)
+		{2 : 4, 4 : 16}
+
+	Notes
+	-----
+	If maxsize or ttl is set and the class does not declare
+	the __dunder_cache__ slot, dunder_missing returns a new
+	class, not the class it was given. The copy is created by
+	calling the metaclass, so
+	__init_subclass__ of the base classes runs again, class
+	keyword arguments are not passed again, and references
+	to the class taken before it was decorated, e.g. by a
+	registry, name the old class, whose instances are not
+	instances of the copy. Declare the slot to keep the class,
+	e.g. __slots__ = ('__dict__', '__dunder_cache__'). Inside a
+	deferred() block, the copy stays deferred.
+
 	"""
 	def wrap(
 			cls: Cls,
 	) -> Cls:
-		setattr(
-			cls, 
-			'__default_value', 
-			default_value 
-		)
+		if maxsize is not None:
+			if type(maxsize) is not int or maxsize < 1:
+				raise DunderDecoratorException(
+					cls, 'invalid_maxsize', maxsize
+				)
+		if ttl is not None and not callable(ttl) and (
+				type(ttl) not in (int, float) or ttl <= 0
+		):
+			raise DunderDecoratorException(cls, 'invalid_ttl', ttl)
+		if sweep is not None and (
+				ttl is None
+				or not threadsafe
+				or type(sweep) not in (int, float)
+				or sweep <= 0
+		):
+			raise DunderDecoratorException(cls, 'invalid_sweep', sweep)
+		tracked = maxsize is not None or ttl is not None
+		if tracked:
+			from .slots import with_hidden_slot
+			cls = with_hidden_slot(cls, '__dunder_cache__')
+		names = ('__missing__', '__setstate__') if tracked else ('__missing__',)
+		if defer(cls, wrap, names):
+			return cls
+		defaults = [
+			option for option in (default_value, default_factory, compute)
+			if option is not None
+		]
+		if len(defaults) > 1:
+			raise DunderDecoratorException(cls, 'conflicting_defaults')
+		namespace = {}
+		if default_factory is not None:
+			value = 'default_factory()'
+			namespace['default_factory'] = default_factory
+		elif compute is not None:
+			value = 'compute(key)'
+			namespace['compute'] = compute
+		else:
+			value = 'cls.__default_value'
+			setattr(
+				cls, 
+				'__default_value', 
+				default_value 
+			)
+		tracked = tracked and bool(attr or has_instance_dict(cls))
+		if threadsafe:
+			found = ['return container[key]']
+			if tracked:
+				found = [
+					'try:',
+					'\tcache = cls.__dunder_cache__',
+					'except AttributeError:',
+					'\treturn container[key]',
+					'if cache.touch(key):',
+					'\treturn container[key]',
+				]
+			insert = [
+				'try:',
+				'\tfound = key in container',
+				'except TypeError:',
+				'\traise_unhashable(cls, key)',
+				'if found:',
+			] + [f'\t{line}' for line in found] + [
+				'container[key] = value',
+			]
+			if not tracked:
+				insert += ['return value']
+		else:
+			insert = [
+				f'value = {value}',
+				'try:',
+				'\tcontainer[key] = value',
+				'except TypeError:',
+				'\traise_unhashable(cls, key)',
+			]
 		if attr:
-			def __missing__(
-					cls: Cls, 
-					key: Hashable,
-			) ->None:
-				if hasattr(getattr(cls, attr), '__getitem__'):
-					if isinstance(
-						key,
-						Hashable
-					): 
-						getattr(cls, attr)[key] = (
-							cls.__default_value
-						)
-						return
-					else:
-						raise DunderDecoratorException(
-							cls, 
-							'key_not_hashable', 
-							key	
-						)
-				else:
-					raise DunderDecoratorException(
-						cls, 
-						'indexable', 
-						attr
-					) 
-			setattr(cls, '__missing__', __missing__)
+			body = [
+				f'container = {attr_expr(attr)}',
+				'if type(container) is not dict '
+				+ 'and not hasattr(container, "__getitem__"):',
+				'\t' + raise_line('indexable', repr(attr)),
+			] + insert
 		else:
-			def __missing__(
-					cls: Cls, 
-					key: Hashable,
-			) ->None:
-				if hasattr(cls, '__dict__'):
-					if isinstance(
-						key,
-						Hashable
-					): 
-						cls.__dict__[key] = (
-							cls.__default_value
-						)
-					else:
-						raise DunderDecoratorException(
-							cls, 
-							'key_not_hashable', 
-							key	
-						)
-				else:
-					raise DunderDecoratorException(
-						cls,
-						('dict', 'missing'),
-						attr
-					)
-				return
-			setattr(cls, '__missing__', __missing__)
+			if has_instance_dict(cls):
+				body = ['container = cls.__dict__'] + insert
+			else:
+				body = [raise_line(('dict', 'missing'), repr(attr))]
+		if tracked:
+			from .eviction import POLICIES, Tracker, Sweeper
+			from .locks import locks_for
+			if policy not in POLICIES:
+				raise DunderDecoratorException(cls, 'invalid_policy', policy)
+			if clock is None:
+				from time import monotonic
+			body += [
+				'try:',
+				'\tcache = cls.__dunder_cache__',
+				'except AttributeError:',
+				'\tcache = cls.__dunder_cache__ = '
+				+ 'Tracker(maxsize, ttl, clock, sweeper, stripes, cls, by_key)',
+				'cache.add(key, container)',
+				'return value',
+			]
+			namespace.update({
+				'Tracker' : Tracker if maxsize is None else POLICIES[policy],
+				'maxsize' : maxsize,
+				'ttl' : ttl,
+				'clock' : monotonic if clock is None else clock,
+				'sweeper' : None if sweep is None else Sweeper(sweep),
+				'stripes' : locks_for(cls) if threadsafe else None,
+				'by_key' : threadsafe == 'key',
+			})
+		if threadsafe:
+			fn = create_fn(
+				'__missing__',
+				['cls', 'key'],
+				lock_lines(threadsafe, attr, key=True) + [
+					f'value = {value}',
+					'with lock:',
+					'\treturn unlocked(cls, key, value)',
+				],
+				{
+					'unlocked' : create_fn(
+						'__missing__', ['cls', 'key', 'value'], body, namespace
+					),
+					**namespace,
+					**lock_namespace(cls, threadsafe),
+				}
+			)
+		else:
+			fn = create_fn('__missing__', ['cls', 'key'], body, namespace)
+		install(cls, '__missing__', fn)
+		if tracked:
+			install_new(
+				cls,
+				'__setstate__',
+				create_fn(
+					'__setstate__',
+					['cls', 'state'],
+					[
+						'slots = None',
+						'if type(state) is tuple:',
+						'\tstate, slots = state',
+						'if state:',
+						'\tcls.__dict__.update(state)',
+						'if not slots:',
+						'\treturn',
+						'keys = ()',
+						'for name, value in slots.items():',
+						'\tif name == "__dunder_cache__":',
+						'\t\tkeys = value',
+						'\telse:',
+						'\t\tsetattr(cls, name, value)',
+						'if not keys:',
+						'\treturn',
+						f'container = {attr_expr(attr) if attr else "cls.__dict__"}',
+						'cache = cls.__dunder_cache__ = '
+						+ 'Tracker(maxsize, ttl, clock, sweeper, stripes, cls, by_key)',
+						'for key in keys:',
+						'\tif key in container:',
+						'\t\tcache.add(key, container)',
+					],
+					namespace,
+				)
+			)
+		record(
+			cls, dunder_missing, attr=attr, default_value=default_value,
+			default_factory=default_factory, compute=compute,
+			threadsafe=threadsafe, maxsize=maxsize, policy=policy, ttl=ttl,
+			clock=clock, sweep=sweep
+		)
 		return cls
 	if cls is None:
 		return wrap 
@@ -805,6 +1727,7 @@ def dunder_missing(
 def dunder_repr(
 		cls: Optional[Cls] = None, 
 		slots: Optional[bool] = None,
+		threadsafe: Optional[Union[bool, str]] = None,
 ) -> str:
 	"""
 	Adds a __repr__ special method to the decorated class.
@@ -820,6 +1743,10 @@ def dunder_repr(
 		is defined with respect to the class object's dictionary.
 		Defaults to None.
 
+	threadsafe : bool or str, optional
+		If True or "instance", __repr__ reads the fields while
+		holding a lock of the object. Defaults to None.
+
 	Returns
 	-------
 	: str 
@@ -869,53 +1796,615 @@ def dunder_repr(
 	def wrap(
 			cls: Cls,
 	) -> Cls:
+		if defer(cls, wrap, ('__repr__',)):
+			return cls
 		if slots is None:
-			def __repr__(cls) -> Dict:
-				if hasattr(cls, '__dict__'):
-					repr_cls_dict = {
-						(
-							attr if not str(attr)[0].isdigit() 
-							else f'{attr.__class__.__name__}_{attr}'
-						) : value for attr, value 
-						in cls.__dict__.items()
-					}
-					ReprNamedTuple = namedtuple(
-						cls.__class__.__name__, 
-						repr_cls_dict
-					)
-					repr_namedtuple = ReprNamedTuple(
-						**repr_cls_dict
-					)
-					return str(repr_namedtuple)
-				else:
-					raise DunderDecoratorException(
-						cls,
-						('dict', 'repr'),
-					)
-			setattr(cls, '__repr__', __repr__)
+			if has_instance_dict(cls):
+				body = [
+					'fields = ", ".join([',
+					'\tf"{repr_field_name(attr)}={value!r}"',
+					'\tfor attr, value in cls.__dict__.items()',
+					'])',
+					'return f"{cls.__class__.__name__}({fields})"',
+				]
+			else:
+				body = [raise_line(('dict', 'repr'))]
 		else:
-			def __repr__(cls) -> Dict:
-				if hasattr(cls, '__slots__'):
-					repr_cls_dict = {
-						attr : getattr(cls, attr) 
-						for attr in cls.__slots__
-					}
-					ReprNamedTuple = namedtuple(
-						cls.__class__.__name__, 
-						repr_cls_dict
-					)
-					repr_namedtuple = ReprNamedTuple(
-						**repr_cls_dict
-					)
-					return str(repr_namedtuple)
-				else:
-					raise DunderDecoratorException(
-						cls,
-						('slots', 'repr'),
-					)
-			setattr(cls, '__repr__', __repr__)
+			names = slot_names(cls)
+			if names is None:
+				body = [raise_line(('slots', 'repr'))]
+			else:
+				fields = ', '.join(
+					f'{name}={{{attr_expr(name)}!r}}'
+					for name in names
+				)
+				body = [
+					f'return f"{{cls.__class__.__name__}}({fields})"'
+				]
+		fn = create_fn('__repr__', ['cls'], body)
+		if threadsafe:
+			fn = create_fn(
+				'__repr__',
+				['cls'],
+				lock_lines(threadsafe) + [
+					'with lock:',
+					'\treturn unlocked(cls)',
+				],
+				{'unlocked' : fn, **lock_namespace(cls, threadsafe)}
+			)
+		install(cls, '__repr__', fn)
+		record(cls, dunder_repr, slots=slots, threadsafe=threadsafe)
 		return cls
 	if cls is None:
 		return wrap 
 	return wrap(cls)
 
+def dunder_contains(
+		cls: Optional[Cls] = None, 
+		attr: Optional[str] = None,
+		slots: Optional[bool] = None,
+) -> Cls:
+	"""
+	Adds a __contains__ special method to the decorated class,
+	so "key in obj" tests the keys of the class object's 
+	dictionary, its set __slots__ or the attribute specified
+	by attr, instead of scanning the items __iter__ yields.
+	Keys dunder_missing(ttl=...) inserted are not contained 
+	once they expired.
+
+	Parameters
+	---------
+	cls : User Defined Class
+		Class that is decorated
+
+	attr : str, optional
+		Name of class object attribute that __contains__
+		is defined with repect to. The test is delegated to the
+		attribute's own __contains__, which takes constant time
+		for mappings and sets and tests the values of a 
+		sequence. If None, dunder_contains defines __contains__
+		with respect to the class object's __dict__ or 
+		__slots__. Defaults to None.
+
+	slots : bool, optional
+		If True, __contains__ tests whether the key names a 
+		slot that is set. Else, __contains__ is defined with 
+		respect to the class object's dictionary or attribute 
+		specified by attr. Defaults to None.
+
+	Returns
+	-------
+	: User Defined Class
+
+	Examples
+	--------
+	>>> @dunder_contains
+	>>> @dunder_iter
+	>>> Class A(object):
+	>>>		pass
+	>>> a = A()
+	>>> a.a = 1
+	>>> print('a' in a, ('a', 1) in a)
+		True False
+
+	"""
+	def wrap(
+			cls: Cls,
+	) -> Cls:
+		if defer(cls, wrap, ('__contains__',)):
+			return cls
+		namespace = {}
+		container = None
+		if attr:
+			container = attr_expr(attr)
+			lookup = f'return key in {container}'
+		elif slots is None:
+			if has_instance_dict(cls):
+				container = 'cls.__dict__'
+				lookup = f'return key in {container}'
+			else:
+				lookup = raise_line(('dict', 'contains'))
+		else:
+			names = slot_names(cls)
+			if names is None:
+				lookup = raise_line(('slots', 'contains'))
+			else:
+				lookup = 'return key in slot_set and hasattr(cls, key)'
+				namespace = slot_namespace(names)
+		body = [
+			'try:',
+			f'\t{lookup}',
+			'except TypeError:',
+			'\traise_unhashable(cls, key)',
+		]
+		if container is not None and has_slot(cls, '__dunder_cache__'):
+			body = [
+				'try:',
+				f'\tfound = key in {container}',
+				'except TypeError:',
+				'\traise_unhashable(cls, key)',
+				'if not found:',
+				'\treturn False',
+				'try:',
+				'\tcache = cls.__dunder_cache__',
+				'except AttributeError:',
+				'\treturn True',
+				'return not cache.expired(key)',
+			]
+		install(
+			cls,
+			'__contains__',
+			create_fn('__contains__', ['cls', 'key'], body, namespace)
+		)
+		record(cls, dunder_contains, attr=attr, slots=slots)
+		return cls
+	if cls is None:
+		return wrap 
+	return wrap(cls)
+
+def dunder_len(
+		cls: Optional[Cls] = None, 
+		attr: Optional[str] = None,
+		slots: Optional[bool] = None,
+) -> Cls:
+	"""
+	Adds a __len__ special method to the decorated class.
+
+	Parameters
+	---------
+	cls : User Defined Class
+		Class that is decorated
+
+	attr : str, optional
+		Name of class object attribute that __len__
+		is defined with repect to. If None, dunder_len defines
+		__len__ with respect to the class object's __dict__ or
+		__slots__. Keys dunder_missing(ttl=...)
+		inserted into the container are not counted once they 
+		expired, like __contains__ and get report them as 
+		missing. Defaults to None.
+
+	slots : bool, optional
+		If True, __len__ returns the number of slots of the 
+		class object that are set, so it agrees with the 
+		__contains__ method dunder_contains(slots=True) adds. 
+		Else, __len__ is defined with respect to the
+		class object's dictionary or attribute specified by 
+		attr. Defaults to None.
+
+	Returns
+	-------
+	: User Defined Class
+
+	Examples
+	--------
+	>>> @dunder_len(attr='a')
+	>>> Class A(object):
+	>>>		def __init__(self, a):
+	>>>			self.a = a	
+	>>> print(len(A([1, 2, 3])))
+		3
+
+	"""
+	def wrap(
+			cls: Cls,
+	) -> Cls:
+		if defer(cls, wrap, ('__len__',)):
+			return cls
+		container = None
+		if attr:
+			container = attr_expr(attr)
+			body = [f'return len({container})']
+		elif slots is None:
+			if has_instance_dict(cls):
+				container = 'cls.__dict__'
+				body = [f'return len({container})']
+			else:
+				body = [raise_line(('dict', 'len'))]
+		else:
+			names = slot_names(cls)
+			if names is None:
+				body = [raise_line(('slots', 'len'))]
+			else:
+				body = ['return ' + (
+					' + '.join(f'hasattr(cls, {name!r})' for name in names)
+					or '0'
+				)]
+		if container is not None and has_slot(cls, '__dunder_cache__'):
+			body = [
+				f'container = {container}',
+				'try:',
+				'\tcache = cls.__dunder_cache__',
+				'except AttributeError:',
+				'\treturn len(container)',
+				'if cache.container is not container:',
+				'\treturn len(container)',
+				'return len(container) - cache.stale()',
+			]
+		install(cls, '__len__', create_fn('__len__', ['cls'], body))
+		record(cls, dunder_len, attr=attr, slots=slots)
+		return cls
+	if cls is None:
+		return wrap 
+	return wrap(cls)
+
+def dunder_eq(
+		cls: Optional[Cls] = None, 
+		slots: Optional[bool] = None,
+) -> Cls:
+	"""
+	Adds an __eq__ special method to the decorated class. Two
+	objects are equal if they are of the same class and their
+	dictionaries, or the tuples of their slot values, are 
+	equal. The slot names are looked up once when the class is
+	decorated. If dunder_setitem(frozen=True) was applied to
+	the class before dunder_eq, and both objects already
+	cached their hash with dunder_hash and the hashes differ,
+	__eq__ returns False without comparing the fields. Other
+	classes always compare the fields, since the cached hash
+	is stale once a field changes. __hash__ is set to None 
+	unless the class defines one or inherits one generated by
+	dunder_hash, as Python does for classes that define 
+	__eq__.
+
+	Parameters
+	---------
+	cls : User Defined Class
+		Class that is decorated
+
+	slots : bool, optional
+		If True, __eq__ compares the values of the slots the
+		class declares. Else, __eq__ compares the class 
+		object's dictionaries. Defaults to None.
+
+	Returns
+	-------
+	: User Defined Class
+
+	Examples
+	--------
+	>>> @dunder_eq(slots=True)
+	>>> Class A(object):
+	>>>		__slots__=('a', 'b')
+	>>>		def __init__(self, a, b):
+	>>>			self.a = a	
+	>>>			self.b = b	
+	>>> print(A(1, 2) == A(1, 2), A(1, 2) == A(1, 3))
+		True False
+
+	"""
+	def wrap(
+			cls: Cls,
+	) -> Cls:
+		if '__hash__' not in cls.__dict__ and not hasattr(
+				cls.__hash__, '__source__'
+		):
+			setattr(cls, '__hash__', None)
+		if defer(cls, wrap, ('__eq__',)):
+			return cls
+		body = [
+			'if other.__class__ is not cls.__class__:',
+			'\treturn NotImplemented',
+			'if other is cls:',
+			'\treturn True',
+		]
+		frozen = recorded_option(cls, dunder_setitem, 'frozen')
+		if frozen and has_slot(cls, '__dunder_hash__'):
+			body += [
+				'try:',
+				'\tif cls.__dunder_hash__ != other.__dunder_hash__:',
+				'\t\treturn False',
+				'except AttributeError:',
+				'\tpass',
+			]
+		if slots is None:
+			if has_instance_dict(cls):
+				body += ['return cls.__dict__ == other.__dict__']
+			else:
+				body += [raise_line(('dict', 'eq'))]
+		else:
+			names = slot_names(cls)
+			if names is None:
+				body += [raise_line(('slots', 'eq'))]
+			else:
+				body += [
+					f'return {fields_expr(names, "cls")} '
+					+ f'== {fields_expr(names, "other")}'
+				]
+		install(cls, '__eq__', create_fn('__eq__', ['cls', 'other'], body))
+		record(cls, dunder_eq, slots=slots)
+		return cls
+	if cls is None:
+		return wrap 
+	return wrap(cls)
+
+def dunder_hash(
+		cls: Optional[Cls] = None, 
+		slots: Optional[bool] = None,
+) -> Cls:
+	"""
+	Adds a __hash__ special method to the decorated class. The
+	hash of an object is computed from its dictionary, or from
+	the tuple of its slot values, the first time it is hashed
+	and is cached in a hidden __dunder_hash__ slot, so hashing
+	the same object again, e.g. when it is used as a key in 
+	several dictionaries, costs one attribute load. If the 
+	class does not have the slot, the decorated class is 
+	replaced with a copy that adds it, and the dunder 
+	decorators applied before dunder_hash are applied again 
+	to the copy. A class without __slots__ of its own keeps 
+	its __dict__. The cached hash is not updated when the 
+	object changes, so objects should not be changed once
+	they are hashed, see the frozen option of dunder_setitem.
+
+	Parameters
+	---------
+	cls : User Defined Class
+		Class that is decorated
+
+	slots : bool, optional
+		If True, the hash is computed from the values of the
+		slots the class declares. Else, it is computed from 
+		the items of the class object's dictionary. Defaults
+		to None.
+
+	Returns
+	-------
+	: User Defined Class
+
+	Examples
+	--------
+	>>> @dunder_hash(slots=True)
+	>>> @dunder_eq(slots=True)
+	>>> Class A(object):
+	>>>		__slots__=('a', 'b')
+	>>>		def __init__(self, a, b):
+	>>>			self.a = a	
+	>>>			self.b = b	
+	>>> print(len({A(1, 2), A(1, 2)}))
+		1
+
+	Notes
+	-----
+	Unless the class declares the __dunder_hash__ slot,
+	dunder_hash returns a new class, not the class it was
+	given. The copy is created by calling the metaclass, so
+	__init_subclass__ of the base classes runs again, class
+	keyword arguments are not passed again, and references
+	to the class taken before it was decorated, e.g. by a
+	registry, name the old class, whose instances are not
+	instances of the copy. Declare the slot to keep the class,
+	e.g. __slots__ = ('__dict__', '__dunder_hash__'). Inside a
+	deferred() block, the copy stays deferred.
+
+	"""
+	def wrap(
+			cls: Cls,
+	) -> Cls:
+		from .slots import with_hidden_slot
+		cls = with_hidden_slot(cls, '__dunder_hash__')
+		if defer(cls, wrap, ('__hash__',)):
+			return cls
+		if slots is None:
+			if has_instance_dict(cls):
+				fields = 'frozenset(cls.__dict__.items())'
+			else:
+				fields = None
+				body = [raise_line(('dict', 'hash'))]
+		else:
+			names = slot_names(cls)
+			if names is None:
+				fields = None
+				body = [raise_line(('slots', 'hash'))]
+			else:
+				fields = fields_expr(names, 'cls')
+		if fields is not None:
+			body = [
+				'try:',
+				'\treturn cls.__dunder_hash__',
+				'except AttributeError:',
+				'\tpass',
+				f'value = cls.__dunder_hash__ = hash({fields})',
+				'return value',
+			]
+		install(cls, '__hash__', create_fn('__hash__', ['cls'], body))
+		record(cls, dunder_hash, slots=slots)
+		return cls
+	if cls is None:
+		return wrap 
+	return wrap(cls)
+
+def dunder_order(
+		cls: Optional[Cls] = None, 
+		slots: Optional[bool] = None,
+) -> Cls:
+	"""
+	Adds __lt__, __le__, __gt__ and __ge__ special methods to 
+	the decorated class, which compare the tuples of the 
+	field values of two objects of the same class. Also adds 
+	a sort_key static method, an operator.attrgetter of the
+	fields, so list.sort(key=A.sort_key) compares tuples built
+	in C instead of calling __lt__ for every comparison. The 
+	fields are the slots the class declares, or the attributes
+	the class annotates and assigns in __init__, in order. If
+	the class has neither, objects are ordered by the values 
+	of their dictionaries in insertion order. The fields are
+	looked up once when the class is decorated. sort_key is 
+	not added if the class already defines it.
+
+	Parameters
+	---------
+	cls : User Defined Class
+		Class that is decorated
+
+	slots : bool, optional
+		If True, objects are ordered by the values of the slots
+		the class declares. Else, objects are ordered by the 
+		attributes stored in the class object's dictionary. 
+		Defaults to None.
+
+	Returns
+	-------
+	: User Defined Class
+
+	Examples
+	--------
+	>>> @dunder_order
+	>>> @dunder_repr
+	>>> Class A(object):
+	>>>		def __init__(self, a, b):
+	>>>			self.a = a	
+	>>>			self.b = b	
+	>>> print(A(1, 2) < A(1, 3))
+		True
+	>>> print(sorted([A(2, 1), A(1, 2)], key=A.sort_key))
+		[A(a=1, b=2), A(a=2, b=1)]
+
+	"""
+	def wrap(
+			cls: Cls,
+	) -> Cls:
+		names = ('__lt__', '__le__', '__gt__', '__ge__', 'sort_key')
+		if defer(cls, wrap, names):
+			return cls
+		from operator import attrgetter
+		error = None
+		if slots is None:
+			if has_instance_dict(cls):
+				from .slots import field_names
+				fields = field_names(cls)
+			else:
+				error = raise_line(('dict', 'order'))
+		else:
+			fields = slot_names(cls)
+			if fields is None:
+				error = raise_line(('slots', 'order'))
+		if error is not None:
+			key = None
+		elif fields:
+			key = attrgetter(*fields)
+			left, right = fields_expr(fields, 'cls'), fields_expr(fields, 'other')
+		else:
+			if slots is None:
+				left, right = (
+					f'tuple({obj}.__dict__.values())' for obj in ('cls', 'other')
+				)
+			else:
+				left, right = '()', '()'
+			key = create_fn('sort_key', ['cls'], [f'return {left}'])
+		for name, operator in zip(names, ('<', '<=', '>', '>=')):
+			if error is not None:
+				body = [error]
+			else:
+				body = [
+					'if other.__class__ is not cls.__class__:',
+					'\treturn NotImplemented',
+					f'return {left} {operator} {right}',
+				]
+			install(cls, name, create_fn(name, ['cls', 'other'], body))
+		existing = next(
+			(
+				base.__dict__['sort_key'] for base in cls.__mro__ 
+				if 'sort_key' in base.__dict__
+			),
+			None
+		)
+		if key is not None and (
+				existing is None or hasattr(existing, '__source__')
+		):
+			sort_key = generated_staticmethod(key)
+			sort_key.__source__ = getattr(key, '__source__', None)
+			setattr(cls, 'sort_key', sort_key)
+		record(cls, dunder_order, slots=slots)
+		return cls
+	if cls is None:
+		return wrap 
+	return wrap(cls)
+
+def dunder_slots(
+		cls: Optional[Cls] = None, 
+		weakref: Optional[bool] = None,
+) -> Cls:
+	"""
+	Replaces the decorated class with a copy that stores its
+	attributes in __slots__ instead of a __dict__. The slot
+	names are taken from the class annotations and from the 
+	attributes __init__ assigns to self. Dunder decorators 
+	applied before dunder_slots are applied again to the copy
+	in slots mode, so dunder_slots must be the outermost 
+	decorator. Instances only drop their __dict__ if every
+	base class also uses __slots__.
+
+	Parameters
+	---------
+	cls : User Defined Class
+		Class that is decorated
+
+	weakref : bool, optional
+		If True, a __weakref__ slot is added so instances can
+		be weakly referenced. Defaults to None.
+
+	Returns
+	-------
+	: User Defined Class
+
+	Examples
+	--------
+	Convert a dictionary backed class with __iter__ and 
+	__repr__ methods to a class that uses __slots__.
+
+	>>> @dunder_slots
+	>>> @dunder_repr
+	>>> @dunder_iter
+	>>> Class A(object):
+	>>>		def __init__(self, a, b):
+	>>>			self.a = a	
+	>>>			self.b = b	
+	>>> a = A(1, 2)
+	>>> print(A.__slots__)
+		('a', 'b')
+	>>> print(a)
+		A(a=1, b=2)
+	>>> print(list(a))
+		[('a', 1), ('b', 2)]
+
+	"""
+	def wrap(
+			cls: Cls,
+	) -> Cls:
+		from .slots import field_names, with_slots
+		if '__dunder_pending__' in cls.__dict__:
+			from .deferral import specialize
+			specialize(cls)
+		own = cls.__dict__.get('__slots__')
+		if isinstance(own, str):
+			own = (own,)
+		if own is not None and not (
+				set(own) & set(HIDDEN_SLOTS)
+				and set(own) <= {'__dict__', '__weakref__', *HIDDEN_SLOTS}
+		):
+			return cls
+		names = field_names(cls)
+		for name in names:
+			if name in cls.__dict__:
+				raise DunderDecoratorException(
+					cls, 'slot_conflicts_class_attr', name
+				)
+		if own is not None:
+			names += tuple(name for name in own if name in HIDDEN_SLOTS)
+		records = cls.__dict__.get('__dunder_decorators__', ())
+		new_cls = with_slots(cls, names, weakref)
+		for decorator, options in records:
+			options = dict(options)
+			if not options.get('attr'):
+				if decorator is dunder_missing:
+					raise DunderDecoratorException(
+						cls, 'missing_with_slots'
+					)
+				if 'slots' in options:
+					options['slots'] = True
+			new_cls = decorator(**options)(new_cls)
+		return new_cls
+	if cls is None:
+		return wrap 
+	return wrap(cls)
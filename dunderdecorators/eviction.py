@@ -0,0 +1,462 @@
+'''
+Eviction and expiry of the keys dunder_missing inserts. A
+tracker is kept per object in its hidden __dunder_cache__
+slot and records the keys __missing__ inserted. __missing__
+calls add for every key it inserts, which evicts keys from
+the object once maxsize is reached. __getitem__, get and has
+call touch on every hit, which returns False if the key
+expired, pop calls discard, __contains__ calls expired and
+__len__ subtracts stale, so expired keys read as missing
+everywhere.
+Keys that were not inserted by __missing__ are not tracked
+and are never evicted. Pickles and copies save the tracked
+keys instead of the tracker, and the copy tracks them again
+with a new tracker, so their ttl starts over.
+'''
+
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock, RLock, Thread
+from time import sleep
+from weakref import WeakSet
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, Union, Callable, Dict, Hashable, \
+		List, MutableMapping, Any
+	from .locks import LockStripes
+
+__all__ = []
+
+
+class Tracker(object):
+	"""
+	Tracks the keys __missing__ inserted without bounding
+	their number. Keys expire ttl seconds, as measured by
+	clock, after they were inserted, where ttl is a number or
+	a callable that returns the ttl of a key, or None if the
+	key does not expire. If a sweeper is given, the tracker
+	is registered with it. dunder_missing passes the lock
+	table of threadsafe classes as stripes, and the object
+	the tracker belongs to as owner. The tracker then takes a
+	lock of its own, since the key locks of threadsafe="key"
+	do not serialize calls for different keys, and sweeps
+	hold the locks generated methods take for owner, see
+	LockStripes.guarding, while they remove a key.
+	"""
+
+	__slots__ = (
+		'maxsize', 'ttl', 'clock', 'expires', 'container', 'lock',
+		'stripes', 'owner', 'by_key', '__weakref__',
+	)
+
+	def __init__(
+			self,
+			maxsize: Optional[int],
+			ttl: Optional[Union[float, Callable[[Hashable], float]]],
+			clock: Callable[[], float],
+			sweeper: Optional[Sweeper] = None,
+			stripes: Optional[LockStripes] = None,
+			owner: Optional[Any] = None,
+			by_key: Optional[bool] = None,
+	) -> None:
+		self.maxsize = maxsize
+		self.ttl = ttl
+		self.clock = clock
+		self.expires: Dict[Hashable, float] = {}
+		self.container = None
+		self.lock = None
+		self.stripes = stripes
+		self.owner = id(owner)
+		self.by_key = by_key
+		if sweeper is not None or stripes is not None:
+			self.lock = RLock()
+		if sweeper is not None:
+			sweeper.register(self)
+
+	def touch(
+			self,
+			key: Hashable,
+	) -> bool:
+		"""
+		Records a use of key and returns True, or returns False
+		if key expired. Like expired, but inlined since touch is
+		called on every hit.
+		"""
+		if self.ttl is not None:
+			deadline = self.expires.get(key)
+			if deadline is not None and deadline <= self.clock():
+				return False
+		if self.lock is None:
+			self.use(key)
+		else:
+			with self.lock:
+				self.use(key)
+		return True
+
+	def add(
+			self,
+			key: Hashable,
+			container: MutableMapping,
+	) -> None:
+		"""
+		Records that key was inserted into container and removes
+		the keys the policy evicts from container.
+		"""
+		if self.lock is None:
+			self.insert(key, container)
+		else:
+			with self.lock:
+				self.insert(key, container)
+
+	def insert(
+			self,
+			key: Hashable,
+			container: MutableMapping,
+	) -> None:
+		self.container = container
+		if self.ttl is not None:
+			ttl = self.ttl(key) if callable(self.ttl) else self.ttl
+			if ttl is None:
+				self.expires.pop(key, None)
+			else:
+				self.expires[key] = self.clock() + ttl
+		for evicted in self.evict(key):
+			self.expires.pop(evicted, None)
+			container.pop(evicted, None)
+
+	def expired(
+			self,
+			key: Hashable,
+	) -> bool:
+		if self.ttl is None:
+			return False
+		deadline = self.expires.get(key)
+		return deadline is not None and deadline <= self.clock()
+
+	def stale(
+			self,
+	) -> int:
+		"""
+		Returns the number of expired keys that are still in
+		the container, i.e. were not swept yet.
+		"""
+		if self.ttl is None:
+			return 0
+		if self.lock is None:
+			return self.count_stale()
+		with self.lock:
+			return self.count_stale()
+
+	def count_stale(
+			self,
+	) -> int:
+		now = self.clock()
+		container = self.container
+		return sum(
+			1 for key, deadline in self.expires.items()
+			if deadline <= now and key in container
+		)
+
+	def discard(
+			self,
+			key: Hashable,
+	) -> bool:
+		"""
+		Stops tracking key, which was removed from the container.
+		Returns False if key had expired.
+		"""
+		fresh = not self.expired(key)
+		if self.lock is None:
+			self.expires.pop(key, None)
+			self.forget(key)
+		else:
+			with self.lock:
+				self.expires.pop(key, None)
+				self.forget(key)
+		return fresh
+
+	def sweep(
+			self,
+	) -> None:
+		"""
+		Removes the expired keys from the container they were
+		inserted into. With stripes, each key is removed while
+		holding the locks of the owner, which are taken before
+		the tracker's lock like in generated methods, so
+		threadsafe methods never see the container change.
+		"""
+		if self.stripes is None:
+			if self.lock is None:
+				self.expire()
+			else:
+				with self.lock:
+					self.expire()
+			return
+		with self.lock:
+			expired = self.expired_keys()
+		for key in expired:
+			locks = self.stripes.guarding(self.owner, key, self.by_key)
+			for lock in locks:
+				lock.acquire()
+			try:
+				with self.lock:
+					if self.expired(key):
+						self.remove(key)
+			finally:
+				for lock in reversed(locks):
+					lock.release()
+
+	def expire(
+			self,
+	) -> None:
+		for key in self.expired_keys():
+			self.remove(key)
+
+	def expired_keys(
+			self,
+	) -> List[Hashable]:
+		now = self.clock()
+		return [
+			key for key, deadline in self.expires.items()
+			if deadline <= now
+		]
+
+	def remove(
+			self,
+			key: Hashable,
+	) -> None:
+		del self.expires[key]
+		self.forget(key)
+		if self.container is not None:
+			self.container.pop(key, None)
+
+	def tracked(
+			self,
+	) -> List[Hashable]:
+		"""
+		Returns the tracked keys, the first to be evicted
+		first, so adding them to a new tracker in this order
+		keeps their eviction order. __getstate__ saves them.
+		"""
+		if self.lock is None:
+			return self.ordered()
+		with self.lock:
+			return self.ordered()
+
+	def ordered(
+			self,
+	) -> List[Hashable]:
+		return list(self.expires)
+
+	def use(
+			self,
+			key: Hashable,
+	) -> None:
+		pass
+
+	def evict(
+			self,
+			key: Hashable,
+	) -> List[Hashable]:
+		"""
+		Records that key was inserted and returns the keys
+		that have to be evicted.
+		"""
+		return []
+
+	def forget(
+			self,
+			key: Hashable,
+	) -> None:
+		pass
+
+
+class LRUTracker(Tracker):
+	"""
+	Evicts the least recently used key. Keys are kept in an
+	OrderedDict in order of use, so touch and add take
+	constant time.
+	"""
+
+	__slots__ = ('keys',)
+
+	def __init__(
+			self,
+			*args: Any,
+	) -> None:
+		super().__init__(*args)
+		self.keys = OrderedDict()
+
+	def ordered(
+			self,
+	) -> List[Hashable]:
+		return list(self.keys)
+
+	def use(
+			self,
+			key: Hashable,
+	) -> None:
+		keys = self.keys
+		if key in keys:
+			keys.move_to_end(key)
+
+	def evict(
+			self,
+			key: Hashable,
+	) -> List[Hashable]:
+		keys = self.keys
+		keys[key] = None
+		keys.move_to_end(key)
+		if len(keys) > self.maxsize:
+			return [keys.popitem(last=False)[0]]
+		return []
+
+	def forget(
+			self,
+			key: Hashable,
+	) -> None:
+		self.keys.pop(key, None)
+
+
+class LFUTracker(Tracker):
+	"""
+	Evicts the least frequently used key, and the least
+	recently added of those if several keys were used equally
+	often. Keys are kept in one insertion ordered dict per use
+	count, so touch and add take constant time.
+	"""
+
+	__slots__ = ('counts', 'buckets', 'min_count')
+
+	def __init__(
+			self,
+			*args: Any,
+	) -> None:
+		super().__init__(*args)
+		self.counts: Dict[Hashable, int] = {}
+		self.buckets: Dict[int, Dict[Hashable, None]] = {}
+		self.min_count = 0
+
+	def ordered(
+			self,
+	) -> List[Hashable]:
+		return [
+			key for count in sorted(self.buckets)
+			for key in self.buckets[count]
+		]
+
+	def use(
+			self,
+			key: Hashable,
+	) -> None:
+		count = self.counts.get(key)
+		if count is None:
+			return
+		bucket = self.buckets[count]
+		del bucket[key]
+		if not bucket:
+			del self.buckets[count]
+			if self.min_count == count:
+				self.min_count = count + 1
+		self.counts[key] = count + 1
+		self.buckets.setdefault(count + 1, {})[key] = None
+
+	def evict(
+			self,
+			key: Hashable,
+	) -> List[Hashable]:
+		if key in self.counts:
+			self.use(key)
+			return []
+		evicted = []
+		if len(self.counts) >= self.maxsize:
+			bucket = self.buckets[self.min_count]
+			oldest = next(iter(bucket))
+			del bucket[oldest]
+			if not bucket:
+				del self.buckets[self.min_count]
+			del self.counts[oldest]
+			evicted.append(oldest)
+		self.counts[key] = 1
+		self.buckets.setdefault(1, {})[key] = None
+		self.min_count = 1
+		return evicted
+
+	def forget(
+			self,
+			key: Hashable,
+	) -> None:
+		count = self.counts.pop(key, None)
+		if count is None:
+			return
+		bucket = self.buckets[count]
+		del bucket[key]
+		if not bucket:
+			del self.buckets[count]
+		if self.counts and count == self.min_count:
+			self.min_count = min(self.buckets)
+
+
+class Sweeper(object):
+	"""
+	Daemon thread that sweeps every registered tracker each
+	interval seconds. The thread is started when the first
+	tracker is registered and exits once every registered
+	tracker was garbage collected.
+	"""
+
+	def __init__(
+			self,
+			interval: float,
+	) -> None:
+		self.interval = interval
+		self.trackers = WeakSet()
+		self.thread = None
+		self.lock = Lock()
+
+	def register(
+			self,
+			tracker: Tracker,
+	) -> None:
+		with self.lock:
+			self.trackers.add(tracker)
+			if self.thread is None:
+				self.thread = Thread(
+					target=self.run,
+					name='dunderdecorators-sweeper',
+					daemon=True,
+				)
+				self.thread.start()
+
+	def run(
+			self,
+	) -> None:
+		while True:
+			sleep(self.interval)
+			if not self.sweep():
+				return
+
+	def sweep(
+			self,
+	) -> bool:
+		"""
+		Sweeps every registered tracker once. Returns False,
+		and marks the thread as stopped, if no tracker is left.
+		The trackers are only referenced inside this call, so
+		they can be collected while the thread sleeps.
+		"""
+		with self.lock:
+			trackers = list(self.trackers)
+			if not trackers:
+				self.thread = None
+				return False
+		for tracker in trackers:
+			tracker.sweep()
+		return True
+
+
+POLICIES = {
+	'lru' : LRUTracker,
+	'lfu' : LFUTracker,
+}
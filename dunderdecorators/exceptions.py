@@ -1,12 +1,20 @@
+from __future__ import annotations
+from collections.abc import Iterable
 
-from collections import namedtuple
-from collections.abc import Mapping, Iterable
-from typing import Optional, TypeVar, Hashable, \
-	Dict, Iterable, Union, Tuple, List, Any, Generator
-
-Cls = TypeVar('User Defined Class')
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, TypeVar
+	Cls = TypeVar('User Defined Class')
 
 class DunderDecoratorException(Exception):
+	"""
+	Raised by dunder decorators and the methods they generate.
+	Lookup errors raised in normal control flow are instances of
+	the subclasses DunderKeyError, DunderIndexError and 
+	DunderTypeError, which also inherit from KeyError, IndexError
+	and TypeError. The message is only built when the exception
+	is converted to a string.
+	"""
 
 	def __init__(
 			self,
@@ -17,14 +25,23 @@ class DunderDecoratorException(Exception):
 		self.cls_obj = cls_obj
 		self.attr = attr
 		self.message = message
-		self.cls_obj_name_and_addr = (
-			f'<{cls_obj.__module__}'
-			+ f'.{cls_obj.__class__.__name__}'
-			+ f' object at {hex(id(cls_obj))}>'
+		self.formatted = None
+		self.args = (message,)
+
+	@property
+	def cls_obj_name_and_addr(self) -> str:
+		return (
+			f'<{self.cls_obj.__module__}'
+			+ f'.{self.cls_obj.__class__.__name__}'
+			+ f' object at {hex(id(self.cls_obj))}>'
 		)
-		super().__init__(message)
 
 	def __str__(self):
+		if self.formatted is None:
+			self.formatted = self.format_message()
+		return self.formatted
+
+	def format_message(self):
 		if self.message == 'iterable':
 			attr_type = getattr(
 					self.cls_obj, self.attr
@@ -237,6 +254,52 @@ class DunderDecoratorException(Exception):
 				message += (
 					f'\nConsider setting slots equal to True.'
 				)
+		elif self.message in (
+				('dict', 'contains'),
+				('dict', 'len'),
+				('dict', 'eq'),
+				('dict', 'hash'),
+				('dict', 'order'),
+		):
+			message = (
+				f'\n{self.cls_obj_name_and_addr} '
+				+ f' has no attribute  "__dict__".\n'
+			)
+			if hasattr(self.cls_obj, '__slots__'):
+				message += (
+					f'\nConsider setting slots equal to True '
+					+ f'when using dunder_{self.message[1]}.'
+				)
+		elif self.message in (
+				('slots', 'contains'),
+				('slots', 'len'),
+				('slots', 'eq'),
+				('slots', 'hash'),
+		):
+			message = (
+				f'\n{self.cls_obj_name_and_addr} '
+				+ f' has no attribute  "__slots__".\n'
+			)
+			if hasattr(self.cls_obj, '__dict__'):
+				message += (
+					f'\nConsider using dunder_{self.message[1]} without '
+					+ f'any parameters, which will define '
+					+ f'__{self.message[1]}__\n'
+					+ f'with repsect to '
+					+ f'{self.cls_obj_name_and_addr}\'s __dict__.'
+				)
+		elif self.message == ('slots', 'order'):
+			message = (
+				f'\n{self.cls_obj_name_and_addr} '
+				+ f' has no attribute  "__slots__".\n'
+			)
+			if hasattr(self.cls_obj, '__dict__'):
+				message += (
+					f'\nConsider using dunder_order without '
+					+ f'any parameters, which will define the '
+					+ f'comparison methods\nwith repsect to '
+					+ f'{self.cls_obj_name_and_addr}\'s __dict__.'
+				)
 		elif self.message == ('slots', 'setitem'):
 			message = (
 				f'\n{self.cls_obj_name_and_addr} '
@@ -355,7 +418,8 @@ class DunderDecoratorException(Exception):
 				+ f'{self.cls_obj_name_and_addr}\'s __dict__.\n{keys}' 
 			)
 		elif self.message == 'key_not_in_obj_slots':
-			keys = list(self.cls_obj.__slots__)
+			from .codegen import slot_names
+			keys = list(slot_names(type(self.cls_obj)) or ())
 			message = (
 				f'Provided key is not in {self.cls_obj_name_and_addr}'
 				+ f' \'s __slots__.\n If using the dunder_missing '
@@ -393,5 +457,85 @@ class DunderDecoratorException(Exception):
 				+ f'{self.cls_obj_name_and_addr} '
 				+ f'post object creation.'
 			)
+		elif self.message == 'invalid_growth':
+			message = (
+				f'growth must be one of "inplace", "deque" '
+				+ f'or "rebuild".\nCurrently, growth is set to '
+				+ f'{self.attr!r}.'
+			)
+		elif self.message == 'invalid_threadsafe':
+			message = (
+				f'threadsafe must be True, "instance" or "key".'
+				+ f'\nCurrently, threadsafe is set to {self.attr!r}.'
+			)
+		elif self.message == 'invalid_batch_size':
+			message = (
+				f'batch_size must be a positive integer.'
+				+ f'\nCurrently, batch_size is set to {self.attr!r}.'
+			)
+		elif self.message == 'invalid_prefetch':
+			message = (
+				f'prefetch must be None or a positive integer.'
+				+ f'\nCurrently, prefetch is set to {self.attr!r}.'
+			)
+		elif self.message == 'invalid_maxsize':
+			message = (
+				f'maxsize must be None or a positive integer.'
+				+ f'\nCurrently, maxsize is set to {self.attr!r}.'
+			)
+		elif self.message == 'invalid_policy':
+			message = (
+				f'policy must be "lru" or "lfu".'
+				+ f'\nCurrently, policy is set to {self.attr!r}.'
+			)
+		elif self.message == 'invalid_ttl':
+			message = (
+				f'ttl must be None, a positive number or a callable.'
+				+ f'\nCurrently, ttl is set to {self.attr!r}.'
+			)
+		elif self.message == 'invalid_sweep':
+			message = (
+				f'sweep must be None or a positive number, and '
+				+ f'requires ttl and threadsafe to be set.'
+				+ f'\nCurrently, sweep is set to {self.attr!r}.'
+			)
+		elif self.message == 'conflicting_defaults':
+			message = (
+				f'Only one of default_value, default_factory '
+				+ f'and compute can be set.'
+			)
+		elif self.message == 'slot_conflicts_class_attr':
+			message = (
+				f'Cannot convert {self.cls_obj.__name__} to '
+				+ f'__slots__ because {self.attr!r} is both an '
+				+ f'instance attribute\nand a class attribute. '
+				+ f'Remove the class attribute or its default value.'
+			)
+		elif self.message == 'frozen':
+			message = (
+				f'\n{self.cls_obj_name_and_addr} is frozen, '
+				+ f'so {self.attr!r} cannot be assigned.'
+			)
 		return message 
 
+
+class DunderKeyError(DunderDecoratorException, KeyError):
+	pass
+
+
+class DunderIndexError(DunderDecoratorException, IndexError):
+	pass
+
+
+class DunderTypeError(DunderDecoratorException, TypeError):
+	pass
+
+
+ERROR_TYPES = {
+	'key_not_in_obj_dict' : DunderKeyError,
+	'key_not_in_obj_slots' : DunderKeyError,
+	'key_not_found' : DunderKeyError,
+	'index_out_of_bounds' : DunderIndexError,
+	'key_not_hashable' : DunderTypeError,
+	'frozen' : DunderTypeError,
+}
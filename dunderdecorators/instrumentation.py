@@ -0,0 +1,257 @@
+'''
+Optional instrumentation of the methods dunder decorators
+generate. Instrumentation is off by default and can be switched
+on for every decorated class or for single classes:
+
+	>>> from dunderdecorators import instrumentation
+	>>> instrumentation.enable()
+	>>> instrumentation.enable(A)
+	>>> instrumentation.snapshot()
+	>>> instrumentation.disable()
+
+Enabling replaces the generated __getitem__, __setitem__,
+__iter__, __missing__ and __repr__ methods with wrappers that
+count calls, calls that returned (hits) and calls that raised
+(misses) and record the latency of every call in a histogram
+with power of two buckets. A __getitem__ call that was answered
+by an instrumented __missing__ counts as a miss too. The latency
+of __iter__ is the time it takes to create the iterator, not to
+exhaust it. Disabling puts the generated methods back, so an
+uninstrumented class calls no wrapper at all.
+'''
+
+from __future__ import annotations
+from threading import local
+from time import perf_counter_ns
+from weakref import WeakSet, WeakKeyDictionary
+from .codegen import create_fn
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, TypeVar, Dict, List, Any
+	Cls = TypeVar('User Defined Class')
+
+__all__ = []
+
+METHODS = ('__getitem__', '__setitem__', '__iter__', '__missing__', '__repr__')
+
+DECORATED = WeakSet()
+SWITCHES = WeakKeyDictionary()
+STATS = WeakKeyDictionary()
+ENABLED = False
+
+
+class Missed(local):
+	"""
+	Number of instrumented __missing__ calls made by the current
+	thread, so a __getitem__ wrapper can tell whether its lookup
+	missed.
+	"""
+	count = 0
+
+MISSED = Missed()
+
+class MethodStats(object):
+	"""
+	Counters of one instrumented method. histogram[i] counts
+	the calls that took less than 2 ** i nanoseconds and at
+	least 2 ** (i - 1) nanoseconds.
+	"""
+
+	__slots__ = ('calls', 'hits', 'misses', 'total_ns', 'histogram')
+
+	def __init__(
+			self,
+	) -> None:
+		self.calls = 0
+		self.hits = 0
+		self.misses = 0
+		self.total_ns = 0
+		self.histogram: List[int] = [0] * 64
+
+	def add(
+			self,
+			elapsed: int,
+	) -> None:
+		self.calls += 1
+		self.total_ns += elapsed
+		self.histogram[min(elapsed.bit_length(), 63)] += 1
+
+	def as_dict(
+			self,
+	) -> Dict[str, Any]:
+		return {
+			'calls' : self.calls,
+			'hits' : self.hits,
+			'misses' : self.misses,
+			'total_ns' : self.total_ns,
+			'mean_ns' : self.total_ns / self.calls if self.calls else 0.0,
+			'histogram' : {
+				1 << i : count
+				for i, count in enumerate(self.histogram) if count
+			},
+		}
+
+
+def is_enabled(
+		cls: Cls,
+) -> bool:
+	return SWITCHES.get(cls, ENABLED)
+
+def stats_for(
+		cls: Cls,
+		name: str,
+) -> MethodStats:
+	methods = STATS.setdefault(cls, {})
+	stats = methods.get(name)
+	if stats is None:
+		stats = methods[name] = MethodStats()
+	return stats
+
+def wrap_method(
+		cls: Cls,
+		name: str,
+		fn: Any,
+) -> Any:
+	"""
+	Returns an instrumented wrapper of the generated method fn.
+	"""
+	if name == '__getitem__':
+		start = ['missed = MISSED.count', 'start = perf_counter_ns()']
+		hit = [
+			'if MISSED.count != missed:',
+			'\tstats.misses += 1',
+			'else:',
+			'\tstats.hits += 1',
+		]
+	else:
+		start = ['start = perf_counter_ns()']
+		hit = ['stats.hits += 1']
+	if name == '__missing__':
+		start = ['MISSED.count += 1'] + start
+	wrapper = create_fn(
+		name,
+		['cls', '*args'],
+		start + [
+			'try:',
+			'\tresult = fn(cls, *args)',
+			'except BaseException:',
+			'\tstats.misses += 1',
+			'\traise',
+			'finally:',
+			'\tstats.add(perf_counter_ns() - start)',
+		] + hit + [
+			'return result',
+		],
+		{
+			'fn' : fn,
+			'stats' : stats_for(cls, name),
+			'perf_counter_ns' : perf_counter_ns,
+			'MISSED' : MISSED,
+		}
+	)
+	wrapper.__wrapped__ = fn
+	wrapper.__instrumented__ = True
+	wrapper.__qualname__ = f'{cls.__qualname__}.{name}'
+	wrapper.__module__ = cls.__module__
+	return wrapper
+
+def instrument(
+		cls: Cls,
+) -> None:
+	for name in METHODS:
+		fn = cls.__dict__.get(name)
+		if fn is None or not hasattr(fn, '__source__'):
+			continue
+		if getattr(fn, '__instrumented__', False):
+			continue
+		# stubs of deferred decorators are replaced when the class
+		# is specialized, which instruments the generated methods
+		if getattr(fn, '__deferred__', False):
+			continue
+		setattr(cls, name, wrap_method(cls, name, fn))
+
+def uninstrument(
+		cls: Cls,
+) -> None:
+	for name in METHODS:
+		fn = cls.__dict__.get(name)
+		if getattr(fn, '__instrumented__', False):
+			setattr(cls, name, fn.__wrapped__)
+
+def track(
+		cls: Cls,
+) -> None:
+	"""
+	Called by every dunder decorator after it installed its
+	methods on cls. The methods are instrumented right away
+	if instrumentation is enabled for cls.
+	"""
+	DECORATED.add(cls)
+	if is_enabled(cls):
+		instrument(cls)
+
+def enable(
+		cls: Optional[Cls] = None,
+) -> None:
+	"""
+	Enables instrumentation for cls, or for every decorated
+	class, including classes decorated later, if cls is None.
+	"""
+	global ENABLED
+	if cls is None:
+		ENABLED = True
+		classes = list(DECORATED)
+	else:
+		SWITCHES[cls] = True
+		classes = [cls]
+	for decorated in classes:
+		if is_enabled(decorated):
+			instrument(decorated)
+
+def disable(
+		cls: Optional[Cls] = None,
+) -> None:
+	"""
+	Disables instrumentation for cls, or for every decorated
+	class that was not enabled on its own if cls is None. The
+	collected counters are kept.
+	"""
+	global ENABLED
+	if cls is None:
+		ENABLED = False
+		classes = list(DECORATED)
+	else:
+		SWITCHES[cls] = False
+		classes = [cls]
+	for decorated in classes:
+		if not is_enabled(decorated):
+			uninstrument(decorated)
+
+def reset(
+		cls: Optional[Cls] = None,
+) -> None:
+	"""
+	Sets the counters of cls, or of every class if cls is
+	None, back to zero.
+	"""
+	for stats_cls, methods in list(STATS.items()):
+		if cls is None or stats_cls is cls:
+			for stats in methods.values():
+				stats.__init__()
+
+def snapshot(
+		cls: Optional[Cls] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+	"""
+	Returns a copy of the counters of cls, or of every class
+	with counters if cls is None, keyed by the qualified name
+	of the class and by method name.
+	"""
+	return {
+		f'{stats_cls.__module__}.{stats_cls.__qualname__}' : {
+			name : stats.as_dict() for name, stats in methods.items()
+		}
+		for stats_cls, methods in list(STATS.items())
+		if cls is None or stats_cls is cls
+	}
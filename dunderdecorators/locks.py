@@ -0,0 +1,70 @@
+from __future__ import annotations
+from threading import RLock
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+	from typing import Optional, TypeVar, Tuple, Hashable
+	Cls = TypeVar('User Defined Class')
+
+
+class LockStripes(object):
+	"""
+	Fixed table of reentrant locks shared by every instance of
+	a decorated class. An instance, or an (instance, key) pair,
+	is mapped to one lock of the table, so locking costs no
+	per-instance storage and unrelated instances or keys rarely
+	contend. Generated methods index locks with mask directly,
+	see codegen.lock_lines, so picking a lock costs no call.
+	guarding picks the same locks for code that is not
+	generated.
+
+	Parameters
+	---------
+	size : int, optional
+		Number of locks in the table, rounded up to a power
+		of two. Defaults to 64.
+	"""
+
+	__slots__ = ('locks', 'mask')
+
+	def __init__(
+			self,
+			size: Optional[int] = 64,
+	) -> None:
+		size = 1 << max(size - 1, 0).bit_length()
+		self.locks: Tuple[RLock, ...] = tuple(
+			RLock() for _ in range(size)
+		)
+		self.mask = size - 1
+
+	def guarding(
+			self,
+			owner: int,
+			key: Hashable,
+			by_key: bool,
+	) -> Tuple[RLock, ...]:
+		"""
+		Returns the locks codegen.lock_lines picks for the
+		object whose id is owner: its instance lock, and the
+		lock of key if by_key, in the order they are taken.
+		"""
+		index = owner >> 4
+		instance = self.locks[index & self.mask]
+		if not by_key:
+			return (instance,)
+		return (instance, self.locks[(index ^ hash(key)) & self.mask])
+
+
+def locks_for(
+		cls: Cls,
+) -> LockStripes:
+	"""
+	Returns the lock table of cls, creating it the first time
+	cls is decorated with threadsafe set. Every threadsafe
+	method of a class shares the same table.
+	"""
+	stripes = cls.__dict__.get('__dunder_locks__')
+	if stripes is None:
+		stripes = LockStripes()
+		setattr(cls, '__dunder_locks__', stripes)
+	return stripes
@@ -0,0 +1,188 @@
+import dis
+from types import MemberDescriptorType
+from typing import Optional, TypeVar, ClassVar, Tuple, List, Any
+
+Cls = TypeVar('User Defined Class')
+
+__all__ = []
+
+
+def is_class_var(
+		annotation: Any,
+) -> bool:
+	if isinstance(annotation, str):
+		return annotation.startswith(('ClassVar', 'typing.ClassVar'))
+	return (
+		annotation is ClassVar
+		or getattr(annotation, '__origin__', None) is ClassVar
+	)
+
+def init_attr_names(
+		cls: Cls,
+) -> List[str]:
+	"""
+	Returns the names of the attributes the __init__ method of
+	cls assigns to self, in order of first assignment. Names
+	are read from the STORE_ATTR instructions whose object is
+	the first argument of __init__, loaded by any LOAD_FAST
+	variant, e.g. LOAD_FAST_BORROW. Variants that load two
+	names push the object last.
+	"""
+	init = cls.__dict__.get('__init__')
+	code = getattr(init, '__code__', None)
+	if code is None or not code.co_argcount:
+		return []
+	self_name = code.co_varnames[0]
+	names = []
+	previous = None
+	for instruction in dis.get_instructions(code):
+		if (
+				instruction.opname == 'STORE_ATTR'
+				and previous is not None
+				and previous.opname.startswith('LOAD_FAST')
+		):
+			loaded = previous.argval
+			if isinstance(loaded, tuple):
+				loaded = loaded[-1]
+			if loaded == self_name and instruction.argval not in names:
+				names.append(instruction.argval)
+		previous = instruction
+	return names
+
+def field_names(
+		cls: Cls,
+) -> Tuple[str, ...]:
+	"""
+	Returns the instance attribute names of cls, taken from
+	the annotations of cls followed by the attributes assigned
+	in __init__. ClassVar annotations and names already declared
+	as slots by a base class are skipped.
+	"""
+	inherited = set()
+	for base in cls.__mro__[1:]:
+		slots = base.__dict__.get('__slots__', ())
+		inherited.update((slots,) if isinstance(slots, str) else slots)
+	names = []
+	annotations = cls.__dict__.get('__annotations__', {})
+	for name, annotation in annotations.items():
+		if not is_class_var(annotation):
+			names.append(name)
+	for name in init_attr_names(cls):
+		if name not in names:
+			names.append(name)
+	return tuple(name for name in names if name not in inherited)
+
+def update_class_cells(
+		value: Any,
+		old_cls: Cls,
+		new_cls: Cls,
+) -> None:
+	"""
+	Points the __class__ closure cells of the functions in
+	value, which zero argument super() relies on, from old_cls
+	to new_cls.
+	"""
+	if isinstance(value, (classmethod, staticmethod)):
+		value = value.__func__
+	elif isinstance(value, property):
+		for fn in (value.fget, value.fset, value.fdel):
+			update_class_cells(fn, old_cls, new_cls)
+		return
+	for cell in getattr(value, '__closure__', None) or ():
+		try:
+			contents = cell.cell_contents
+		except ValueError:
+			continue
+		if contents is old_cls:
+			cell.cell_contents = new_cls
+
+def with_slots(
+		cls: Cls,
+		names: Tuple[str, ...],
+		weakref: Optional[bool] = None,
+) -> Cls:
+	"""
+	Returns a copy of cls that declares names as __slots__.
+	The copy has the same name, bases and class attributes as
+	cls, except for the __dict__ and __weakref__ descriptors,
+	the descriptors of the slots cls declares and the methods
+	generated by dunder decorators.
+	"""
+	namespace = {
+		key : value for key, value in cls.__dict__.items()
+		if key not in (
+			'__dict__',
+			'__weakref__',
+			'__dunder_decorators__',
+			'__dunder_slot_names__',
+			'__dunder_pending__',
+		)
+		and not hasattr(value, '__source__')
+		and not (
+			isinstance(value, MemberDescriptorType)
+			and value.__objclass__ is cls
+		)
+	}
+	if weakref and not any(
+			'__weakref__' in base.__dict__ for base in cls.__mro__[1:]
+	):
+		names = names + ('__weakref__',)
+	namespace['__slots__'] = names
+	new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+	new_cls.__qualname__ = cls.__qualname__
+	for value in namespace.values():
+		update_class_cells(value, cls, new_cls)
+	return new_cls
+
+def hidden_slot_names(
+		cls: Cls,
+		name: str,
+) -> Tuple[str, ...]:
+	"""
+	Returns the __slots__ of a copy of cls with the hidden slot
+	name. The slots cls declares are kept, and a class without
+	__slots__ of its own keeps its __dict__.
+	"""
+	slots = cls.__dict__.get('__slots__')
+	if slots is not None:
+		if isinstance(slots, str):
+			slots = (slots,)
+		return tuple(slots) + (name,)
+	names = (name,)
+	if not any('__dict__' in base.__dict__ for base in cls.__mro__[1:]):
+		names += ('__dict__',)
+	return names
+
+def with_hidden_slot(
+		cls: Cls,
+		name: str,
+) -> Cls:
+	"""
+	Returns cls if cls or a base class declares the slot name,
+	else a copy of cls that adds it. Hidden slots hold state
+	generated methods keep per object, e.g. the hash cached
+	by dunder_hash, outside of the object's __dict__. The
+	dunder decorators applied to cls are applied again to the
+	copy. The copy is a new class, see with_slots, so the
+	decorators that call this document it in their Notes.
+	Hidden slots are left out of the state pickle and copy
+	save, see install_getstate. Deferred decorators of cls stay
+	deferred on the copy, see copy_pending.
+	"""
+	from .codegen import install_getstate
+	if any(name in base.__dict__ for base in cls.__mro__):
+		install_getstate(cls)
+		return cls
+	records = cls.__dict__.get('__dunder_decorators__', ())
+	new_cls = with_slots(
+		cls,
+		hidden_slot_names(cls, name),
+		'__slots__' not in cls.__dict__
+	)
+	install_getstate(new_cls)
+	if '__dunder_pending__' in cls.__dict__:
+		from .deferral import copy_pending
+		copy_pending(cls, new_cls)
+	for decorator, options in records:
+		new_cls = decorator(**options)(new_cls)
+	return new_cls
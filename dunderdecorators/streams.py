@@ -0,0 +1,56 @@
+import asyncio
+from asyncio import sleep, Queue
+from typing import AsyncIterable, AsyncIterator, Any
+
+__all__ = []
+
+
+async def prefetched(
+		source: AsyncIterable,
+		maxsize: int,
+) -> AsyncIterator:
+	"""
+	Iterates over source with a producer task that reads ahead
+	into a queue holding at most maxsize items. The producer
+	waits while the queue is full, so a slow consumer applies
+	backpressure to the source. Exceptions raised by the
+	source are re-raised by the consumer, and the producer is
+	cancelled when iteration stops early.
+	"""
+	queue = Queue(maxsize)
+
+	async def produce() -> None:
+		try:
+			async for item in source:
+				await queue.put((True, item))
+		except Exception as error:
+			await queue.put((False, error))
+		else:
+			await queue.put((False, None))
+
+	task = asyncio.ensure_future(produce())
+	try:
+		while True:
+			has_item, item = await queue.get()
+			if not has_item:
+				if item is not None:
+					raise item
+				return
+			yield item
+	finally:
+		task.cancel()
+
+async def drain(
+		queue: Queue,
+		sentinel: Any,
+) -> AsyncIterator:
+	"""
+	Iterates over the items put on queue until sentinel is
+	received, marking each item as done.
+	"""
+	while True:
+		item = await queue.get()
+		queue.task_done()
+		if item is sentinel:
+			return
+		yield item
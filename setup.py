@@ -21,7 +21,7 @@ setup(
     author='Andy Stokely',
     author_email='amstokely@ucsd.edu',
     license='MIT',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires=[
 		"typing",
 		"pytest",
@@ -29,5 +29,5 @@ setup(
 	],              
     platforms=['Linux',
                 'Unix',],
-    python_requires=">=3.6",          
+    python_requires=">=3.7",          
 )
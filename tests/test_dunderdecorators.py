@@ -1,8 +1,17 @@
-from dunderdecorators import dunder_iter, dunder_setitem, \
+from dunderdecorators import dunder_iter, dunder_aiter, dunder_setitem, \
 	dunder_getitem, dunder_missing, dunder_repr, \
-	DunderDecoratorException
+	dunder_slots, DunderDecoratorException, SparseSequence, SequenceView, \
+	instrumentation, deferred, specialize, dunder_contains, dunder_len, \
+	dunder_eq, dunder_hash, dunder_order
 import pytest
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Any, AsyncIterator
+from collections import deque
+import threading
+import weakref
+import gc
+import asyncio
+import pickle
+import copy
 
 def test_dunder_iter():
 	@dunder_iter
@@ -747,6 +756,1521 @@ def test_dunder_missing():
 	test['d']
 	assert test.d == 1.0 
 
+def test_dunder_getitem_with_attr_index_out_of_bounds():
+	@dunder_getitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	test = Test([1, 2, 3])
+	assert test[-1] == 3
+	for index in (3, -4):
+		with pytest.raises(DunderDecoratorException) as exception_info:
+			test[index]
+		assert exception_info.value.message == 'index_out_of_bounds'
+
+def test_dunder_getitem_slots_key_not_hashable_exception():
+	@dunder_getitem(slots=True)
+	class Test(object):
+		__slots__ = ('a',)
+		def __init__(
+				self,
+				a: int,
+		) -> None:
+			self.a = a
+	test = Test(1)
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test[[1, 2, 3]]
+	assert exception_info.value.message == 'key_not_hashable'
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test['b']
+	assert exception_info.value.message == 'key_not_in_obj_slots'
+
+def test_dunder_missing_with_mapping_attr():
+	@dunder_getitem(attr='a')
+	@dunder_missing(attr='a', default_value=0)
+	class Test(object):
+		def __init__(
+				self,
+				a: Dict,
+		) -> None:
+			self.a = a
+	test = Test({'a' : 1})
+	assert test['a'] == 1
+	assert test['b'] == 0
+	assert test.a == {'a' : 1, 'b' : 0}
+
+def test_dunder_repr():
+	@dunder_repr
+	@dunder_setitem
+	class Test(object):
+		def __init__(
+				self,
+				a: int,
+				b: List,
+		) -> None:
+			self.a = a
+			self._b = b
+	test = Test(1, [1, 2])
+	test[1] = 'c'
+	assert repr(test) == "Test(a=1, _b=[1, 2], int_1='c')"
+
+def test_dunder_repr_slots():
+	@dunder_repr(slots=True)
+	class Test(object):
+		__slots__ = ('a', 'b')
+		def __init__(
+				self,
+				a: int,
+				b: str,
+		) -> None:
+			self.a = a
+			self.b = b
+	test = Test(1, 'b')
+	assert repr(test) == "Test(a=1, b='b')"
+	test.a = 5.662
+	assert repr(test) == "Test(a=5.662, b='b')"
+
+def test_dunder_setitem_with_iterable_attr_append_inplace():
+	@dunder_setitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	a = [1, 2, 3]
+	test = Test(a)
+	for i in range(3, 100):
+		test[i] = i + 1
+	test[-200] = 0
+	assert test.a is a
+	assert a == list(range(101))
+
+def test_dunder_setitem_with_iterable_attr_deque_growth():
+	@dunder_setitem(attr='a', growth='deque')
+	@dunder_getitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	test = Test([1, 2, 3])
+	test[3] = 4
+	test[-5] = 0
+	test[-7] = -1
+	assert isinstance(test.a, deque)
+	assert list(test.a) == [-1, 0, 1, 2, 3, 4]
+	assert test[0] == -1
+
+def test_dunder_setitem_with_iterable_attr_rebuild_growth():
+	@dunder_setitem(attr='a', growth='rebuild')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	a = [1, 2, 3]
+	test = Test(a)
+	test[3] = 4
+	test[-5] = 0
+	assert test.a == [0, 1, 2, 3, 4]
+	assert a == [1, 2, 3]
+
+def test_dunder_setitem_invalid_growth_exception():
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		@dunder_setitem(attr='a', growth='double')
+		class Test(object):
+			pass
+	assert exception_info.value.message == 'invalid_growth'
+
+def test_dunder_setitem_with_sparse_attr():
+	@dunder_setitem(attr='a', sparse=True)
+	@dunder_getitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	test = Test([1, 2, 3])
+	test[10 ** 12] = 4
+	test[0] = 0
+	assert isinstance(test.a, SparseSequence)
+	assert len(test.a) == 10 ** 12 + 1
+	assert test[10 ** 12] == 4
+	assert test[-1] == 4
+	assert test[10 ** 6] is None
+	assert list(test.a.items()) == [(0, 0), (1, 2), (2, 3), (10 ** 12, 4)]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test[-10 ** 13] = 5
+	assert exception_info.value.message == 'index_out_of_bounds'
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test[10 ** 13]
+	assert exception_info.value.message == 'index_out_of_bounds'
+
+def test_sparse_sequence():
+	a = SparseSequence([1, 2, 3], default=0)
+	a[6] = 7
+	assert list(a) == [1, 2, 3, 0, 0, 0, 7]
+	assert a[2:5] == [3, 0, 0]
+	a.insert(0, 0)
+	del a[2]
+	assert list(a) == [0, 1, 3, 0, 0, 0, 7]
+	a.append(8)
+	assert a == SparseSequence([0, 1, 3, 0, 0, 0, 7, 8], default=0)
+	assert a != SparseSequence([0, 1, 3], default=0)
+
+def test_dunder_getitem_get_many():
+	@dunder_getitem
+	@dunder_missing(default_value=0)
+	class Test(object):
+		def __init__(
+				self,
+				a: int,
+				b: int,
+		) -> None:
+			self.a = a
+			self.b = b
+	test = Test(1, 2)
+	assert test.get_many(['b', 'a']) == [2, 1]
+	assert test.get_many(iter(['a', 'c'])) == [1, 0]
+	assert test.c == 0
+
+def test_dunder_getitem_get_many_with_attr():
+	@dunder_getitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	test = Test([1, 2, 3])
+	assert test.get_many([0, -1]) == [1, 3]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test.get_many([0, 3])
+	assert exception_info.value.message == 'index_out_of_bounds'
+
+def test_dunder_getitem_get_many_slots():
+	@dunder_getitem(slots=True)
+	class Test(object):
+		__slots__ = ('a', 'b')
+		def __init__(
+				self,
+				a: int,
+				b: int,
+		) -> None:
+			self.a = a
+			self.b = b
+	test = Test(1, 2)
+	assert test.get_many(('a', 'b')) == [1, 2]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test.get_many(['a', [1]])
+	assert exception_info.value.message == 'key_not_hashable'
+
+def test_dunder_setitem_set_many_and_update():
+	@dunder_setitem
+	class Test(object):
+		def __init__(
+				self,
+				a: int,
+		) -> None:
+			self.a = a
+	test = Test(1)
+	test.set_many([('a', 2), ('b', 3)])
+	test.update({'c' : 4}, d=5)
+	assert test.__dict__ == {'a' : 2, 'b' : 3, 'c' : 4, 'd' : 5}
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test.set_many([('e', 6), ([1], 7)])
+	assert exception_info.value.message == 'key_not_hashable'
+
+def test_dunder_setitem_set_many_with_attr():
+	@dunder_setitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	test = Test([1, 2, 3])
+	test.set_many([(0, 0), (-1, 4), (5, 5)])
+	assert test.a == [0, 2, 4, 5]
+	test.a = [1, 2, 3]
+	test.set_many([(slice(0, 1), [7, 8, 9]), (10, 'x')])
+	assert test.a == [7, 8, 9, 2, 3, 'x']
+	test.a = {'a' : 1}
+	test.update([('b', 2)])
+	assert test.a == {'a' : 1, 'b' : 2}
+
+def test_dunder_setitem_keeps_user_defined_update():
+	@dunder_setitem
+	class Test(object):
+		def update(self) -> str:
+			return 'user defined'
+	test = Test()
+	assert test.update() == 'user defined'
+	test.set_many([('a', 1)])
+	assert test.a == 1
+
+def test_dunder_getitem_slice_view():
+	@dunder_getitem(attr='a')
+	@dunder_setitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	test = Test([0, 1, 2, 3, 4, 5])
+	view = test[1::2]
+	assert isinstance(view, SequenceView)
+	assert view == [1, 3, 5]
+	assert view[1:] == [3, 5]
+	view[0] = 10
+	assert test.a == [0, 10, 2, 3, 4, 5]
+	test[0:2] = [7, 8, 9]
+	assert test.a == [7, 8, 9, 2, 3, 4, 5]
+
+def test_dunder_getitem_slice_memoryview():
+	@dunder_getitem(attr='a')
+	@dunder_setitem(attr='a')
+	class Test(object):
+		def __init__(
+				self,
+				a: bytearray,
+		) -> None:
+			self.a = a
+	test = Test(bytearray(b'hello world'))
+	view = test[:5]
+	assert isinstance(view, memoryview)
+	test[:5] = b'HELLO'
+	assert bytes(view) == b'HELLO'
+	assert test.a == bytearray(b'HELLO world')
+
+def test_dunder_getitem_and_setitem_ndarray():
+	np = pytest.importorskip('numpy')
+	@dunder_getitem(attr='a', ndarray=True)
+	@dunder_setitem(attr='a', ndarray=True)
+	class Test(object):
+		def __init__(
+				self,
+				a: 'np.ndarray',
+		) -> None:
+			self.a = a
+	test = Test(np.arange(12).reshape(3, 4))
+	assert test[1, 2] == 6
+	assert test[:, 0].tolist() == [0, 4, 8]
+	assert test[np.array([0, 2])].shape == (2, 4)
+	assert test[test.a > 9].tolist() == [10, 11]
+	test[test.a % 2 == 0] = 0
+	test[0] = np.array([1, 2, 3, 4])
+	assert test.a.tolist() == [[1, 2, 3, 4], [0, 5, 0, 7], [0, 9, 0, 11]]
+	assert [v.tolist() for v in test.get_many([0, (1, 1)])] == [[1, 2, 3, 4], 5]
+	with pytest.raises(IndexError):
+		test[3]
+
+def test_dunder_setitem_threadsafe():
+	@dunder_setitem(attr='a', growth='rebuild', threadsafe=True)
+	class Test(object):
+		def __init__(
+				self,
+				a: List,
+		) -> None:
+			self.a = a
+	test = Test([])
+	def append(start: int) -> None:
+		for i in range(start, start + 500):
+			test[4000] = i
+	threads = [
+		threading.Thread(target=append, args=(i * 500,)) 
+		for i in range(8)
+	]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert sorted(test.a) == list(range(4000))
+
+def test_dunder_getitem_threadsafe_missing():
+	@dunder_getitem(attr='a', threadsafe='key')
+	@dunder_missing(attr='a', threadsafe='key')
+	@dunder_setitem(attr='a', threadsafe='key')
+	@dunder_iter(attr='a', threadsafe=True)
+	@dunder_repr(threadsafe=True)
+	class Test(object):
+		def __init__(
+				self,
+				a: Dict,
+		) -> None:
+			self.a = a
+	test = Test({'a' : 1})
+	def read() -> None:
+		for i in range(200):
+			test[i % 20]
+	threads = [threading.Thread(target=read) for i in range(8)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert len(test.a) == 21
+	test['a'] = 2
+	assert dict(test)['a'] == 2
+	assert repr(test).startswith('Test(a=')
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test[[1]]
+	assert exception_info.value.message == 'key_not_hashable'
+
+def test_dunder_missing_threadsafe_compute_outside_lock():
+	entered = [threading.Event(), threading.Event()]
+
+	def compute(
+			key: int,
+	) -> int:
+		if key > 1:
+			return key
+		entered[key].set()
+		entered[1 - key].wait(1)
+		# 64 and 65 share the lock stripes of 0 and 1, which the
+		# other thread is missing
+		return test[65 - key]
+
+	@dunder_getitem(threadsafe='key')
+	@dunder_missing(compute=compute, threadsafe='key')
+	class Test(object):
+		pass
+
+	test = Test()
+	threads = [
+		threading.Thread(target=test.__getitem__, args=(key,), daemon=True)
+		for key in (0, 1)
+	]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join(5)
+	assert not any(thread.is_alive() for thread in threads)
+	assert (test[0], test[1], test[64], test[65]) == (65, 64, 64, 65)
+
+def test_dunder_decorator_invalid_threadsafe_exception():
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		@dunder_iter(threadsafe='global')
+		class Test(object):
+			pass
+	assert exception_info.value.message == 'invalid_threadsafe'
+
+def test_dunder_aiter():
+	@dunder_aiter(batch_size=2)
+	class Test(object):
+
+		def __init__(
+				self,
+				a: int,
+				b: int,
+				c: int,
+		) -> None:
+			self.a = a
+			self.b = b
+			self.c = c
+
+	@dunder_aiter(attr='a', prefetch=2)
+	class TestAttr(object):
+
+		def __init__(
+				self,
+				a: Any,
+		) -> None:
+			self.a = a
+
+	async def numbers(
+			n: int,
+	) -> AsyncIterator[int]:
+		for i in range(n):
+			yield i
+
+	async def collect(
+			obj: Any,
+	) -> List[Any]:
+		return [item async for item in obj]
+
+	async def from_queue() -> List[int]:
+		queue = asyncio.Queue()
+		for item in (1, 2, None):
+			queue.put_nowait(item)
+		return await collect(TestAttr(queue))
+
+	assert asyncio.run(collect(Test(1, 2, 3))) == \
+		[('a', 1), ('b', 2), ('c', 3)]
+	assert asyncio.run(collect(TestAttr(numbers(10)))) == list(range(10))
+	assert asyncio.run(collect(TestAttr([1, 2, 3]))) == [1, 2, 3]
+	assert asyncio.run(collect(TestAttr({'a' : 1}))) == [('a', 1)]
+	assert asyncio.run(from_queue()) == [1, 2]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		asyncio.run(collect(TestAttr(1)))
+	assert exception_info.value.message == 'iterable'
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		@dunder_aiter(batch_size=0)
+		class TestBatchSize(object):
+			pass
+	assert exception_info.value.message == 'invalid_batch_size'
+
+def test_dunder_missing_default_factory_and_compute():
+	@dunder_getitem(attr='a')
+	@dunder_missing(attr='a', default_factory=list)
+	class Test(object):
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = {}
+
+	calls = []
+
+	@dunder_getitem
+	@dunder_missing(compute=lambda key: calls.append(key) or key * 2)
+	class TestCompute(object):
+		pass
+
+	test = Test()
+	test['b'].append(1)
+	assert test['b'] == [1]
+	assert test['c'] == []
+	assert test['b'] is not test['c']
+	test_compute = TestCompute()
+	assert test_compute[3] == 6
+	assert test_compute[3] == 6
+	assert calls == [3]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		@dunder_missing(default_value=1, compute=abs)
+		class TestConflict(object):
+			pass
+	assert exception_info.value.message == 'conflicting_defaults'
+
+def test_dunder_slots():
+	@dunder_slots
+	@dunder_repr
+	@dunder_setitem
+	@dunder_getitem
+	@dunder_iter
+	class Test(object):
+		a: int
+
+		def __init__(
+				self,
+				a: int,
+				b: int,
+		) -> None:
+			self.a = a
+			self.b = b
+			self.c = a + b
+
+	@dunder_slots
+	@dunder_getitem(attr='data')
+	@dunder_missing(attr='data', default_factory=list)
+	class TestAttr(object):
+
+		def __init__(
+				self,
+		) -> None:
+			self.data = {}
+
+	test = Test(1, 2)
+	assert Test.__slots__ == ('a', 'b', 'c')
+	assert not hasattr(test, '__dict__')
+	assert list(test) == [('a', 1), ('b', 2), ('c', 3)]
+	assert repr(test) == 'Test(a=1, b=2, c=3)'
+	test['b'] = 5
+	assert test['b'] == 5
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test['d'] = 1
+	assert exception_info.value.message == 'slots_immutable'
+	test_attr = TestAttr()
+	assert TestAttr.__slots__ == ('data',)
+	assert test_attr['a'] == []
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		@dunder_slots
+		class TestConflict(object):
+			a: int = 0
+	assert exception_info.value.message == 'slot_conflicts_class_attr'
+
+def test_dunder_decorators_inherited_slots():
+	@dunder_repr(slots=True)
+	@dunder_getitem(slots=True)
+	@dunder_iter(slots=True)
+	class Test(object):
+		__slots__ = ('a', '__weakref__')
+
+		def __init__(
+				self,
+				a: int,
+		) -> None:
+			self.a = a
+
+	class TestChild(Test):
+		__slots__ = ('b',)
+
+		def __init__(
+				self,
+				a: int,
+				b: int,
+		) -> None:
+			super().__init__(a)
+			self.b = b
+
+		def __repr__(
+				self,
+		) -> str:
+			return 'TestChild'
+
+	test = TestChild(1, 2)
+	assert list(test) == [('a', 1), ('b', 2)]
+	assert test['b'] == 2
+	assert repr(test) == 'TestChild'
+	assert list(Test(1)) == [('a', 1)]
+
+def test_dunder_decorators_subclass_gains_dict():
+	@dunder_repr
+	@dunder_getitem
+	@dunder_setitem
+	@dunder_iter
+	class Test(object):
+		__slots__ = ('a',)
+
+	class TestChild(Test):
+		pass
+
+	test = TestChild()
+	test['b'] = 2
+	assert test['b'] == 2
+	assert list(test) == [('b', 2)]
+	assert repr(test) == 'TestChild(b=2)'
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		list(Test())
+	assert exception_info.value.message == ('dict', 'iter')
+
+def test_instrumentation():
+	@dunder_getitem
+	@dunder_missing(compute=lambda key: key * 2)
+	class Test(object):
+		pass
+
+	getitem = Test.__getitem__
+	instrumentation.enable(Test)
+	test = Test()
+	test[1]
+	test[1]
+	with pytest.raises(DunderDecoratorException):
+		test[[1]]
+	stats = instrumentation.snapshot(Test)
+	methods = stats[f'{Test.__module__}.{Test.__qualname__}']
+	assert methods['__getitem__']['calls'] == 3
+	assert methods['__getitem__']['hits'] == 1
+	assert methods['__getitem__']['misses'] == 2
+	assert methods['__missing__']['calls'] == 1
+	assert sum(methods['__getitem__']['histogram'].values()) == 3
+	instrumentation.disable(Test)
+	assert Test.__getitem__ is getitem
+	test[2]
+	assert instrumentation.snapshot(Test)[
+		f'{Test.__module__}.{Test.__qualname__}'
+	]['__getitem__']['calls'] == 3
+
+def test_instrumentation_enabled_while_deferred():
+	with deferred():
+		@dunder_getitem
+		@dunder_missing(compute=lambda key: key * 2)
+		class Test(object):
+			pass
+
+		instrumentation.enable(Test)
+
+	test = Test()
+	assert test[1] == 2
+	assert test[1] == 2
+	assert getattr(Test.__dict__['__getitem__'], '__instrumented__', False)
+	assert getattr(Test.__dict__['__missing__'], '__instrumented__', False)
+	methods = instrumentation.snapshot(Test)[
+		f'{Test.__module__}.{Test.__qualname__}'
+	]
+	assert methods['__getitem__']['calls'] == 2
+	assert methods['__getitem__']['hits'] == 1
+	assert methods['__getitem__']['misses'] == 1
+	assert methods['__missing__']['calls'] == 1
+	instrumentation.disable(Test)
+	assert not hasattr(Test.__dict__['__getitem__'], '__instrumented__')
+
+def test_dunder_decorator_exception_types():
+	@dunder_getitem
+	class Test(object):
+		pass
+
+	@dunder_getitem(attr='a')
+	class TestAttr(object):
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = [1]
+
+	with pytest.raises(KeyError) as exception_info:
+		Test()['a']
+	assert isinstance(exception_info.value, DunderDecoratorException)
+	assert exception_info.value.formatted is None
+	message = str(exception_info.value)
+	assert str(exception_info.value) is message
+	with pytest.raises(TypeError):
+		Test()[[1]]
+	with pytest.raises(IndexError):
+		TestAttr()[5]
+
+def test_dunder_getitem_get_has_pop():
+	@dunder_getitem
+	class Test(object):
+		pass
+
+	@dunder_getitem(slots=True)
+	class TestSlots(object):
+		__slots__ = ('a', 'b')
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = 1
+
+	@dunder_getitem(attr='a')
+	class TestAttr(object):
+
+		def __init__(
+				self,
+				a: Any,
+		) -> None:
+			self.a = a
+
+	test = Test()
+	test.a = 1
+	assert test.get('a') == 1 and test.get('b', 2) == 2
+	assert test.has('a') and not test.has('b')
+	assert test.pop('a') == 1 and test.pop('a', None) is None
+	with pytest.raises(KeyError):
+		test.pop('a')
+	test_slots = TestSlots()
+	assert test_slots.get('a') == 1 and test_slots.get('b', 2) == 2
+	assert test_slots.has('a') and not test_slots.has('b')
+	assert not test_slots.has('c')
+	assert test_slots.pop('a') == 1 and not test_slots.has('a')
+	test_mapping = TestAttr({'a' : 1})
+	assert test_mapping.get('a') == 1 and test_mapping.get('b') is None
+	assert test_mapping.has('a') and test_mapping.pop('a') == 1
+	assert test_mapping.a == {}
+	test_sequence = TestAttr(deque([1, 2, 3]))
+	assert test_sequence.get(-1) == 3 and test_sequence.get(3) is None
+	assert test_sequence.has(2) and not test_sequence.has(3)
+	assert test_sequence.pop(0) == 1 and test_sequence.a == deque([2, 3])
+	with pytest.raises(IndexError):
+		test_sequence.pop(5)
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test.get([1])
+	assert exception_info.value.message == 'key_not_hashable'
+
+def test_dunder_iter_native():
+	@dunder_iter(native=True)
+	class Test(object):
+		pass
+
+	@dunder_iter(slots=True, native=True)
+	class TestSlots(object):
+		__slots__ = ('a', 'b')
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = 1
+			self.b = 2
+
+	@dunder_iter(attr='a', native=True)
+	class TestAttr(object):
+
+		def __init__(
+				self,
+				a: Any,
+		) -> None:
+			self.a = a
+
+	test = Test()
+	test.a = 1
+	assert type(iter(test)) is type(iter({}.items()))
+	assert list(test) == [('a', 1)]
+	assert list(TestSlots()) == [('a', 1), ('b', 2)]
+	assert type(iter(TestAttr([1, 2]))) is type(iter([]))
+	assert list(TestAttr((1, 2))) == [1, 2]
+	assert list(TestAttr({'a' : 1})) == [('a', 1)]
+	assert list(TestAttr({1, 2})) == [1, 2]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		iter(TestAttr(1))
+	assert exception_info.value.message == 'iterable'
+
+def test_deferred_specialization():
+	with deferred():
+		@dunder_getitem
+		@dunder_missing(default_value=0)
+		@dunder_iter
+		class Test(object):
+			pass
+
+		@dunder_repr
+		class TestRepr(object):
+
+			def __init__(
+					self,
+			) -> None:
+				self.a = 1
+
+		@dunder_repr
+		class TestStub(object):
+
+			def __init__(
+					self,
+			) -> None:
+				self.a = 1
+
+	assert Test.__dict__['__getitem__'].__deferred__
+	assert repr(TestStub()) == 'TestStub(a=1)'
+	test = Test()
+	assert test['a'] == 0
+	assert '__dunder_pending__' not in Test.__dict__
+	assert not getattr(Test.__getitem__, '__deferred__', False)
+	assert list(test) == [('a', 0)]
+	assert test.get('b', 1) == 1
+	specialize()
+	assert not getattr(TestRepr.__repr__, '__deferred__', False)
+	assert repr(TestRepr()) == 'TestRepr(a=1)'
+
+def test_deferred_hidden_slot_copy_stays_deferred():
+	with deferred():
+		@dunder_hash
+		@dunder_eq
+		class Test(object):
+
+			def __init__(
+					self,
+			) -> None:
+				self.a = 1
+
+		@dunder_hash
+		@dunder_eq
+		class TestDeclared(object):
+			__slots__ = ('__dict__', '__dunder_hash__')
+
+			def __init__(
+					self,
+			) -> None:
+				self.a = 1
+
+	assert getattr(Test.__eq__, '__deferred__', False)
+	assert getattr(Test.__hash__, '__deferred__', False)
+	assert getattr(TestDeclared.__eq__, '__deferred__', False)
+	assert getattr(TestDeclared.__hash__, '__deferred__', False)
+	assert Test() == Test()
+	assert hash(Test()) == hash(TestDeclared())
+	assert not hasattr(Test.__eq__, '__deferred__')
+	assert '__dunder_hash__' in Test.__slots__
+	with deferred():
+		@dunder_hash
+		@dunder_getitem(threadsafe='bogus')
+		class TestInvalid(object):
+			pass
+
+	with pytest.raises(DunderDecoratorException):
+		TestInvalid()['a']
+
+def test_deferred_is_thread_local():
+	entered, done = threading.Event(), threading.Event()
+
+	def hold() -> None:
+		with deferred():
+			entered.set()
+			done.wait(5)
+
+	thread = threading.Thread(target=hold)
+	thread.start()
+	try:
+		entered.wait(5)
+
+		@dunder_getitem
+		class Test(object):
+			pass
+
+		assert not getattr(Test.__getitem__, '__deferred__', False)
+		assert '__dunder_pending__' not in Test.__dict__
+	finally:
+		done.set()
+		thread.join()
+
+def test_dunder_decorators_share_code():
+	from dunderdecorators import codegen
+
+	@dunder_repr(slots=True)
+	@dunder_getitem(slots=True)
+	class First(object):
+		__slots__ = ('a', 'b')
+
+	compiled = len(codegen.SHARED_CODE)
+
+	@dunder_repr(slots=True)
+	@dunder_getitem(slots=True)
+	class Second(object):
+		__slots__ = ('a', 'b')
+
+	assert len(codegen.SHARED_CODE) == compiled
+	assert First.__getitem__ is not Second.__getitem__
+	assert First.__getitem__.__code__.co_code == Second.__getitem__.__code__.co_code
+	for method in (Second.__getitem__, Second.get_many, Second.__repr__):
+		assert method.__qualname__.startswith(Second.__qualname__ + '.')
+		assert method.__module__ == Second.__module__
+		assert getattr(
+			method.__code__, 'co_qualname', method.__qualname__
+		) == method.__qualname__
+	test = Second()
+	test.a = 1
+	assert test['a'] == 1
+	assert First.__getitem__.__qualname__.endswith('First.__getitem__')
+
+def test_dunder_contains_and_len():
+	@dunder_len
+	@dunder_contains
+	@dunder_iter
+	class Test(object):
+		pass
+
+	@dunder_len(slots=True)
+	@dunder_contains(slots=True)
+	class TestSlots(object):
+		__slots__ = ('a', 'b')
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = 1
+
+	@dunder_len(attr='a')
+	@dunder_contains(attr='a')
+	class TestAttr(object):
+
+		def __init__(
+				self,
+				a: Any,
+		) -> None:
+			self.a = a
+
+	test = Test()
+	test.a = 1
+	assert 'a' in test and ('a', 1) not in test
+	assert len(test) == 1
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		[1] in test
+	assert exception_info.value.message == 'key_not_hashable'
+	test_slots = TestSlots()
+	assert 'a' in test_slots and 'b' not in test_slots
+	assert 'c' not in test_slots and len(test_slots) == 1
+	test_slots.b = 2
+	assert 'b' in test_slots and len(test_slots) == 2
+	del test_slots.a
+	assert 'a' not in test_slots and len(test_slots) == 1
+	assert len(TestSlots.__new__(TestSlots)) == 0
+	assert 'a' in TestAttr({'a' : 1}) and 2 in TestAttr({1, 2})
+	assert len(TestAttr([1, 2, 3])) == 3
+
+def test_dunder_contains_and_len_messages():
+	@dunder_len
+	@dunder_contains
+	class TestDict(object):
+		__slots__ = ('a',)
+
+	@dunder_len(slots=True)
+	@dunder_contains(slots=True)
+	class TestSlots(object):
+		pass
+
+	for test, message in (
+			(TestDict(), 'dict'),
+			(TestSlots(), 'slots'),
+	):
+		with pytest.raises(DunderDecoratorException) as exception_info:
+			'a' in test
+		assert exception_info.value.message == (message, 'contains')
+		assert 'dunder_contains' in str(exception_info.value)
+		with pytest.raises(DunderDecoratorException) as exception_info:
+			len(test)
+		assert exception_info.value.message == (message, 'len')
+		assert 'dunder_len' in str(exception_info.value)
+
+def test_dunder_setitem_set_many_slots():
+	@dunder_setitem(slots=True)
+	class Test(object):
+		__slots__ = ('a', 'b')
+
+	test = Test()
+	test.set_many([('a', 1), ('b', 2)])
+	test.update(a=3)
+	assert (test.a, test.b) == (3, 2)
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test.set_many([('c', 1)])
+	assert exception_info.value.message == 'slots_immutable'
+
+def test_dunder_slots_set_many_get_many_inherited():
+	@dunder_getitem(slots=True)
+	@dunder_setitem(slots=True)
+	class Test(object):
+		__slots__ = ('a',)
+
+	class TestChild(Test):
+		__slots__ = ('b',)
+
+	test = TestChild()
+	test.set_many([('a', 1), ('b', 2)])
+	assert test.get_many(('b', 'a')) == [2, 1]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		test.get_many(('a', 'c'))
+	assert exception_info.value.message == 'key_not_in_obj_slots'
+	assert str(exception_info.value).endswith("['a', 'b']")
+
+def test_dunder_eq_and_hash():
+	@dunder_hash(slots=True)
+	@dunder_eq(slots=True)
+	class TestSlots(object):
+		__slots__ = ('a', 'b')
+
+		def __init__(
+				self,
+				a: Any,
+				b: Any,
+		) -> None:
+			self.a = a
+			self.b = b
+
+	@dunder_hash
+	@dunder_eq
+	@dunder_setitem(frozen=True)
+	class Test(object):
+
+		def __init__(
+				self,
+				a: Any,
+		) -> None:
+			self.a = a
+
+	@dunder_eq
+	class TestEq(object):
+		pass
+
+	test_slots = TestSlots(1, 2)
+	assert TestSlots.__slots__ == ('a', 'b', '__dunder_hash__')
+	assert test_slots == TestSlots(1, 2) and test_slots != TestSlots(1, 3)
+	assert len({test_slots, TestSlots(1, 2), TestSlots(1, 3)}) == 2
+	assert test_slots.__dunder_hash__ == hash((1, 2))
+	test = Test(1)
+	assert test.__dict__ == {'a' : 1}
+	assert test == Test(1) and hash(test) == hash(Test(1))
+	assert test != Test(2) and test != TestSlots(1, 2)
+	with pytest.raises(TypeError) as exception_info:
+		test['a'] = 2
+	assert exception_info.value.message == 'frozen'
+	with pytest.raises(TypeError):
+		test.update(a=2)
+	assert test.a == 1
+	assert TestEq.__hash__ is None
+	with deferred():
+		@dunder_eq
+		class TestDeferred(object):
+			pass
+
+		@dunder_hash
+		@dunder_eq
+		class TestDeferredHash(object):
+			pass
+
+		assert TestDeferred.__hash__ is None
+		with pytest.raises(TypeError):
+			hash(TestDeferred())
+	assert hash(TestDeferredHash()) == hash(frozenset())
+
+def test_dunder_eq_after_mutation():
+	@dunder_hash
+	@dunder_eq
+	class Test(object):
+
+		def __init__(
+				self,
+				a: Any,
+		) -> None:
+			self.a = a
+
+	test, other = Test(1), Test(2)
+	hash(test), hash(other)
+	other.a = 1
+	assert test == other
+	assert '__dunder_hash__' not in Test.__eq__.__source__
+	assert '__dunder_hash__' in FrozenHash.__eq__.__source__
+
+def test_dunder_eq_and_hash_messages():
+	@dunder_hash
+	@dunder_eq
+	class TestDict(object):
+		__slots__ = ('a',)
+
+	@dunder_eq(slots=True)
+	class TestSlots(object):
+		pass
+
+	for test, message in (
+			(TestDict(), 'dict'),
+			(TestSlots(), 'slots'),
+	):
+		with pytest.raises(DunderDecoratorException) as exception_info:
+			test == type(test)()
+		assert exception_info.value.message == (message, 'eq')
+		assert 'dunder_eq' in str(exception_info.value)
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		hash(TestDict())
+	assert exception_info.value.message == ('dict', 'hash')
+	assert 'dunder_hash' in str(exception_info.value)
+
+def test_dunder_hash_with_dunder_slots():
+	@dunder_slots
+	@dunder_hash
+	@dunder_eq
+	@dunder_repr
+	class Test(object):
+
+		def __init__(
+				self,
+				a: Any,
+				b: Any,
+		) -> None:
+			self.a = a
+			self.b = b
+
+	test = Test(1, 2)
+	assert Test.__slots__ == ('a', 'b', '__dunder_hash__')
+	assert not hasattr(test, '__dict__')
+	assert repr(test) == 'Test(a=1, b=2)'
+	assert test == Test(1, 2) and hash(test) == hash((1, 2))
+
+def test_hidden_slot_declared_keeps_class():
+	class Test(object):
+		__slots__ = ('__dict__', '__dunder_hash__', '__dunder_cache__')
+
+	class TestCopied(object):
+		pass
+
+	assert dunder_hash(Test) is Test
+	assert dunder_missing(maxsize=1)(Test) is Test
+	assert dunder_hash(TestCopied) is not TestCopied
+	test = Test()
+	test.a = 1
+	assert hash(test) == hash(frozenset({('a', 1)}))
+
+def test_dunder_order():
+	@dunder_order
+	class Test(object):
+
+		def __init__(
+				self,
+				a: Any,
+				b: Any,
+		) -> None:
+			self.a = a
+			self.b = b
+
+	@dunder_order(slots=True)
+	class TestSlots(object):
+		__slots__ = ('a',)
+
+		def __init__(
+				self,
+				a: Any,
+		) -> None:
+			self.a = a
+
+	class TestSubclass(TestSlots):
+		__slots__ = ('b',)
+
+		def __init__(
+				self,
+				a: Any,
+				b: Any,
+		) -> None:
+			super().__init__(a)
+			self.b = b
+
+	assert Test(1, 2) < Test(1, 3) and Test(1, 3) <= Test(1, 3)
+	assert Test(2, 0) > Test(1, 9) and Test(2, 0) >= Test(2, 0)
+	records = [Test(2, 1), Test(1, 2), Test(1, 1)]
+	records.sort(key=Test.sort_key)
+	assert [(test.a, test.b) for test in records] == [(1, 1), (1, 2), (2, 1)]
+	assert sorted(records, reverse=True)[0].a == 2
+	with pytest.raises(TypeError):
+		Test(1, 2) < 1
+	assert TestSlots(1) < TestSlots(2)
+	assert TestSubclass(1, 1) < TestSubclass(1, 2)
+	assert TestSubclass.sort_key(TestSubclass(1, 2)) == (1, 2)
+
+def test_dunder_order_messages():
+	@dunder_order
+	class TestDict(object):
+		__slots__ = ('a',)
+
+	@dunder_order(slots=True)
+	class TestSlots(object):
+		pass
+
+	for test, message in (
+			(TestDict(), 'dict'),
+			(TestSlots(), 'slots'),
+	):
+		with pytest.raises(DunderDecoratorException) as exception_info:
+			test < type(test)()
+		assert exception_info.value.message == (message, 'order')
+		assert 'dunder_order' in str(exception_info.value)
+
+def test_dunder_missing_maxsize():
+	@dunder_getitem(attr='a')
+	@dunder_missing(attr='a', compute=lambda key: key ** 2, maxsize=2)
+	class Test(object):
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = {'a' : 1}
+
+	@dunder_getitem
+	@dunder_missing(default_factory=list, maxsize=2, policy='lfu')
+	class TestLFU(object):
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = 1
+
+	test = Test()
+	assert (test[2], test[3], test[2], test[4]) == (4, 9, 4, 16)
+	assert test.a == {'a' : 1, 2 : 4, 4 : 16}
+	test_lfu = TestLFU()
+	test_lfu['b'], test_lfu['b'], test_lfu['c'], test_lfu['d']
+	assert list(test_lfu.__dict__) == ['a', 'b', 'd']
+	assert test_lfu['a'] == 1 and test_lfu.get_many(['b', 'd']) == [[], []]
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		dunder_missing(maxsize=0)(TestLFU)
+	assert exception_info.value.message == 'invalid_maxsize'
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		dunder_missing(maxsize=1, policy='fifo')(TestLFU)
+	assert exception_info.value.message == 'invalid_policy'
+
+def test_dunder_missing_ttl():
+	now = [0.0]
+	computed = []
+
+	def compute(
+			key: Any,
+	) -> Any:
+		computed.append(key)
+		return (key, now[0])
+
+	@dunder_getitem(attr='a')
+	@dunder_missing(attr='a', compute=compute, ttl=10, clock=lambda: now[0])
+	class Test(object):
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = {}
+
+	@dunder_getitem
+	@dunder_missing(
+		default_value=1, 
+		ttl=lambda key: None if key == 'kept' else 1, 
+		clock=lambda: now[0], 
+		sweep=0.01,
+		threadsafe=True,
+	)
+	class TestSweep(object):
+		pass
+
+	test = Test()
+	assert test[1] == (1, 0.0)
+	now[0] = 5.0
+	assert test[1] == (1, 0.0) and computed == [1]
+	now[0] = 10.0
+	assert test[1] == (1, 10.0) and computed == [1, 1]
+	test_sweep = TestSweep()
+	test_sweep['kept'], test_sweep['expired']
+	now[0] = 20.0
+	for _ in range(200):
+		if 'expired' not in test_sweep.__dict__:
+			break
+		threading.Event().wait(0.01)
+	assert test_sweep.__dict__ == {'kept' : 1}
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		dunder_missing(sweep=1)(TestSweep)
+	assert exception_info.value.message == 'invalid_sweep'
+	with pytest.raises(DunderDecoratorException) as exception_info:
+		dunder_missing(ttl=1, sweep=1)(TestSweep)
+	assert exception_info.value.message == 'invalid_sweep'
+
+def test_dunder_missing_sweeper_exits():
+	@dunder_getitem
+	@dunder_missing(ttl=1, sweep=0.01, threadsafe=True)
+	class Test(object):
+		pass
+
+	sweeper = Test.__missing__.__globals__['unlocked'].__globals__['sweeper']
+	test = Test()
+	test['a']
+	tracker = weakref.ref(test.__dunder_cache__)
+	assert sweeper.thread is not None
+	threading.Event().wait(0.05)
+	del test
+	gc.collect()
+	for _ in range(200):
+		if sweeper.thread is None:
+			break
+		threading.Event().wait(0.01)
+	assert sweeper.thread is None and tracker() is None
+
+@pytest.mark.parametrize('threadsafe', [True, 'key'])
+def test_dunder_missing_sweep_while_iterating(threadsafe):
+	@dunder_repr(threadsafe=True)
+	@dunder_iter(threadsafe=True)
+	@dunder_getitem(threadsafe=threadsafe)
+	@dunder_missing(ttl=0.001, sweep=0.001, threadsafe=threadsafe)
+	class Test(object):
+		pass
+
+	test = Test()
+	deadline = threading.Event()
+	threading.Timer(0.3, deadline.set).start()
+	while not deadline.is_set():
+		for key in range(50):
+			test[key]
+		for _ in range(20):
+			list(test)
+			repr(test)
+			test.get_many(range(5))
+
+def test_dunder_missing_maxsize_lookups():
+	@dunder_getitem
+	@dunder_missing(compute=lambda key: key * 2, maxsize=2)
+	class Test(object):
+		pass
+
+	test = Test()
+	test['a'], test['b']
+	assert test.get('a') == 'aa' and test.has('b')
+	test['c']
+	assert list(test.__dict__) == ['b', 'c']
+	assert test.has('b') and test.get('a') is None
+	assert test.pop('c') == 'cc'
+	test['d']
+	assert list(test.__dict__) == ['b', 'd']
+
+def test_dunder_missing_ttl_lookups():
+	now = [0.0]
+
+	@dunder_len
+	@dunder_contains
+	@dunder_getitem
+	@dunder_missing(compute=lambda key: now[0], ttl=1, clock=lambda: now[0])
+	class Test(object):
+		pass
+
+	test = Test()
+	assert len(test) == 0
+	test['a'], test['b'], test['c']
+	test.d = 'kept'
+	assert 'a' in test and test.get('a') == 0.0 and test.has('a')
+	assert len(test) == 4
+	now[0] = 1.0
+	assert 'a' not in test and not test.has('a') and len(test) == 1
+	assert test.get('a', 'expired') == 'expired'
+	assert test.pop('b', 'expired') == 'expired'
+	with pytest.raises(KeyError):
+		test.pop('c')
+	assert test['a'] == 1.0 and 'a' in test and len(test) == 2
+
+@pytest.mark.parametrize('policy', ['lru', 'lfu'])
+def test_dunder_missing_maxsize_threadsafe(
+		policy: str,
+) -> None:
+	@dunder_getitem(attr='a', threadsafe='key')
+	@dunder_missing(
+		attr='a', 
+		compute=lambda key: key, 
+		maxsize=8, 
+		policy=policy, 
+		threadsafe='key'
+	)
+	class Test(object):
+
+		def __init__(
+				self,
+		) -> None:
+			self.a = {}
+
+	test = Test()
+	errors = []
+
+	def read(
+			offset: int,
+	) -> None:
+		try:
+			for i in range(2000):
+				key = (i * 7 + offset) % 40
+				assert test[key] == key
+				test.get(key)
+		except BaseException as error:
+			errors.append(error)
+
+	threads = [threading.Thread(target=read, args=(i,)) for i in range(8)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert errors == []
+	assert len(test.a) <= 8
+
+def test_dunder_aiter_sentinel_not_shared():
+	def make(
+			sentinel: Any,
+	) -> type:
+		@dunder_aiter(attr='queue', sentinel=sentinel)
+		class Test(object):
+
+			def __init__(
+					self,
+			) -> None:
+				self.queue = asyncio.Queue()
+		return Test
+
+	first_sentinel, second_sentinel = tuple(['done', 1]), tuple(['done', 1])
+	first, second = make(first_sentinel), make(second_sentinel)
+
+	async def consume() -> List[Any]:
+		test = second()
+		for item in (1, 2, second_sentinel):
+			test.queue.put_nowait(item)
+		return [item async for item in test]
+
+	assert asyncio.run(asyncio.wait_for(consume(), 1)) == [1, 2]
+
+@dunder_hash
+@dunder_eq
+class PickledHash(object):
+
+	def __init__(
+			self,
+			a: Any,
+	) -> None:
+		self.a = a
+
+@dunder_hash
+@dunder_eq
+@dunder_setitem(frozen=True)
+class FrozenHash(object):
+	pass
+
+@dunder_slots
+@dunder_hash
+@dunder_eq
+class PickledSlotsHash(object):
+
+	def __init__(
+			self,
+			a: Any,
+			b: Any,
+	) -> None:
+		self.a = a
+		self.b = b
+
+@dunder_getitem(attr='a')
+@dunder_missing(attr='a', compute=lambda key: key * 2, maxsize=2)
+class PickledCache(object):
+
+	def __init__(
+			self,
+	) -> None:
+		self.a = {}
+
+@dunder_getitem
+@dunder_missing(compute=lambda key: key, maxsize=2, policy='lfu')
+class PickledDictCache(object):
+	pass
+
+def test_hidden_slots_not_pickled_or_copied():
+	for test, fresh in (
+			(PickledHash('a'), PickledHash('a')),
+			(PickledSlotsHash('a', 2), PickledSlotsHash('a', 2)),
+	):
+		hash(test)
+		test.__dunder_hash__ = 0
+		for other in (
+				pickle.loads(pickle.dumps(test)),
+				copy.copy(test),
+				copy.deepcopy(test),
+		):
+			assert other == test
+			assert not hasattr(other, '__dunder_hash__')
+			assert hash(other) == hash(fresh)
+	test = PickledCache()
+	test[1], test[2], test[1]
+	test_dict = PickledDictCache()
+	test_dict['a'], test_dict['b'], test_dict['b']
+	for copier in (copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))):
+		other = copier(test)
+		assert other.a == test.a
+		assert other.__dunder_cache__ is not test.__dunder_cache__
+		other[3]
+		assert len(other.a) <= 2 and other.a == {1 : 2, 3 : 6}
+		other = copier(test_dict)
+		other['c']
+		assert len(other.__dict__) <= 2 and set(other.__dict__) == {'b', 'c'}
+	other = copy.copy(test_dict)
+	other['c']
+	assert set(other.__dict__) == {'b', 'c'}
+	assert test.a == {1 : 2, 2 : 4} and set(test_dict.__dict__) == {'a', 'b'}
+
+def test_init_attr_names_load_fast_variants(monkeypatch):
+	from types import SimpleNamespace
+	from dunderdecorators import slots
+
+	class Test(object):
+
+		def __init__(
+				self,
+				other: Any,
+		) -> None:
+			pass
+
+	instructions = [
+		SimpleNamespace(opname=opname, argval=argval)
+		for opname, argval in (
+			('LOAD_FAST_BORROW_LOAD_FAST_BORROW', ('other', 'self')),
+			('STORE_ATTR', 'a'),
+			('LOAD_FAST_BORROW_LOAD_FAST_BORROW', ('self', 'other')),
+			('STORE_ATTR', 'b'),
+			('LOAD_FAST_BORROW', 'self'),
+			('STORE_ATTR', 'c'),
+			('LOAD_FAST_BORROW', 'other'),
+			('STORE_ATTR', 'd'),
+		)
+	]
+	monkeypatch.setattr(
+		slots.dis, 'get_instructions', lambda code: iter(instructions)
+	)
+	assert slots.init_attr_names(Test) == ['a', 'c']
+
 
 
 